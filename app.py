@@ -66,7 +66,7 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(__file__), 'uploads')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['ALLOWED_EXTENSIONS'] = {'xlsx', 'xls', 'csv', 'txt', 'pdf'}
+app.config['ALLOWED_EXTENSIONS'] = frozenset({'xlsx', 'xls', 'csv', 'txt', 'pdf'})
 
 # Configure server-side session storage (avoids cookie size limits)
 app.config['SESSION_TYPE'] = 'filesystem'
@@ -112,8 +112,8 @@ def get_session_id():
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in app.config['ALLOWED_EXTENSIONS']
 
 # Authentication routes
 @app.route('/login')
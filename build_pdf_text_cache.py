@@ -0,0 +1,28 @@
+"""
+Pre-extract the text of every PDF in sample_files/ into sidecar files
+
+The parsers read <dir>/.text/<name>.json instead of the PDF when PDF_TEXT_SIDECARS is set
+(the root conftest sets it for the sample file tests). Re-run after adding or replacing a PDF:
+    python build_pdf_text_cache.py
+"""
+import os
+import json
+from pathlib import Path
+
+from services.file_processor import FileProcessor, _pdf_content_digest, _pdf_text_sidecar_path
+
+SAMPLE_FILES_DIR = Path(__file__).resolve().parent / 'sample_files'
+
+# Always extract from the PDF itself, never from an older sidecar
+os.environ.pop('PDF_TEXT_SIDECARS', None)
+
+for pdf_path in sorted(SAMPLE_FILES_DIR.rglob('*.pdf')):
+    text = FileProcessor._read_pdf_text(str(pdf_path))
+    sidecar_path = Path(_pdf_text_sidecar_path(str(pdf_path)))
+    sidecar_path.parent.mkdir(exist_ok=True)
+    with open(sidecar_path, 'w', encoding='utf-8') as f:
+        json.dump({'source_size': pdf_path.stat().st_size, 'source_blake2b': _pdf_content_digest(str(pdf_path)),
+                   'text': text}, f, ensure_ascii=False)
+    print(f"{pdf_path.relative_to(SAMPLE_FILES_DIR)}: {len(text):,} characters")
+
+print("\nDone.")
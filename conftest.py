@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the root-level parser scripts (test_*.py next to app.py)
+
+The scripts run against the files in sample_files/ and print what the parsers extracted.
+Run them with output shown, optionally in parallel (pytest-xdist):
+    pytest -s test_republic.py
+    pytest -s -n auto test_column_detection.py test_parser.py test_river_oaks.py
+"""
+import os
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+SAMPLE_FILES_DIR = PROJECT_ROOT / 'sample_files'
+
+# Parser settings for the sample file runs only, applied while the processor fixture is in use
+# (an existing value in the environment wins):
+# - keep the parsed cash forecast sheets between runs so repeat runs skip the Excel read
+# - read the statement PDFs' pre-extracted text (build_pdf_text_cache.py) instead of re-extracting it
+SAMPLE_RUN_ENV = {
+    'EXCEL_SHEET_CACHE_DIR': str(PROJECT_ROOT / '.cache'),
+    'PDF_TEXT_SIDECARS': '1',
+}
+
+
+@pytest.fixture(scope='session')
+def processor():
+    """One FileProcessor for the whole run, so the OpenAI client and parsers are built once"""
+    from dotenv import load_dotenv
+    from services.file_processor import FileProcessor
+
+    load_dotenv()
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in SAMPLE_RUN_ENV.items():
+            if name not in os.environ:
+                mp.setenv(name, value)
+        yield FileProcessor(openai_api_key=os.getenv('OPENAI_API_KEY', 'dummy'))
+
+
+@pytest.fixture
+def openai_processor(processor):
+    """The shared FileProcessor, for scripts that need a real OpenAI API key"""
+    if not os.getenv('OPENAI_API_KEY'):
+        pytest.skip('OPENAI_API_KEY not found in environment')
+    return processor
+
+
+@pytest.fixture
+def sample_file():
+    """Resolve a path under sample_files/, skipping the test when the file is not present"""
+    def resolve(*parts):
+        path = SAMPLE_FILES_DIR.joinpath(*parts)
+        if not path.is_file():
+            pytest.skip(f"Sample file not found: {path.relative_to(PROJECT_ROOT)}")
+        return str(path)
+    return resolve
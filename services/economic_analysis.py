@@ -5,6 +5,7 @@ Integrates IPEDS for official historical enrollment baseline (2018-2022)
 Combines official government data with real-time web search for comprehensive analysis
 """
 import os
+import hashlib
 from openai import OpenAI
 from datetime import datetime
 import json
@@ -14,6 +15,111 @@ from services.bls_client import BLSClient
 
 logger = logging.getLogger(__name__)
 
+# Section rules for format_analysis_for_report
+_REPORT_RULE = '=' * 120
+_REPORT_SUBRULE = '-' * 120
+
+# Fixed prompt text goes first so repeated analyses share a cacheable prefix;
+# the property facts are appended at the end of each request
+_ANALYST_INSTRUCTIONS = """You are an expert real estate financial analyst specializing in student housing markets. 
+
+Your expertise includes:
+- University enrollment trends and projections
+- Local labor markets and employment conditions
+- Student housing supply/demand dynamics
+- Economic factors affecting student housing cash flows
+
+Data Sources:
+1. IPEDS data (when provided): Official historical enrollment baseline - cite these exact figures
+2. Web search: Use to find current 2025-2026 enrollment, employment rates, economic conditions, and market data
+3. Always cite specific sources and dates for statistics you present
+
+Deliverable: Provide data-driven, specific insights with concrete numbers and actionable recommendations for cash flow forecasting."""
+
+_ANALYSIS_REQUEST = """You are a real estate financial analyst specializing in student housing properties. 
+Analyze the student housing property described under Property Information at the end of this request and provide a comprehensive economic and market context assessment.
+
+IMPORTANT ENROLLMENT DATA INSTRUCTIONS:
+1. The enrollment data below is from the official U.S. Department of Education IPEDS database (historical data 2018-2022)
+2. Use these EXACT IPEDS figures when discussing historical enrollment trends
+3. ADDITIONALLY: Search the web for the university's CURRENT enrollment for the 2025-2026 academic year
+4. Present both: historical IPEDS baseline + current web-sourced enrollment estimate
+5. Clearly distinguish between official historical data and current estimates
+
+Please provide a structured analysis covering:
+
+1. UNIVERSITY ENROLLMENT TRENDS
+   - Historical: Use the IPEDS data provided below for 2018-2022 enrollment baseline
+   - Current: Search for and report current 2025-2026 enrollment (cite web sources)
+   - Compare historical trend vs. current enrollment
+   - Enrollment projections for next academic year
+   - Any notable enrollment initiatives or challenges
+
+2. ACADEMIC CALENDAR & SEASONAL FACTORS
+   - Current point in academic year (fall/spring/summer)
+   - Key lease-up periods for student housing
+   - Expected occupancy patterns for next 3-6 months
+   - Summer occupancy considerations
+
+3. LOCAL EMPLOYMENT & ECONOMIC CONDITIONS
+   CRITICAL: If official BLS unemployment data is provided below, USE THOSE EXACT FIGURES.
+   Otherwise, search the web for CURRENT economic data for the property's city:
+   
+   A. Employment Metrics (search for latest 2025-2026 data):
+      - Current unemployment rate for the property's city metro area (USE BLS DATA IF PROVIDED BELOW)
+      - Job growth trends (year-over-year change)
+      - Labor force participation rate
+      - Major employers in the property's city (top 5-10)
+      - Industries driving local economy
+      
+   B. Student Employment Market:
+      - On-campus employment opportunities at the university
+      - Part-time job availability for students
+      - Average student wages in the property's city
+      - Co-op/internship programs and placement rates
+      - Gig economy presence (food delivery, rideshare, etc.)
+      
+   C. Economic Outlook:
+      - GDP growth or economic expansion indicators for the property's city region
+      - Recent major business openings/closings
+      - Infrastructure projects or development plans
+      - Cost of living trends (rent, groceries, utilities)
+      - Housing affordability index for the property's city
+      
+   D. Risk Factors:
+      - Economic headwinds or challenges facing the property's city
+      - Industry layoffs or contractions
+      - Population migration trends (growing/declining)
+
+4. STUDENT HOUSING MARKET
+   - Supply/demand dynamics in the property's city
+   - New student housing construction or competition
+   - Average rental rates and trends
+   - Market occupancy rates
+
+5. SHORT-TERM OUTLOOK (Next 6 Months)
+   - Expected cash flow patterns based on academic calendar
+   - Risk factors to monitor
+   - Opportunities for the property
+   - Market position assessment
+
+6. CASH FORECASTING IMPLICATIONS
+   - How seasonal factors should impact cash flow projections
+   - Reliability of budget assumptions given market conditions
+   - Recommended adjustments or considerations for forecasting
+
+IMPORTANT INSTRUCTIONS:
+- Use web search to find CURRENT data (2025-2026) for enrollment, employment, and economic conditions
+- Cite specific data sources and dates when presenting statistics
+- For enrollment: Present both official IPEDS historical baseline AND current web-sourced estimates
+- For employment/economy: Focus on most recent available data (prioritize 2025-2026, accept 2024 data if newer not available)
+- Be specific with numbers (unemployment rates, enrollment figures, job growth percentages)
+- Focus on actionable insights for cash flow forecasting and decision-making
+- Format your response as a structured analysis with clear sections and bullet points"""
+
+# Routes requests sharing the fixed prefix to the same prompt cache; changes whenever the fixed text does
+_PROMPT_CACHE_KEY = 'economic-analysis-' + hashlib.blake2b((_ANALYST_INSTRUCTIONS + _ANALYSIS_REQUEST).encode(), digest_size=8).hexdigest()
+
 
 class EconomicAnalyzer:
     def __init__(self, api_key=None, model=None):
@@ -89,8 +195,7 @@ class EconomicAnalyzer:
         else:
             logger.info("BLS client not enabled - unemployment data from web search only")
         
-        prompt = f"""You are a real estate financial analyst specializing in student housing properties. 
-Analyze the following student housing property and provide a comprehensive economic and market context assessment.
+        prompt = f"""{_ANALYSIS_REQUEST}
 
 Property Information:
 - Property Name: {property_name}
@@ -100,105 +205,15 @@ Property Information:
 - Today's Date: {self.current_date}
 
 {enrollment_context}
-{unemployment_context}
-
-IMPORTANT ENROLLMENT DATA INSTRUCTIONS:
-1. The enrollment data above is from the official U.S. Department of Education IPEDS database (historical data 2018-2022)
-2. Use these EXACT IPEDS figures when discussing historical enrollment trends
-3. ADDITIONALLY: Search the web for CURRENT {university} enrollment for 2025-2026 academic year
-4. Present both: historical IPEDS baseline + current web-sourced enrollment estimate
-5. Clearly distinguish between official historical data and current estimates
-
-Please provide a structured analysis covering:
-
-1. UNIVERSITY ENROLLMENT TRENDS
-   - Historical: Use the IPEDS data provided above for 2018-2022 enrollment baseline
-   - Current: Search for and report current 2025-2026 enrollment (cite web sources)
-   - Compare historical trend vs. current enrollment
-   - Enrollment projections for next academic year
-   - Any notable enrollment initiatives or challenges
-
-2. ACADEMIC CALENDAR & SEASONAL FACTORS
-   - Current point in academic year (fall/spring/summer)
-   - Key lease-up periods for student housing
-   - Expected occupancy patterns for next 3-6 months
-   - Summer occupancy considerations
-
-3. LOCAL EMPLOYMENT & ECONOMIC CONDITIONS
-   CRITICAL: If official BLS unemployment data is provided above, USE THOSE EXACT FIGURES.
-   Otherwise, search the web for CURRENT {city}, {state} economic data:
-   
-   A. Employment Metrics (search for latest 2025-2026 data):
-      - Current unemployment rate for {city} metro area (USE BLS DATA IF PROVIDED ABOVE)
-      - Job growth trends (year-over-year change)
-      - Labor force participation rate
-      - Major employers in {city} (top 5-10)
-      - Industries driving local economy
-      
-   B. Student Employment Market:
-      - On-campus employment opportunities at {university}
-      - Part-time job availability for students
-      - Average student wages in {city}
-      - Co-op/internship programs and placement rates
-      - Gig economy presence (food delivery, rideshare, etc.)
-      
-   C. Economic Outlook:
-      - GDP growth or economic expansion indicators for {city} region
-      - Recent major business openings/closings
-      - Infrastructure projects or development plans
-      - Cost of living trends (rent, groceries, utilities)
-      - Housing affordability index for {city}
-      
-   D. Risk Factors:
-      - Economic headwinds or challenges facing {city}
-      - Industry layoffs or contractions
-      - Population migration trends (growing/declining)
-
-4. STUDENT HOUSING MARKET
-   - Supply/demand dynamics in {city}
-   - New student housing construction or competition
-   - Average rental rates and trends
-   - Market occupancy rates
-
-5. SHORT-TERM OUTLOOK (Next 6 Months)
-   - Expected cash flow patterns based on academic calendar
-   - Risk factors to monitor
-   - Opportunities for the property
-   - Market position assessment
-
-6. CASH FORECASTING IMPLICATIONS
-   - How seasonal factors should impact cash flow projections
-   - Reliability of budget assumptions given market conditions
-   - Recommended adjustments or considerations for forecasting
-
-IMPORTANT INSTRUCTIONS:
-- Use web search to find CURRENT data (2025-2026) for enrollment, employment, and economic conditions
-- Cite specific data sources and dates when presenting statistics
-- For enrollment: Present both official IPEDS historical baseline AND current web-sourced estimates
-- For employment/economy: Focus on most recent available data (prioritize 2025-2026, accept 2024 data if newer not available)
-- Be specific with numbers (unemployment rates, enrollment figures, job growth percentages)
-- Focus on actionable insights for cash flow forecasting and decision-making
-- Format your response as a structured analysis with clear sections and bullet points"""
+{unemployment_context}"""
 
         try:
             # Use Responses API with web search to get current enrollment and economic data
             response = self.client.responses.create(
                 model=self.model,
-                instructions="""You are an expert real estate financial analyst specializing in student housing markets. 
-
-Your expertise includes:
-- University enrollment trends and projections
-- Local labor markets and employment conditions
-- Student housing supply/demand dynamics
-- Economic factors affecting student housing cash flows
-
-Data Sources:
-1. IPEDS data (when provided): Official historical enrollment baseline - cite these exact figures
-2. Web search: Use to find current 2025-2026 enrollment, employment rates, economic conditions, and market data
-3. Always cite specific sources and dates for statistics you present
-
-Deliverable: Provide data-driven, specific insights with concrete numbers and actionable recommendations for cash flow forecasting.""",
+                instructions=_ANALYST_INSTRUCTIONS,
                 input=prompt,
+                prompt_cache_key=_PROMPT_CACHE_KEY,
                 tools=[{"type": "web_search"}],
                 temperature=0.7,
                 max_output_tokens=2500
@@ -380,9 +395,9 @@ def format_analysis_for_report(analysis_result):
         return f"⚠️  Economic Analysis Failed: {analysis_result.get('error', 'Unknown error')}"
     
     report = f"""
-{'='*120}
+{_REPORT_RULE}
 ECONOMIC & GEOGRAPHIC CONTEXT ANALYSIS
-{'='*120}
+{_REPORT_RULE}
 
 Property: {analysis_result['property_name']}
 University: {analysis_result['university']}
@@ -390,13 +405,13 @@ Location: {analysis_result['location']}
 Analysis Date: {analysis_result['analysis_date']}
 Current Period: {analysis_result['current_month']}
 
-{'-'*120}
+{_REPORT_SUBRULE}
 
 {analysis_result['analysis']}
 
-{'-'*120}
+{_REPORT_SUBRULE}
 Analysis generated using {analysis_result['tokens_used']} tokens
-{'='*120}
+{_REPORT_RULE}
 """
     return report
 
@@ -7,33 +7,143 @@ Integrates with Economic Analysis and Recommendation Engine
 import pandas as pd
 import PyPDF2
 import re
+import copy
+import functools
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 import logging
 import os
 
-from services.economic_analysis import EconomicAnalyzer
 from services.recommendation_engine import RecommendationEngine
 
 logger = logging.getLogger(__name__)
 
+# Income statement reporting period, e.g. "Dec 2025 YTD ( Jan 2025 - Dec 2025 )"
+_YTD_PERIOD_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\s+YTD\s*\(\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*\)', re.IGNORECASE)
+# "Sep 2025" or "December 2025" near the start of a line
+_SIMPLE_MONTH_RE = re.compile(r'^.{0,200}?(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})', re.IGNORECASE | re.MULTILINE)
+# "Month Year" or "Month-YY" in a statement filename
+_FILENAME_MONTH_RE = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)[_\s-]+(\d{2,4})', re.IGNORECASE)
+# Cash forecast filenames: "### PropertyName Cash Forecast - MM.YYYY", or at least "###" and "MM.YYYY"
+_CASH_FORECAST_FILENAME_RE = re.compile(r'(\d+)\s+(.+?)\s+Cash\s+Forecast\s+-\s+(\d{2})\.(\d{4})', re.IGNORECASE)
+_ENTITY_NUMBER_RE = re.compile(r'^(\d+)')
+_FILENAME_PERIOD_RE = re.compile(r'(\d{2})\.(\d{4})')
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Balance sheet line items: label followed by current and prior month amounts
+_BALANCE_SHEET_PATTERNS = {
+    label: re.compile(rf'{label}\s+([\d,.-]+)\s+([\d,.-]+)')
+    for label in ('Total Cash and Cash Equivalents', 'Total Accounts Receivable', 'Prepaid Expenses',
+                  'Other Current Assets', 'Total Current Liabilities', 'Total Notes Payable', 'Accrued Interest')
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _financial_line_re(label: str) -> 're.Pattern':
+    """Income statement line: label, then month actual/budget/variance $/% and the same for YTD"""
+    return re.compile(rf'{re.escape(label)}\s+([\d,.-]+(?:\(\))?)\s+([\d,.-]+(?:\(\))?)\s+\(?([\d,.-]+)\)?\s+([-\d.]+%)\s+([\d,.-]+(?:\(\))?)\s+([\d,.-]+(?:\(\))?)\s+\(?([\d,.-]+)\)?\s+([-\d.]+%)', re.IGNORECASE)
+
+
+# Parsed file results shared by all processors, keyed by (parser, absolute path, mtime, size)
+# so an edited or replaced file is parsed again. Only successful parses are kept.
+_PARSE_CACHE_MAXSIZE = 64
+_parse_cache: Dict[tuple, Dict[str, Any]] = {}
+_parse_cache_lock = threading.Lock()
+
+
+def _file_signature(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """(absolute path, mtime_ns, size) from a single stat call, or None if the file can't be stat'ed"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+
+def _cached_by_file(parse_method):
+    """Memoize a parse_* method on the file's path, mtime and size; callers get a copy"""
+    @functools.wraps(parse_method)
+    def wrapper(self, file_path: str) -> Dict[str, Any]:
+        signature = _file_signature(file_path)
+        if signature is None:
+            return parse_method(self, file_path)
+        key = (parse_method.__name__, *signature)
+        
+        with _parse_cache_lock:
+            cached = _parse_cache.get(key)
+        if cached is not None:
+            logger.debug("Using cached %s result for %s", parse_method.__name__, file_path)
+            result = copy.deepcopy(cached)
+            result['file_path'] = file_path
+            return result
+        
+        result = parse_method(self, file_path)
+        if result.get('status') == 'success':
+            with _parse_cache_lock:
+                if key not in _parse_cache and len(_parse_cache) >= _PARSE_CACHE_MAXSIZE:
+                    del _parse_cache[next(iter(_parse_cache))]
+                _parse_cache[key] = copy.deepcopy(result)
+        return result
+    return wrapper
+
+
+def _pdf_text_sidecar_path(file_path: str) -> str:
+    """Pre-extracted text for a PDF lives in a .text folder beside it: <dir>/.text/<name>.json"""
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, '.text', f"{name}.json")
+
+
+def _pdf_content_digest(file_path: str) -> str:
+    """blake2b of the file contents, identifying the PDF a sidecar was built from"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_pdf_text_sidecar(file_path: str) -> Optional[str]:
+    """Text from the PDF's sidecar, or None when there is none or it was built from a different file"""
+    try:
+        with open(_pdf_text_sidecar_path(file_path), encoding='utf-8') as f:
+            sidecar = json.load(f)
+        # Size first (no read needed), then the content digest
+        if (sidecar['source_size'] != os.path.getsize(file_path)
+                or sidecar['source_blake2b'] != _pdf_content_digest(file_path)):
+            return None
+    except (OSError, ValueError, KeyError):
+        return None
+    logger.debug("Using pre-extracted text for %s", file_path)
+    return sidecar['text']
+
 
 class FileProcessor:
     """Processes uploaded files and generates cash forecast recommendations"""
     
     def __init__(self, openai_api_key: str):
         """Initialize with OpenAI API key for economic analysis"""
-        self.economic_analyzer = EconomicAnalyzer(api_key=openai_api_key)
+        self.openai_api_key = openai_api_key
         self.recommendation_engine = RecommendationEngine()
     
-    def _validate_extracted_data(self, cash_data: Dict[str, Any], income_data: Dict[str, Any], balance_data: Dict[str, Any]) -> Tuple[bool, list]:
+    @functools.cached_property
+    def economic_analyzer(self):
         """
-        Validate that extracted data contains legitimate values
-        Returns: (is_valid, list_of_issues)
+        EconomicAnalyzer built on first use, so parsing alone never imports the
+        OpenAI SDK or sets up the IPEDS/BLS clients
+        """
+        from services.economic_analysis import EconomicAnalyzer
+        return EconomicAnalyzer(api_key=self.openai_api_key)
+    
+    def _validate_cash_forecast(self, cash_data: Dict[str, Any]) -> list:
+        """
+        Validate the cash forecast on its own (cheap, needs no PDF parsing)
+        Returns: list_of_issues
         """
         issues = []
-        
-        # Check cash forecast data
         if cash_data.get('status') == 'error':
             issues.append(f"Cash Forecast: {cash_data.get('error', 'Unknown error')}")
         else:
@@ -41,6 +151,30 @@ class FileProcessor:
                 issues.append("Cash Forecast: All FCF values are $0.00 - likely parsing failure")
             if cash_data.get('current_occupancy') == 0 and cash_data.get('projected_occupancy') == 0:
                 issues.append("Cash Forecast: All occupancy values are 0% - likely parsing failure")
+        return issues
+    
+    def _validation_failure(self, validation_issues: list, property_info: Dict[str, Any], raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Log and build the result returned when extracted data fails validation"""
+        error_msg = "Failed to extract valid data from input files:\n" + "\n".join(f"  • {issue}" for issue in validation_issues)
+        logger.error(f"Data validation failed:\n{error_msg}")
+        logger.error("❌ ABORTING - Will NOT call OpenAI API with invalid data")
+        logger.error("❌ NO API COSTS INCURRED")
+        return {
+            'success': False,
+            'error': error_msg,
+            'validation_issues': validation_issues,
+            'property_info': property_info,
+            'raw_data': raw_data,
+            'processed_at': datetime.now().isoformat()
+        }
+    
+    def _validate_extracted_data(self, cash_data: Dict[str, Any], income_data: Dict[str, Any], balance_data: Dict[str, Any]) -> Tuple[bool, list]:
+        """
+        Validate that extracted data contains legitimate values
+        Returns: (is_valid, list_of_issues)
+        """
+        # Check cash forecast data
+        issues = self._validate_cash_forecast(cash_data)
         
         # Check income statement data
         if income_data.get('status') == 'error':
@@ -97,18 +231,22 @@ class FileProcessor:
         logger.info("⏱️  Starting file parsing (no API calls yet)...")
         
         try:
-            # Step 1: Parse cash forecast
+            # Step 1: Parse the cash forecast and check it before touching the PDFs
             cash_data = self.parse_cash_forecast(cash_forecast_path)
+            cash_issues = self._validate_cash_forecast(cash_data)
+            if cash_issues:
+                return self._validation_failure(cash_issues, property_info, {'cash_forecast': cash_data})
+            
+            # Steps 2-3: Parse income statement and balance sheet (independent files, parsed concurrently)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                income_future = executor.submit(self.parse_income_statement, income_statement_path)
+                balance_future = executor.submit(self.parse_balance_sheet, balance_sheet_path)
+                income_data = income_future.result()
+                balance_data = balance_future.result()
             
             # Override property_name with database value (more reliable than filename parsing)
             cash_data['property_name'] = property_info.get('name', cash_data.get('property_name', 'Unknown'))
             
-            # Step 2: Parse income statement
-            income_data = self.parse_income_statement(income_statement_path)
-            
-            # Step 3: Parse balance sheet
-            balance_data = self.parse_balance_sheet(balance_sheet_path)
-            
             # Pass reporting month from income statement to balance sheet for consistent labeling
             balance_data['reporting_month'] = income_data.get('reporting_month', 'Unknown')
             
@@ -116,22 +254,11 @@ class FileProcessor:
             is_valid, validation_issues = self._validate_extracted_data(cash_data, income_data, balance_data)
             
             if not is_valid:
-                error_msg = "Failed to extract valid data from input files:\n" + "\n".join(f"  • {issue}" for issue in validation_issues)
-                logger.error(f"Data validation failed:\n{error_msg}")
-                logger.error("❌ ABORTING - Will NOT call OpenAI API with invalid data")
-                logger.error("❌ NO API COSTS INCURRED")
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'validation_issues': validation_issues,
-                    'property_info': property_info,
-                    'raw_data': {
-                        'cash_forecast': cash_data,
-                        'income_statement': income_data,
-                        'balance_sheet': balance_data
-                    },
-                    'processed_at': datetime.now().isoformat()
-                }
+                return self._validation_failure(validation_issues, property_info, {
+                    'cash_forecast': cash_data,
+                    'income_statement': income_data,
+                    'balance_sheet': balance_data
+                })
             
             logger.info("✓ Data validation passed - all files parsed successfully")
             
@@ -180,24 +307,28 @@ class FileProcessor:
                 'property_info': property_info
             }
     
-    def parse_cash_forecast(self, file_path: str) -> Dict[str, Any]:
+    def _load_cash_forecast_sheet(self, file_path: str) -> pd.DataFrame:
         """
-        Parse Excel cash forecast file
-        Extracts: Free Cash Flow, Distributions/Contributions, Occupancy data, Month info
-        Supports multiple formats by auto-detecting structure
+        Read the cash forecast sheet of an Excel workbook (header=None)
+        
+        When EXCEL_SHEET_CACHE_DIR is set, the sheet is also pickled there, keyed on the
+        file's path, mtime and size, and later loads of the same file read the pickle instead.
         """
-        logger.info(f"Parsing cash forecast: {file_path}")
+        cache_path = None
+        cache_dir = os.getenv('EXCEL_SHEET_CACHE_DIR')
+        signature = _file_signature(file_path) if cache_dir else None
+        if signature:
+            key = hashlib.blake2b('|'.join(map(str, signature)).encode(), digest_size=16).hexdigest()
+            cache_path = os.path.join(cache_dir, f"{key}.pkl")
+            if os.path.exists(cache_path):
+                logger.debug("Loading cached cash forecast sheet from %s", cache_path)
+                return pd.read_pickle(cache_path)
         
-        try:
-            # Parse filename for property info
-            filename = os.path.basename(file_path)
-            entity_number, property_name, current_month = self._parse_cash_forecast_filename(filename)
-            logger.debug(f"Parsed filename - Entity: {entity_number}, Property: {property_name}, Month: {current_month}")
-            
-            # Find the correct sheet - look for "Cash Forecast" tab by name
-            excel_file = pd.ExcelFile(file_path)
+        # Find the correct sheet - look for "Cash Forecast" tab by name
+        # (the workbook is loaded once and the detected sheet is parsed from it)
+        with pd.ExcelFile(file_path) as excel_file:
             sheet_names = excel_file.sheet_names
-            logger.debug(f"Available sheets: {sheet_names}")
+            logger.debug("Available sheets: %s", sheet_names)
             
             target_sheet = None
             # Search for sheet containing "Cash Forecast" or "CF" (case-insensitive)
@@ -214,8 +345,33 @@ class FileProcessor:
                 logger.info(f"No 'Cash Forecast' sheet found, using first sheet: '{target_sheet}'")
             
             # Read Excel file from the detected sheet
-            df = pd.read_excel(file_path, sheet_name=target_sheet, header=None)
-            logger.debug(f"Excel file loaded - Shape: {df.shape}")
+            df = excel_file.parse(target_sheet, header=None)
+        
+        if cache_path:
+            # Write to a temporary name first so parallel runs never read a partial file
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        return df
+    
+    @_cached_by_file
+    def parse_cash_forecast(self, file_path: str) -> Dict[str, Any]:
+        """
+        Parse Excel cash forecast file
+        Extracts: Free Cash Flow, Distributions/Contributions, Occupancy data, Month info
+        Supports multiple formats by auto-detecting structure
+        """
+        logger.info(f"Parsing cash forecast: {file_path}")
+        
+        try:
+            # Parse filename for property info
+            filename = os.path.basename(file_path)
+            entity_number, property_name, current_month = self._parse_cash_forecast_filename(filename)
+            logger.debug("Parsed filename - Entity: %s, Property: %s, Month: %s", entity_number, property_name, current_month)
+            
+            df = self._load_cash_forecast_sheet(file_path)
+            logger.debug("Excel file loaded - Shape: %s", df.shape)
             
             # Step 1: Auto-detect which column contains the row labels
             label_col = self._detect_label_column(df)
@@ -223,7 +379,7 @@ class FileProcessor:
             
             # Step 2: Auto-detect format by looking for month data (search starts after label column)
             year_2025_cols = self._find_2025_columns(df, start_col=label_col + 1)
-            logger.debug(f"Using columns {year_2025_cols[0]} to {year_2025_cols[-1]} for month data ({len(year_2025_cols)} columns)")
+            logger.debug("Using columns %s to %s for month data (%s columns)", year_2025_cols[0], year_2025_cols[-1], len(year_2025_cols))
             
             # Find key rows dynamically by searching for labels in the detected label column
             status_row_idx = self._find_row_by_label(df, ['Actual', 'Budget'], column=year_2025_cols[0])
@@ -266,7 +422,7 @@ class FileProcessor:
                         if pd.notna(label) and str(label).strip():
                             logger.warning(f"  Row {idx}: '{label}'")
             
-            logger.debug(f"Row indices - Status:{status_row_idx}, Month:{month_row_idx}, BudgetedOcc:{budgeted_occ_idx}, ActualOcc:{actual_occ_idx}, FCF:{fcf_row_idx}, ActualDist:{actual_dist_row_idx}, EndingCash:{ending_cash_balance_row_idx}, ForecastedDist:{forecasted_dist_row_idx}")
+            logger.debug("Row indices - Status:%s, Month:%s, BudgetedOcc:%s, ActualOcc:%s, FCF:%s, ActualDist:%s, EndingCash:%s, ForecastedDist:%s", status_row_idx, month_row_idx, budgeted_occ_idx, actual_occ_idx, fcf_row_idx, actual_dist_row_idx, ending_cash_balance_row_idx, forecasted_dist_row_idx)
             
             # Extract rows
             status_row = df.iloc[status_row_idx, year_2025_cols].tolist() if status_row_idx is not None else []
@@ -277,12 +433,11 @@ class FileProcessor:
             forecasted_distributions_row = df.iloc[forecasted_dist_row_idx, year_2025_cols].tolist() if forecasted_dist_row_idx is not None else []
             fcf_row = df.iloc[fcf_row_idx, year_2025_cols].tolist() if fcf_row_idx is not None else []
             
-            logger.debug(f"Status row: {status_row}")
-            logger.debug(f"Month row: {month_row}")
-            logger.debug(f"FCF row: {fcf_row}")
-            logger.debug(f"Actual Distributions row: {actual_distributions_row}")
-            logger.debug(f"Forecasted Distributions row: {forecasted_distributions_row}")
-            print(f"DEBUG: Forecasted Distributions row: {forecasted_distributions_row}")
+            logger.debug("Status row: %s", status_row)
+            logger.debug("Month row: %s", month_row)
+            logger.debug("FCF row: %s", fcf_row)
+            logger.debug("Actual Distributions row: %s", actual_distributions_row)
+            logger.debug("Forecasted Distributions row: %s", forecasted_distributions_row)
             
             # Find current month (most recent "Actual" = LAST actual column) and next 6 months (Budget months)
             current_month_idx = None
@@ -298,9 +453,9 @@ class FileProcessor:
                             break
             
             next_month_idx = budget_month_indices[0] if budget_month_indices else None
-            logger.debug(f"Current month index: {current_month_idx}, Next month index: {next_month_idx}")
-            logger.debug(f"Budget month indices (next 7 months): {budget_month_indices}")
-            print(f"DEBUG: Found {len(budget_month_indices)} budget month columns")
+            logger.debug("Current month index: %s, Next month index: %s", current_month_idx, next_month_idx)
+            logger.debug("Budget month indices (next 7 months): %s", budget_month_indices)
+            logger.debug("Found %s budget month columns", len(budget_month_indices))
             
             # Extract data for current and projected months
             # Convert datetime objects to strings in "Month YYYY" format
@@ -357,17 +512,13 @@ class FileProcessor:
                 reserves_end_row = forecasted_dist_row_idx
                 
                 # Sum all reserve allocations in projected month column
-                for row_idx in range(reserves_start_row, reserves_end_row):
-                    reserve_value = df.iloc[row_idx, year_2025_cols[projected_month_col_idx]] if row_idx < len(df) else None
-                    if pd.notna(reserve_value) and isinstance(reserve_value, (int, float)):
-                        # Negative values are reserve allocations (cash OUT)
-                        if reserve_value < 0:
-                            projected_month_reserves += abs(reserve_value)
+                projected_month_reserves = self._sum_reserve_allocations(
+                    df, reserves_start_row, reserves_end_row, year_2025_cols[projected_month_col_idx])
                 
                 if projected_month_reserves > 0:
                     logger.info(f"Detected ${projected_month_reserves:,.2f} in voluntary reserve allocations for projected month")
             
-            logger.debug(f"Raw values - FCF: {current_fcf}/{projected_fcf}, Occ: {current_occupancy}/{projected_occupancy}, Dist: {current_distributions}/{projected_distributions}")
+            logger.debug("Raw values - FCF: %s/%s, Occ: %s/%s, Dist: %s/%s", current_fcf, projected_fcf, current_occupancy, projected_occupancy, current_distributions, projected_distributions)
             
             # Convert to float, handle potential non-numeric values
             current_fcf = float(current_fcf) if pd.notna(current_fcf) else 0.0
@@ -407,7 +558,7 @@ class FileProcessor:
                 
                 # Skip this month if data is missing (NaN) or clearly invalid
                 if pd.isna(fcf_val) or pd.isna(occ_val):
-                    logger.debug(f"Skipping {month_name} - missing data (FCF: {fcf_val}, Occ: {occ_val})")
+                    logger.debug("Skipping %s - missing data (FCF: %s, Occ: %s)", month_name, fcf_val, occ_val)
                     continue
                 
                 month_fcf = float(fcf_val)
@@ -416,7 +567,7 @@ class FileProcessor:
                 
                 # Additional validation: if occupancy is exactly 0, likely no data
                 if month_occupancy == 0 and month_fcf == 0:
-                    logger.debug(f"Skipping {month_name} - zero values suggest no budget data")
+                    logger.debug("Skipping %s - zero values suggest no budget data", month_name)
                     continue
                 
                 # Accumulate the forecasted distribution for this month
@@ -432,15 +583,12 @@ class FileProcessor:
                     reserves_start_row = ending_cash_balance_row_idx + 1
                     reserves_end_row = forecasted_dist_row_idx
                     
-                    for row_idx in range(reserves_start_row, reserves_end_row):
-                        reserve_value = df.iloc[row_idx, year_2025_cols[idx]] if row_idx < len(df) else None
-                        if pd.notna(reserve_value) and isinstance(reserve_value, (int, float)):
-                            if reserve_value < 0:
-                                month_reserves += abs(reserve_value)
+                    month_reserves = self._sum_reserve_allocations(
+                        df, reserves_start_row, reserves_end_row, year_2025_cols[idx])
                     
                     total_reserves_across_months += month_reserves
                 
-                print(f"DEBUG:   {month_name}: FCF={month_fcf:,.2f}, This Month Dist={month_forecasted_dist:,.2f}, Cumulative Dist={cumulative_forecasted_dist:,.2f}, Reserves={month_reserves:,.2f}, Operational FCF={month_operational_fcf:,.2f}")
+                logger.debug("  %s: FCF=%.2f, This Month Dist=%.2f, Cumulative Dist=%.2f, Reserves=%.2f, Operational FCF=%.2f", month_name, month_fcf, month_forecasted_dist, cumulative_forecasted_dist, month_reserves, month_operational_fcf)
                 
                 projected_months.append({
                     'month': month_name,
@@ -453,7 +601,7 @@ class FileProcessor:
             
             logger.info(f"Extracted {len(projected_months)} valid month(s) of budget projections")
             for i, proj in enumerate(projected_months, 1):  # Log all months
-                logger.debug(f"  Month {i}: {proj['month']} - Operational FCF: ${proj['operational_fcf']:,.2f}, After Dist: ${proj['fcf']:,.2f}, Reserves: ${proj.get('reserve_allocations', 0):,.2f}, Occ: {proj['occupancy']:.1f}%")
+                logger.debug("  Month %s: %s - Operational FCF: $%.2f, After Dist: $%.2f, Reserves: $%.2f, Occ: %.1f%%", i, proj['month'], proj['operational_fcf'], proj['fcf'], proj.get('reserve_allocations', 0), proj['occupancy'])
             
             if total_reserves_across_months > 0:
                 logger.info(f"Total voluntary reserve allocations across all projected months: ${total_reserves_across_months:,.2f}")
@@ -499,7 +647,7 @@ class FileProcessor:
         
         # PRIMARY METHOD: Extract from PDF text content
         # Look for patterns like "Dec 2025 YTD ( Jan 2025 - Dec 2025 )"
-        ytd_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\s+YTD\s*\(\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*\)', pdf_text, re.IGNORECASE)
+        ytd_match = _YTD_PERIOD_RE.search(pdf_text)
         
         if ytd_match:
             month_abbr = ytd_match.group(1).capitalize()
@@ -523,7 +671,7 @@ class FileProcessor:
         
         # SECONDARY METHOD: Look for simple month pattern in PDF
         # Pattern like "Sep 2025" or "December 2025" at the start of document
-        simple_month_match = re.search(r'^.{0,200}?(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})', pdf_text, re.IGNORECASE | re.MULTILINE)
+        simple_month_match = _SIMPLE_MONTH_RE.search(pdf_text)
         
         if simple_month_match:
             month_name = simple_month_match.group(1).capitalize()
@@ -556,7 +704,7 @@ class FileProcessor:
         filename = os.path.basename(file_path)
         
         # Pattern: "Month Year" or "Month-YY"
-        file_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)[_\s-]+(\d{2,4})', filename, re.IGNORECASE)
+        file_match = _FILENAME_MONTH_RE.search(filename)
         if file_match:
             month = file_match.group(1).capitalize()
             year_str = file_match.group(2)
@@ -578,6 +726,7 @@ class FileProcessor:
         logger.error("Could not extract reporting period from PDF or filename")
         return "Unknown", "YTD"
     
+    @_cached_by_file
     def parse_income_statement(self, file_path: str) -> Dict[str, Any]:
         """
         Parse PDF income statement
@@ -587,9 +736,7 @@ class FileProcessor:
         logger.info(f"Parsing income statement: {file_path}")
         
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                all_text = ''.join([page.extract_text() for page in pdf_reader.pages])
+            all_text = self._read_pdf_text(file_path)
             
             # Extract reporting month and YTD period
             reporting_month, ytd_period = self._extract_reporting_period(file_path, all_text)
@@ -651,6 +798,7 @@ class FileProcessor:
                 'file_path': file_path
             }
     
+    @_cached_by_file
     def parse_balance_sheet(self, file_path: str) -> Dict[str, Any]:
         """
         Parse PDF balance sheet
@@ -659,25 +807,13 @@ class FileProcessor:
         logger.info(f"Parsing balance sheet: {file_path}")
         
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                all_text = ''.join([page.extract_text() for page in pdf_reader.pages])
-            
-            # Extract key items using regex
-            patterns = {
-                'Total Cash and Cash Equivalents': r'Total Cash and Cash Equivalents\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Total Accounts Receivable': r'Total Accounts Receivable\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Prepaid Expenses': r'Prepaid Expenses\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Other Current Assets': r'Other Current Assets\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Total Current Liabilities': r'Total Current Liabilities\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Total Notes Payable': r'Total Notes Payable\s+([\d,.-]+)\s+([\d,.-]+)',
-                'Accrued Interest': r'Accrued Interest\s+([\d,.-]+)\s+([\d,.-]+)',
-            }
+            all_text = self._read_pdf_text(file_path)
             
             result = {'status': 'success', 'file_path': file_path}
             
-            for label, pattern in patterns.items():
-                match = re.search(pattern, all_text)
+            # Extract key items using regex
+            for label, pattern in _BALANCE_SHEET_PATTERNS.items():
+                match = pattern.search(all_text)
                 if match:
                     current_val = self._clean_number(match.group(1))
                     prior_val = self._clean_number(match.group(2))
@@ -767,9 +903,9 @@ class FileProcessor:
             else:
                 month_name = projected_month
                 
-            print(f"DEBUG: Extracting month for seasonal factor: '{month_name}' from '{projected_month}'")
+            logger.debug("Extracting month for seasonal factor: '%s' from '%s'", month_name, projected_month)
             seasonal_factor = self.economic_analyzer.get_seasonal_factor(month_name)
-            print(f"DEBUG: Seasonal factor result: {seasonal_factor}")
+            logger.debug("Seasonal factor result: %s", seasonal_factor)
             
             # Determine enrollment trend from analysis text
             enrollment_trend = 'stable'
@@ -827,25 +963,18 @@ class FileProcessor:
             'actual', 'budget', 'forecasted'
         ]
         
-        # Count matches in each of the first 4 columns
+        # Count matches in each of the first 4 columns (first 50 rows), one vectorized pass per keyword
         column_scores = {}
         for col_idx in range(min(4, df.shape[1])):
-            score = 0
-            for row_idx in range(min(50, len(df))):  # Check first 50 rows
-                cell = df.iloc[row_idx, col_idx]
-                if pd.notna(cell):
-                    cell_str = str(cell).lower()
-                    for keyword in keywords:
-                        if keyword in cell_str:
-                            score += 1
-            column_scores[col_idx] = score
+            cells = df.iloc[:50, col_idx].dropna().astype(str).str.lower()
+            column_scores[col_idx] = int(sum(cells.str.contains(keyword, regex=False).sum() for keyword in keywords))
         
         # Find column with highest score
         if column_scores:
             label_col = max(column_scores, key=column_scores.get)
             if column_scores[label_col] > 0:
                 logger.info(f"Detected label column: {label_col} (column {'ABCD'[label_col]}) with {column_scores[label_col]} keyword matches")
-                logger.debug(f"Column scores: {column_scores}")
+                logger.debug("Column scores: %s", column_scores)
                 return label_col
         
         # Default to column 0 if no clear winner
@@ -878,7 +1007,7 @@ class FileProcessor:
                         # Found first date column, now collect ALL date columns from here
                         if first_date_col is None:
                             first_date_col = col_idx
-                            logger.debug(f"Found first date column at {col_idx}, row {row_idx}: {cell}")
+                            logger.debug("Found first date column at %s, row %s: %s", col_idx, row_idx, cell)
                         
                         # Collect ALL columns from first date onwards, skipping non-dates but continuing to look
                         # This handles: [Aug-2025, Sep-2025, ..., Dec-2025, YTD 2025, Budget 2025, blank, Jan-2026, ...]
@@ -903,7 +1032,7 @@ class FileProcessor:
                                 break
                         
                         if month_cols:
-                            logger.debug(f"Collected {len(month_cols)} month columns: {month_cols}")
+                            logger.debug("Collected %s month columns: %s", len(month_cols), month_cols)
                             return month_cols
                     except (AttributeError, TypeError):
                         pass
@@ -911,10 +1040,9 @@ class FileProcessor:
                 # Check if it contains year text (like "Jan-2025", "Jan-2026")
                 if cell and isinstance(cell, str) and any(month in cell for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
                     # Extract year from the cell
-                    import re
-                    year_match = re.search(r'20\d{2}', str(cell))
+                    year_match = _YEAR_RE.search(str(cell))
                     if year_match:
-                        logger.debug(f"Found text format date at column {col_idx}: {cell}")
+                        logger.debug("Found text format date at column %s: %s", col_idx, cell)
                         # Collect consecutive month columns (any year)
                         text_format_cols = []
                         consecutive_non_date = 0
@@ -932,7 +1060,7 @@ class FileProcessor:
                                 break
                         
                         if text_format_cols:
-                            logger.debug(f"Collected {len(text_format_cols)} text format month columns: {text_format_cols}")
+                            logger.debug("Collected %s text format month columns: %s", len(text_format_cols), text_format_cols)
                             return text_format_cols
         
         # Fallback: if we found nothing, assume old format (columns 79-93)
@@ -947,14 +1075,26 @@ class FileProcessor:
         Find a row by searching for keywords in a specific column (default column B = index 1)
         Returns row index or None
         """
-        for row_idx in range(len(df)):
-            cell = df.iloc[row_idx, column]
-            if pd.notna(cell):
-                cell_str = str(cell).lower()
-                if any(term.lower() in cell_str for term in search_terms):
-                    return row_idx
+        cells = df.iloc[:, column]
+        pattern = '|'.join(re.escape(term.lower()) for term in search_terms)
+        matches = (cells.notna() & cells.astype(str).str.lower().str.contains(pattern)).to_numpy()
+        if matches.any():
+            return int(matches.argmax())
         return None
     
+    def _sum_reserve_allocations(self, df: pd.DataFrame, start_row: int, end_row: int, column: int) -> float:
+        """
+        Total the reserve allocations in rows [start_row, end_row) of a month column
+        Negative numeric cells are reserve allocations (cash OUT); uses the scalar df.iat
+        accessor since this runs for every reserve row of every budget month
+        """
+        total = 0
+        for row_idx in range(start_row, min(end_row, len(df))):
+            reserve_value = df.iat[row_idx, column]
+            if pd.notna(reserve_value) and isinstance(reserve_value, (int, float)) and reserve_value < 0:
+                total += abs(reserve_value)
+        return total
+    
     def _parse_cash_forecast_filename(self, filename: str) -> Tuple[str, str, str]:
         """
         Parse filename - flexible to handle various formats
@@ -964,13 +1104,13 @@ class FileProcessor:
           - "Cash Forecast - 09.2025.xlsx"
         Returns: (entity_number, property_name, current_month)
         """
-        print(f"DEBUG: Parsing filename: '{filename}'")
+        logger.debug("Parsing filename: '%s'", filename)
         
         # Normalize underscores to spaces (Windows may convert spaces to underscores)
         filename = filename.replace('_', ' ')
         
         # Try standard format: "### PropertyName Cash Forecast - MM.YYYY"
-        match = re.match(r'(\d+)\s+(.+?)\s+Cash\s+Forecast\s+-\s+(\d{2})\.(\d{4})', filename, re.IGNORECASE)
+        match = _CASH_FORECAST_FILENAME_RE.match(filename)
         if match:
             entity_number = match.group(1)
             property_name = match.group(2).strip()
@@ -983,14 +1123,14 @@ class FileProcessor:
             
             current_month = f"{month_name} {year}"
             
-            print(f"DEBUG: PRIMARY match succeeded -> Entity: {entity_number}, Property: {property_name}, Month: {current_month}")
+            logger.debug("PRIMARY match succeeded -> Entity: %s, Property: %s, Month: %s", entity_number, property_name, current_month)
             return entity_number, property_name, current_month
         
-        print(f"DEBUG: Primary regex failed, trying fallback...")
+        logger.debug("Primary regex failed, trying fallback...")
         
         # Try alternate format: just extract entity number and month if present
-        entity_match = re.search(r'^(\d+)', filename)
-        date_match = re.search(r'(\d{2})\.(\d{4})', filename)
+        entity_match = _ENTITY_NUMBER_RE.search(filename)
+        date_match = _FILENAME_PERIOD_RE.search(filename)
         
         entity_number = entity_match.group(1) if entity_match else 'Unknown'
         
@@ -1001,19 +1141,32 @@ class FileProcessor:
                           'July', 'August', 'September', 'October', 'November', 'December']
             month_name = month_names[int(month)] if int(month) <= 12 else 'Unknown'
             current_month = f"{month_name} {year}"
-            print(f"DEBUG: Fallback parsing -> Entity: {entity_number}, Month: {current_month}")
+            logger.debug("Fallback parsing -> Entity: %s, Month: %s", entity_number, current_month)
         else:
             current_month = 'Unknown'
-            print(f"DEBUG: Could not parse month from filename: {filename}")
+            logger.debug("Could not parse month from filename: %s", filename)
         
         # Property name will be overridden by database lookup in process_and_analyze
         return entity_number, 'From Database', current_month
     
+    @staticmethod
+    def _read_pdf_text(file_path: str) -> str:
+        """
+        Extract the text of every page of a PDF statement
+        All pages are needed: the line items can sit on any page of the statement
+        """
+        if os.getenv('PDF_TEXT_SIDECARS'):
+            text = _read_pdf_text_sidecar(file_path)
+            if text is not None:
+                return text
+        
+        with open(file_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return ''.join(page.extract_text() for page in pdf_reader.pages)
+    
     def _extract_financial_line(self, text: str, label: str) -> Optional[Dict[str, str]]:
         """Extract a financial line item with month and YTD data"""
-        pattern = rf'{re.escape(label)}\s+([\d,.-]+(?:\(\))?)\s+([\d,.-]+(?:\(\))?)\s+\(?([\d,.-]+)\)?\s+([-\d.]+%)\s+([\d,.-]+(?:\(\))?)\s+([\d,.-]+(?:\(\))?)\s+\(?([\d,.-]+)\)?\s+([-\d.]+%)'
-        
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _financial_line_re(label).search(text)
         if match:
             return {
                 'month_actual': match.group(1),
@@ -2,20 +2,689 @@
 Comprehensive Recommendation Engine
 Synthesizes Cash Forecast, Income Statement, Balance Sheet, and Economic Analysis
 Produces tiered recommendations: Executive Decision → Summary Bullets → Detailed Analysis
+
+Performance note: the hot path is interpreter-bound string formatting and dict access
+(the _format_* helpers), not numeric loops. JIT compilers such as Numba do
+not apply - there are no array loops and nopython mode barely supports strings. Tune via
+the hoisted module-level templates and ReportMetrics/EconContext.
 """
+import bisect
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from enum import IntEnum
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Callable, Dict, Final, Iterator, List, Mapping, Optional, Tuple
+
+
+# Decision constants shared by every return path and comparison (interned so == short-circuits on identity)
+DECISION_CONTRIBUTE = sys.intern('CONTRIBUTE')
+DECISION_DISTRIBUTE = sys.intern('DISTRIBUTE')
+DECISION_DO_NOTHING = sys.intern('DO_NOTHING')
+
+# Immutable (decision, amount, contribution_breakdown) outcome reused by every no-action path
+_NO_ACTION = (DECISION_DO_NOTHING, None, None)
+
+# Multi-month trends under which one negative month still allows a distribution
+_DISTRIBUTABLE_TRENDS = frozenset(('IMPROVING', 'STABLE'))
+
+
+class Season(IntEnum):
+    """Academic season, normalized once from EconomicAnalyzer.get_seasonal_factor() labels"""
+    UNKNOWN = 0
+    SUMMER = 1
+    FALL = 2
+    SPRING = 3
+    
+    @classmethod
+    def from_label(cls, label: Optional[str]) -> 'Season':
+        return _SEASON_BY_LABEL.get(label, cls.UNKNOWN)
+
+
+class EnrollmentTrend(IntEnum):
+    """University enrollment trend, normalized once from the economic analysis label"""
+    UNKNOWN = 0
+    STABLE = 1
+    GROWING = 2
+    DECLINING = 3
+    
+    @classmethod
+    def from_label(cls, label: Optional[str]) -> 'EnrollmentTrend':
+        return _ENROLLMENT_TREND_BY_LABEL.get(label, cls.UNKNOWN)
+
+
+_SEASON_BY_LABEL = {
+    'Summer Session': Season.SUMMER,
+    'Fall Semester': Season.FALL,
+    'Spring Semester': Season.SPRING,
+}
+
+_ENROLLMENT_TREND_BY_LABEL = {
+    'stable': EnrollmentTrend.STABLE,
+    'growing': EnrollmentTrend.GROWING,
+    'declining': EnrollmentTrend.DECLINING,
+}
+
+# Sentinel labels EconomicAnalyzer emits when it cannot classify the period
+_UNDETERMINED_LABELS = frozenset(('Unable to determine', 'Unknown'))
+_UNDETERMINED_SEASONS = frozenset(('Unknown',))
+
+# Decision rationale market summary by enrollment trend (stable/unknown use the default)
+_MARKET_CONDITIONS: Final[Mapping[EnrollmentTrend, str]] = {
+    EnrollmentTrend.GROWING: "University enrollment growing and market fundamentals are favorable",
+    EnrollmentTrend.DECLINING: "University enrollment declining - conservative cash management prudent",
+}
+_MARKET_CONDITION_DEFAULT = "Market conditions stable with normal seasonal patterns expected"
+
+
+@dataclass(frozen=True, slots=True)
+class EconContext:
+    """Economic analysis fields read by the engine, normalized once per analysis"""
+    season: Season
+    season_label: str           # Raw season label ('Unknown' when missing)
+    season_desc: str            # Display label ('Current period' when unknown)
+    expected_occupancy: str     # Display occupancy ('typical' when undetermined)
+    enrollment_trend: EnrollmentTrend
+    new_supply: bool
+    full_analysis: str
+    market_condition: str       # Decision rationale market summary for the enrollment trend
+    season_phrase: str          # Executive summary suffix (' during Fall Semester'; '' when unknown)
+    
+    @classmethod
+    def from_analysis(cls, economic_analysis: Dict) -> 'EconContext':
+        seasonal_factor = economic_analysis.get('seasonal_factor', {})
+        season_desc = seasonal_factor.get('season', 'Current period')
+        expected_occupancy = seasonal_factor.get('expected_occupancy', 'Normal')
+        
+        # Clean up "Unable to determine" and "Unknown" values
+        if expected_occupancy in _UNDETERMINED_LABELS:
+            expected_occupancy = 'typical'
+        if season_desc in _UNDETERMINED_SEASONS:
+            season_desc = 'Current period'
+        
+        season_label = seasonal_factor.get('season', 'Unknown')
+        enrollment_trend = EnrollmentTrend.from_label(economic_analysis.get('enrollment_trend', 'stable'))
+        
+        return cls(
+            season=Season.from_label(seasonal_factor.get('season')),
+            season_label=season_label,
+            season_desc=season_desc,
+            expected_occupancy=expected_occupancy,
+            enrollment_trend=enrollment_trend,
+            new_supply=bool(economic_analysis.get('new_supply', False)),
+            full_analysis=economic_analysis.get('full_analysis', 'Economic analysis not available'),
+            market_condition=_MARKET_CONDITIONS.get(enrollment_trend, _MARKET_CONDITION_DEFAULT),
+            season_phrase=f" during {season_label}" if season_label != 'Unknown' else "",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ReportMetrics:
+    """Scalar inputs to analyze_and_recommend, read from the parsed statements once"""
+    property_name: str
+    current_month: str
+    projected_month: str
+    projected_fcf: float
+    projected_operational_fcf: float    # Before the accountant's planned distribution/contribution
+    current_fcf: float
+    current_occupancy: float
+    projected_occupancy: float
+    current_distributions: float
+    projected_months: List[Dict]
+    cash_balance: float
+    accounts_receivable: float
+    prepaid_expenses: float
+    other_current_assets: float
+    current_assets: float
+    current_liabilities: float
+    working_capital: float
+    current_ratio: float                # Current assets / current liabilities (liabilities floored at $1)
+    monthly_debt_service: float
+    monthly_expenses: float
+    noi_ytd_variance_pct: float
+    noi_month_variance_pct: float
+    expenses_ytd_variance_pct: float
+    
+    @classmethod
+    def from_inputs(cls, cash_forecast_data: Dict, income_statement_data: Dict,
+                    balance_sheet_data: Dict) -> 'ReportMetrics':
+        projected_fcf = cash_forecast_data.get('projected_fcf', 0)
+        cash_balance = balance_sheet_data.get('cash_balance', 0)
+        accounts_receivable = balance_sheet_data.get('accounts_receivable', 0)
+        prepaid_expenses = balance_sheet_data.get('prepaid_expenses', 0)
+        other_current_assets = balance_sheet_data.get('other_current_assets', 0)
+        current_assets = cash_balance + accounts_receivable + prepaid_expenses + other_current_assets
+        current_liabilities = balance_sheet_data.get('current_liabilities', 0)
+        
+        return cls(
+            property_name=cash_forecast_data.get('property_name', 'Unknown'),
+            current_month=cash_forecast_data.get('current_month', 'Unknown'),
+            projected_month=cash_forecast_data.get('projected_month', 'Unknown'),
+            projected_fcf=projected_fcf,
+            projected_operational_fcf=cash_forecast_data.get('projected_operational_fcf', projected_fcf),
+            current_fcf=cash_forecast_data.get('current_fcf', 0),
+            current_occupancy=cash_forecast_data.get('current_occupancy', 0),
+            projected_occupancy=cash_forecast_data.get('projected_occupancy', 0),
+            current_distributions=cash_forecast_data.get('current_distributions', 0),
+            projected_months=cash_forecast_data.get('projected_months', []),
+            cash_balance=cash_balance,
+            accounts_receivable=accounts_receivable,
+            prepaid_expenses=prepaid_expenses,
+            other_current_assets=other_current_assets,
+            current_assets=current_assets,
+            current_liabilities=current_liabilities,
+            working_capital=current_assets - current_liabilities,
+            current_ratio=current_assets / max(current_liabilities, 1),
+            monthly_debt_service=balance_sheet_data.get('monthly_debt_service', 0),
+            monthly_expenses=income_statement_data.get('expenses_month_actual', 0),
+            noi_ytd_variance_pct=income_statement_data.get('noi_ytd_variance_pct', 0),
+            noi_month_variance_pct=income_statement_data.get('noi_month_variance_pct', 0),
+            expenses_ytd_variance_pct=income_statement_data.get('expenses_ytd_variance_pct', 0),
+        )
+
+
+# Month names for the balance sheet prior-month comparison
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+_MONTH_INDEX = {name: i for i, name in enumerate(_MONTHS)}
+# February..December -> prior month in the same year (January rolls back a year)
+_PRIOR_MONTH_SAME_YEAR = {_MONTHS[i]: _MONTHS[i - 1] for i in range(1, 12)}
+
+
+# Executive summary band tables: bisect_left over the thresholds selects the label/template
+# Reserve months: <=6 tight, 6-10 adequate, >10 strong
+_RESERVE_BANDS = (6.0, 10.0)
+_RESERVE_LABELS = ('tight', 'adequate', 'strong')
+
+# NOI YTD variance %: <=-5 below budget, -5 to 5 within, >5 above
+_NOI_BANDS = (-5.0, 5.0)
+_NOI_TEMPLATES = (
+    "Net Operating Income underperforming budget by {abs_pct:.1f}% YTD, with recent month at {month_pct:+.1f}% - monitor trend closely",
+    "Net Operating Income tracking within 5% of budget YTD ({pct:+.1f}%), indicating reliable budget assumptions",
+    "Net Operating Income exceeding budget by {pct:.1f}% YTD, demonstrating strong property performance",
+)
+
+# Expense YTD variance %: negative = under budget (GOOD), positive = over budget (BAD).
+# <-5 under, -5 to 5 inclusive close, >5 over; indexed by _variance_sign(pct) + 1
+_EXPENSE_TEMPLATES = (
+    "Operating expenses running {abs_pct:.1f}% under budget YTD, contributing to favorable cash position",
+    "Operating expenses tracking close to budget ({pct:+.1f}% YTD)",
+    "Operating expenses {pct:.1f}% over budget YTD - expense control measures recommended",
+)
+
+# Income statement interpretation by NOI YTD variance sign (see _variance_sign):
+# +1 above plan, -1 below plan, 0 within the band but with a material monthly swing
+_NOI_INTERPRETATIONS = {
+    1: "Property is outperforming budget with NOI {ytd:+.1f}% above plan YTD. Recent month showed {month:+.1f}% variance, {trend}.",
+    -1: "Property is underperforming budget with NOI at {ytd:.1f}% of plan YTD. Recent month at {month:+.1f}% indicates {trend}. Review revenue and expense drivers.",
+    0: "Operating performance tracking close to budget YTD ({ytd:+.1f}%), though recent month shows {month:+.1f}% variance requiring attention.",
+}
+_NOI_ON_PLAN = "Operating performance is tracking close to budget both YTD and for the recent month, indicating reliable budget assumptions and stable operations."
+
+
+def _variance_sign(pct: float, band: float = 5.0) -> int:
+    """Classify a budget variance % as +1 (above band), -1 (below -band) or 0 (within)"""
+    return (pct > band) - (pct < -band)
+
+
+# Balance sheet reserve classification: (assessment label, interpretation template) per tier.
+# Labels/templates are formatted with reserve_months, months and ratio (cash + AR current ratio).
+_RESERVE_STRONG = (
+    "STRONG (>10 months)",
+    "Liquidity position is very strong with {months:.1f} months of reserves. The property has ample cushion to absorb unexpected expenses or temporary cash flow disruptions. Current ratio of {ratio:.2f}:1 exceeds recommended minimum of 1.5:1.",
+)
+_RESERVE_ADEQUATE = (
+    "ADEQUATE ({reserve_months}-10 months)",
+    "Liquidity position is adequate with {months:.1f} months of reserves. The property can handle normal business fluctuations and minor unexpected expenses. Maintain current reserve levels.",
+)
+_RESERVE_TIGHT = (
+    "TIGHT (<{reserve_months} months)",
+    "Liquidity position is tight with only {months:.1f} months of reserves. Property has limited cushion for unexpected expenses. Avoid distributions and build reserves through retained cash flow.",
+)
+
+
+def _classify_reserves(months_of_reserves: float, reserve_months: int) -> Tuple[str, str]:
+    """Return the (assessment label, interpretation template) tier for the reserve level"""
+    if months_of_reserves > 10:
+        return _RESERVE_STRONG
+    if months_of_reserves > reserve_months:
+        return _RESERVE_ADEQUATE
+    return _RESERVE_TIGHT
+
+
+@lru_cache(maxsize=1024)
+def _money(amount: float) -> str:
+    """Format a dollar amount as 1,234.56 (negative zero renders as 0.00)
+
+    Cached: the same balances and FCF values are formatted by both the
+    _format_* sections and their _interpret_* companions.
+    """
+    return format(amount + 0.0, ',.2f')
+
+# Executive summary bullets rendered with str.format; dollar amounts use the ${x:,.0f} spec
+# Working capital bullet by current ratio vs. the client target (recent distribution note appended)
+_WC_RECENT_DISTRIBUTION = " Note: Property distributed ${distributions:,.0f} in the prior month, indicating management confidence in liquidity position."
+_WC_ABOVE_TARGET = "Working capital ratio of {ratio:.2f}:1 (current assets ${assets:,.0f}, liabilities ${liabilities:,.0f}) is **above the {risk_label} target of {target:.2f}:1**, though below conventional 1.0:1 standard.{dist_context}"
+_WC_SLIGHTLY_BELOW_TARGET = "⚠️ Working capital ratio of {ratio:.2f}:1 is **slightly below the {risk_label} target of {target:.2f}:1** (current assets ${assets:,.0f}, liabilities ${liabilities:,.0f}). Monitor closely and consider gradual reserve building.{dist_context}"
+_WC_BELOW_TARGET = "⚠️ **WORKING CAPITAL BELOW TARGET**: Current ratio of {ratio:.2f}:1 is below the {risk_label} requirement of {target:.2f}:1 (current assets ${assets:,.0f}, liabilities ${liabilities:,.0f}). Recommend liability review and reserve building.{dist_context}"
+_WC_CRISIS = "🚨 **WORKING CAPITAL CRISIS**: Current ratio of {ratio:.2f}:1 is critically low (current assets ${assets:,.0f}, liabilities ${liabilities:,.0f}). This indicates potential past-due obligations or structural cash flow problems. **FULL LIABILITY BREAKDOWN ANALYSIS REQUIRED BEFORE ANY CAPITAL DECISION**.{dist_context}"
+
+# Decision bullet; contribution breakdown is the itemized ' + '-joined calculation
+_CONTRIBUTE_FORWARD_BULLET = "**FORWARD-LOOKING CONTRIBUTION REQUIRED: ${amount:,.0f}** ({breakdown}). Rationale: {reason}. This covers immediate crisis plus forward exposure until property stabilizes."
+_CONTRIBUTE_PRELIMINARY_BULLET = "**PRELIMINARY ESTIMATE: ${amount:,.0f} contribution MAY BE NEEDED** ({breakdown}) - However, actual requirement depends on liability breakdown and root cause analysis"
+_CONTRIBUTE_BULLET = "**RECOMMENDATION: CONTRIBUTE ${amount:,.0f}** to cover shortfall and maintain reserves. Breakdown: {breakdown}"
+_CONTRIBUTE_PRELIMINARY_UNITEMIZED_BULLET = "**PRELIMINARY ESTIMATE: ${amount:,.0f} contribution MAY BE NEEDED** - However, this is based on incomplete analysis. Actual requirement depends on liability breakdown and root cause of working capital deficit"
+_CONTRIBUTE_UNITEMIZED_BULLET = "**RECOMMENDATION: CONTRIBUTE ${amount:,.0f}** to cover projected cash shortfall and maintain adequate reserves"
+_DISTRIBUTE_BULLET = "**RECOMMENDATION: DISTRIBUTE ${amount:,.0f}** to partners based on strong performance and excess cash position"
+_NO_ACTION_BULLET = "**RECOMMENDATION: NO ACTION REQUIRED** - Property cash position is stable and reserves are adequate"
+
+# Liquidity bullets
+_RESERVE_POSITION_BULLET = "Cash reserves of ${cash_balance:,.0f} provide {months:.1f} months of coverage - {status} liquidity position"
+_RESERVE_ALLOCATIONS_BULLET = "Accountant's budget includes ${total:,.0f} in voluntary reserve allocations across projected months (avg ${average:,.0f}/month), impacting reported FCF but strengthening balance sheet sub-accounts"
+
+# Projected operational FCF bullet: first matching (predicate, template) wins
+_FCF_DISCLAIMER = "(excluding accountant's planned distributions/contributions)"
+_PROJECTED_FCF_BULLETS = (
+    (lambda fcf: fcf < 0,
+     "Projected Free Cash Flow shows deficit of ${abs_fcf:,.0f} {disclaimer} for upcoming month{season_text}"),
+    (lambda fcf: fcf > 50000,  # Meaningful surplus
+     "Projected Free Cash Flow shows surplus of ${fcf:,.0f} {disclaimer}{season_text}, reflecting strong operational performance"),
+    (lambda fcf: fcf > 0,  # Small positive
+     "Projected Free Cash Flow of ${fcf:,.0f} {disclaimer}{season_text} indicates stable operations with minimal surplus"),
+    (lambda fcf: True,  # Exactly 0
+     "Projected Free Cash Flow breakeven {disclaimer}{season_text}, indicating operational balance without surplus or deficit"),
+)
+
+# Market context bullet by enrollment trend (stable/unknown fall back to the seasonal template)
+_MARKET_TEMPLATES: Final[Mapping[EnrollmentTrend, str]] = {
+    EnrollmentTrend.GROWING: "Market fundamentals are favorable: {season} with {occupancy} occupancy expected, supported by growing university enrollment",
+    EnrollmentTrend.DECLINING: "Market headwinds present: {season} period with enrollment declining - conservative cash management warranted",
+}
+_MARKET_DEFAULT_TEMPLATE = "Seasonal context: {season} with {occupancy} occupancy expected under normal market conditions"
+
+# Risk/opportunity closing bullet for decisions that take action
+_DECISION_NOTES = {
+    DECISION_CONTRIBUTE: "Risk mitigation: Capital contribution ensures property can meet all obligations without stress on operations",
+    DECISION_DISTRIBUTE: "Distribution opportunity: Excess cash can be returned to partners while maintaining prudent reserve levels",
+}
+
+
+# Risk assessment bullets that carry no per-property values
+_RISK_CASHFLOW_DEFICIT = "• Projected cash flow deficit may require liquidity support if trend continues"
+_RISK_NOI_MONTH_BELOW_BUDGET = "• Recent monthly NOI significantly below budget - investigate root causes"
+_RISK_EXPENSES_OVER_BUDGET = "• Operating expenses significantly over budget - expense control measures needed"
+_RISK_ENROLLMENT_DECLINING = "• University enrollment declining - may pressure occupancy and rental rates"
+_RISK_NEW_SUPPLY = "• New competing properties entering market - may require pricing/concession strategies"
+_RISK_NONE = "• No material risks identified - property showing stable performance"
+
+# Risk assessment rules: every (predicate, message) whose predicate holds is listed, in order.
+# Predicates take (cash_data, income_data, balance_data, econ, reserve_months).
+_RISK_RULES = (
+    # Cash flow risks
+    (lambda c, i, b, e, r: c.get('projected_fcf', 0) < 0, _RISK_CASHFLOW_DEFICIT),
+    # Performance risks
+    (lambda c, i, b, e, r: i.get('noi_month_variance_pct', 0) < -10, _RISK_NOI_MONTH_BELOW_BUDGET),
+    # Expense variance: positive = over budget (BAD), negative = under budget (GOOD)
+    (lambda c, i, b, e, r: i.get('expenses_ytd_variance_pct', 0) > 10, _RISK_EXPENSES_OVER_BUDGET),
+    # Liquidity risks
+    (lambda c, i, b, e, r: b.get('months_of_reserves', 999) < r,
+     "• Reserve levels below recommended {reserve_months}-month minimum - limits financial flexibility"),
+    # Market risks
+    (lambda c, i, b, e, r: e.enrollment_trend is EnrollmentTrend.DECLINING, _RISK_ENROLLMENT_DECLINING),
+    (lambda c, i, b, e, r: e.new_supply, _RISK_NEW_SUPPLY),
+)
+
+# Mitigation strategies following the reserve-minimum line
+_RISK_FOOTER = """• Monitor monthly performance trends for early warning signs
+• Review budget assumptions quarterly and adjust projections
+• Maintain competitive market position through property improvements and resident services
+• Ensure adequate insurance coverage and contingency planning
+"""
+
+
+# Section rules shared by every rendered section
+_RULE = '=' * 78
+_SUBRULE = '-' * 78
+
+# Economic context section header; the analysis text is appended verbatim (it may contain braces)
+_ECONOMIC_CONTEXT_HEADER = """
+ECONOMIC & MARKET CONTEXT
+""" + _RULE + """
+
+"""
+
+# Risk assessment section; key risks and the reserve minimum are filled per report
+_RISK_TEMPLATE = """
+RISK ASSESSMENT
+""" + _RULE + """
+
+Key Risks Identified:
+
+{risks}
+
+Risk Mitigation Strategies:
+• Maintain minimum {reserve_months} months operating reserves in cash
+""" + _RISK_FOOTER
+
+# Section templates rendered with str.format_map; the section rule is spliced in once here
+_INCOME_STATEMENT_FIELDS = (
+    'income_month_actual', 'income_month_budget', 'income_month_variance_pct',
+    'expenses_month_actual', 'expenses_month_budget', 'expenses_month_variance_pct',
+    'noi_month_actual', 'noi_month_budget', 'noi_month_variance_pct',
+    'income_ytd_actual', 'income_ytd_budget', 'income_ytd_variance_pct',
+    'expenses_ytd_actual', 'expenses_ytd_budget', 'expenses_ytd_variance_pct',
+    'noi_ytd_actual', 'noi_ytd_budget', 'noi_ytd_variance_pct',
+)
+
+# Cash forecast section pieces; dollar placeholders without a format spec take _money() text
+_CASH_PARAMETERS_TEMPLATE = """
+ANALYSIS PARAMETERS
+""" + _RULE + """
+
+Risk Selection: {risk_label}
+  - Reserve Months: {reserve_months} months
+  - Working Capital Target: {wc_target_ratio}:1 ratio
+
+""" + _RULE + """
+CASH FORECAST ANALYSIS
+""" + _RULE + """
+"""
+
+_CASH_HEADER = """
+CASH FORECAST ANALYSIS
+""" + _RULE + """
+"""
+
+_CASH_OVERVIEW_TEMPLATE = """
+Property: {property_name}
+Current Month: {current_month} (Actual)
+Projected Month: {projected_month} (Budget)
+
+Current Month Free Cash Flow: ${current_fcf}
+"""
+
+_CASH_PLANNED_DISTRIBUTION_TEMPLATE = """
+Projected Month Analysis:
+  Operational FCF ({before_label}): ${projected_operational_fcf}
+  
+Accountant's Recommendation:
+  Planned Distribution/Contribution:     ${projected_distributions:,.2f}
+  Net FCF ({after_label}):    ${projected_fcf}
+  
+Variance from Current Month: ${variance:,.2f}
+"""
+
+_CASH_PROJECTED_TEMPLATE = "Projected Month Free Cash Flow: ${projected_fcf}\nVariance: ${variance:,.2f}\n"
+
+_CASH_OCCUPANCY_TEMPLATE = """
+Occupancy:
+  Current Actual: {current_occupancy:.1f}%
+  Projected Budget: {projected_occupancy:.1f}%
+
+Actual Distributions/Contributions in {distributions_month}: ${current_distributions:,.2f}
+"""
+
+_PROJECTION_HEADER_TEMPLATE = """
+""" + _RULE + """
+{section_title}
+""" + _RULE + """
+
+Analyzing next {num_months} month{plural} of projections:
+"""
+
+_PROJECTION_ROW_TEMPLATE = "  {index}. {month:<15} FCF: ${fcf:>12,.2f}  Occ: {occupancy:>5.1f}%  {icon}\n"
+_PROJECTION_ROW_PLANNED_TEMPLATE = "  {index}. {month:<15} Operational FCF: ${operational_fcf:>12,.2f}  ({label} ${fcf:>12,.2f})  Occ: {occupancy:>5.1f}%  {icon}\n"
+
+_PROJECTION_SUMMARY_TEMPLATE = """
+Summary Statistics (Operational FCF):
+  Total Projected FCF ({num_months} month{plural}): ${total:,.2f}
+  Average Monthly FCF:            ${average:,.2f}
+  Highest Month:                  {highest_month} (${highest_fcf:,.2f})
+  Lowest Month:                   {lowest_month} (${lowest_fcf:,.2f})
+  Positive Months:                {positive_months} of {num_months}
+  Negative Months:                {negative_months}
+"""
+
+_INCOME_STATEMENT_TEMPLATE = """
+INCOME STATEMENT ANALYSIS
+""" + _RULE + """
+
+{reporting_month} Performance (Month):
+  Total Operating Income:  ${income_month_actual:,.2f} vs ${income_month_budget:,.2f} budget ({income_month_variance_pct:+.2f}%)
+  Total Operating Expenses: ${expenses_month_actual:,.2f} vs ${expenses_month_budget:,.2f} budget ({expenses_month_variance_pct:+.2f}%)
+  Net Operating Income:     ${noi_month_actual:,.2f} vs ${noi_month_budget:,.2f} budget ({noi_month_variance_pct:+.2f}%)
+
+Year-to-Date {year} Performance ({ytd_period}):
+  Total Operating Income:  ${income_ytd_actual:,.2f} vs ${income_ytd_budget:,.2f} budget ({income_ytd_variance_pct:+.2f}%)
+  Total Operating Expenses: ${expenses_ytd_actual:,.2f} vs ${expenses_ytd_budget:,.2f} budget ({expenses_ytd_variance_pct:+.2f}%)
+  Net Operating Income:     ${noi_ytd_actual:,.2f} vs ${noi_ytd_budget:,.2f} budget ({noi_ytd_variance_pct:+.2f}%)
+
+INTERPRETATION:
+{interpretation}
+"""
+
+_BALANCE_SHEET_TEMPLATE = """
+BALANCE SHEET ANALYSIS
+""" + _RULE + """
+
+Liquidity Position ({reporting_month}):
+  Cash and Cash Equivalents: ${cash}
+  Accounts Receivable:       ${accounts_receivable}
+  Prepaid Expenses:          ${prepaid_expenses}
+  Other Current Assets:      ${other_current_assets}
+  Total Current Assets:      ${current_assets}
+  
+  Current Liabilities:       ${current_liabilities}
+  Working Capital:           ${working_capital}
+  Current Ratio:             {current_ratio:.2f}:1
+
+Debt Position:
+  Total Notes Payable:       ${total_debt}
+  Monthly Principal Payment: ${monthly_principal}
+  Accrued Interest:          ${accrued_interest}
+  Est. Monthly Debt Service: ${monthly_debt_service}
+
+Reserve Analysis:
+  Months of Reserves:        {months_of_reserves:.1f} months
+  Assessment:                {assessment}
+
+Month-over-Month Cash Change:
+  {prior_month} Cash:          ${cash_prior_month}
+  {reporting_month} Cash:       ${cash}
+  Change:                    ${cash_change} ({cash_change_pct:+.1f}%)
+
+INTERPRETATION:
+{interpretation}
+"""
+
+_CONTRIBUTE_TEMPLATE = """
+DECISION RATIONALE: CAPITAL CONTRIBUTION REQUIRED
+""" + _RULE + """
+
+Recommended Contribution Amount: ${amount:,.2f}
+
+This recommendation is based on the following factors:
+
+1. PROJECTED CASH SHORTFALL
+   - The property is projected to have negative free cash flow in the upcoming month
+   - Without additional capital, the property may need to draw on reserves
+   - The contribution amount includes a buffer to ensure smooth operations
+
+2. RESERVE LEVELS
+   - Current reserves may be insufficient to comfortably absorb the projected deficit
+   - Maintaining adequate liquidity is essential for operational stability
+   - Capital contribution prevents depletion of cash reserves below prudent levels
+
+3. MARKET CONDITIONS
+   - {market}
+
+4. ALTERNATIVE CONSIDERATIONS
+   - Could defer non-essential expenditures to preserve cash
+   - Could draw on existing reserves if shortfall is truly temporary
+   - Could arrange short-term credit facility instead of equity contribution
+{comparison}
+RECOMMENDED ACTION:
+Wire ${amount:,.2f} to property operating account within 10 business days to ensure
+adequate cash is available for upcoming month obligations.
+"""
+
+_DISTRIBUTE_TEMPLATE = """
+DECISION RATIONALE: CASH DISTRIBUTION RECOMMENDED
+""" + _RULE + """
+
+Recommended Distribution Amount: ${amount:,.2f}
+
+This recommendation is based on the following factors:
+
+1. STRONG CASH POSITION
+   - Property has generated surplus cash flow beyond operational needs
+   - Current reserves exceed recommended minimum by comfortable margin
+   - Distribution will not impair financial flexibility or operational capability
+
+2. OPERATING PERFORMANCE
+   - Net Operating Income {noi_ytd_var:+.1f}% vs budget demonstrates strong performance
+   - Expense management effective with costs tracking to budget
+   - Revenue performance supports sustainable cash generation
+
+3. RESERVE ADEQUACY POST-DISTRIBUTION
+   - After distribution, reserves will remain at {reserves_after:.1f} months
+   - This {reserves_cmp} the {reserve_months}-month minimum reserve requirement
+   - Property retains adequate cushion for unexpected expenses or market changes
+
+4. MARKET CONDITIONS
+   - {market}
+{comparison}
+RECOMMENDED ACTION:
+Process distribution of ${amount:,.2f} to partners according to ownership percentages.
+Maintain minimum ${cash_after_distribution:,.2f} in operating account post-distribution.
+"""
+
+_DO_NOTHING_TEMPLATE = """
+DECISION RATIONALE: NO ACTION REQUIRED
+""" + _RULE + """
+
+No capital contribution or distribution is recommended at this time.
+
+This recommendation is based on the following factors:
+
+1. RESERVE POSITION
+   - Current reserves of ${cash_balance:,.2f} provide {months_of_reserves:.1f} months of coverage
+   - This is {reserves_cmp} the {reserve_months}-month minimum reserve requirement
+   - {cash_flow_note}
+
+2. OPERATIONAL PERFORMANCE
+   - Property operating within expected parameters
+   - {variance_note}
+
+3. PRUDENT CASH MANAGEMENT
+   - Priority is building reserves to minimum {reserve_months}-month level
+   - Distributions should be deferred until reserve target is achieved
+   - Strengthening liquidity position provides financial flexibility for unexpected expenses
+
+4. MARKET CONDITIONS
+   - {market}
+{comparison}
+RECOMMENDED ACTION:
+Continue normal operations and RETAIN operational cash flow to build reserves.
+Monitor monthly performance and reassess distribution potential once reserves reach {reserve_months}+ months.
+{surplus_note}
+{deficit_note}
+"""
+
+
+class RecommendationResult:
+    """
+    Result of RecommendationEngine.analyze_and_recommend
+    
+    Slotted for a small memory footprint when many results are held at once (portfolio runs).
+    Supports dict-style access (result['decision'], result.get('amount')) so existing
+    consumers - Word/PowerPoint generators, Jinja templates, activity logging - keep working.
+    
+    detailed_rationale may be supplied as a zero-argument rationale_factory instead; it is
+    then generated on first access, so summary-only callers never build it.
+    """
+    _FIELDS = (
+        'decision', 'amount', 'executive_summary', 'detailed_rationale',
+        'property_name', 'analysis_month', 'projected_month', 'occupancy_adjusted',
+        'risk_selection', 'reserve_months', 'wc_target_ratio', 'multi_month_analysis',
+        'show_parameters'
+    )
+    __slots__ = tuple(field for field in _FIELDS if field != 'detailed_rationale') + (
+        '_detailed_rationale', '_rationale_factory'
+    )
+    
+    def __init__(self, decision: str, amount: Optional[float], executive_summary: List[str],
+                 detailed_rationale: Optional[Dict], property_name: str, analysis_month: str,
+                 projected_month: str, occupancy_adjusted: bool, risk_selection: str,
+                 reserve_months: int, wc_target_ratio: float, multi_month_analysis: Optional[Dict],
+                 show_parameters: bool, rationale_factory: Optional[Callable[[], Dict]] = None):
+        self.decision = decision
+        self.amount = amount
+        self.executive_summary = executive_summary
+        self._detailed_rationale = detailed_rationale
+        self._rationale_factory = rationale_factory
+        self.property_name = property_name
+        self.analysis_month = analysis_month
+        self.projected_month = projected_month
+        self.occupancy_adjusted = occupancy_adjusted
+        self.risk_selection = risk_selection
+        self.reserve_months = reserve_months
+        self.wc_target_ratio = wc_target_ratio
+        self.multi_month_analysis = multi_month_analysis
+        self.show_parameters = show_parameters
+    
+    @property
+    def detailed_rationale(self) -> Dict:
+        if self._detailed_rationale is None and self._rationale_factory is not None:
+            self._detailed_rationale = self._rationale_factory()
+            self._rationale_factory = None
+        return self._detailed_rationale
+    
+    def __getitem__(self, key: str):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELDS
+    
+    def get(self, key: str, default=None):
+        """Dict-style get for backward compatibility"""
+        return getattr(self, key, default) if key in self._FIELDS else default
+    
+    def to_dict(self, include_rationale: bool = True) -> Dict:
+        """Return the result as a plain dict (original analyze_and_recommend format)
+        
+        include_rationale=False leaves out detailed_rationale without generating it.
+        """
+        return {key: getattr(self, key) for key in self._FIELDS
+                if include_rationale or key != 'detailed_rationale'}
+    
+    def __reduce__(self):
+        # Materialize the rationale so pickles (portfolio worker results) carry no engine state
+        return (self.__class__, tuple(getattr(self, key) for key in self._FIELDS))
 
 
 class RecommendationEngine:
+    # Per-instance state is limited to the client risk selection
+    __slots__ = ('cash_reserve_months', 'wc_target_ratio')
+    
+    # Decision thresholds
+    MINOR_DEFICIT = 50000        # Less than $50k deficit = minor
+    MODERATE_DEFICIT = 150000    # $50k-$150k = moderate
+    MAJOR_DEFICIT = 150000       # More than $150k = major
+    DISTRIBUTION_MIN = 50000     # Minimum surplus to recommend distribution
+    DEFAULT_CASH_RESERVE_MONTHS = 6     # Minimum months of reserves to maintain
+    DEFAULT_WC_TARGET_RATIO = 1.0       # Target current ratio for working capital restoration
+    
     def __init__(self):
-        self.decision_thresholds = {
-            'minor_deficit': 50000,      # Less than $50k deficit = minor
-            'moderate_deficit': 150000,  # $50k-$150k = moderate
-            'major_deficit': 150000,     # More than $150k = major
-            'distribution_min': 50000,   # Minimum surplus to recommend distribution
-            'cash_reserve_months': 6,    # Minimum months of reserves to maintain
-        }
+        # Client risk selection, overridden by each analyze_and_recommend call
+        self.cash_reserve_months = self.DEFAULT_CASH_RESERVE_MONTHS
+        self.wc_target_ratio = self.DEFAULT_WC_TARGET_RATIO
     
     def _round_to_nearest_10k(self, amount: float) -> float:
         """
@@ -32,13 +701,12 @@ class RecommendationEngine:
             $150,000 → $150,000
             $145,678 → $150,000
         """
-        import math
         return math.ceil(amount / 10000) * 10000
     
     def analyze_and_recommend(self, cash_forecast_data: Dict, income_statement_data: Dict, 
                              balance_sheet_data: Dict, economic_analysis: Dict, 
                              reserve_months: int = 6, wc_target_ratio: float = 1.0,
-                             show_parameters: bool = True) -> Dict:
+                             show_parameters: bool = True) -> RecommendationResult:
         """
         Generate comprehensive recommendation based on all input data
         
@@ -48,43 +716,29 @@ class RecommendationEngine:
             show_parameters: Whether to include Analysis Parameters section in output (default: True)
         
         Returns:
-            dict: {
-                'decision': 'CONTRIBUTE' | 'DISTRIBUTE' | 'DO_NOTHING',
-                'amount': float or None (rounded to nearest $10,000),
-                'executive_summary': [list of 5-7 bullet points],
-                'detailed_rationale': {detailed analysis sections}
-            }
+            RecommendationResult (dict-style access supported; use to_dict() for a plain dict):
+                decision: 'CONTRIBUTE' | 'DISTRIBUTE' | 'DO_NOTHING'
+                amount: float or None (rounded to nearest $10,000)
+                executive_summary: [list of 5-7 bullet points]
+                detailed_rationale: {detailed analysis sections}
         """
         # Override the default cash_reserve_months with the user-selected value
-        self.decision_thresholds['cash_reserve_months'] = reserve_months
-        self.decision_thresholds['wc_target_ratio'] = wc_target_ratio
+        self.cash_reserve_months = reserve_months
+        self.wc_target_ratio = wc_target_ratio
         
-        # Extract key metrics
-        projected_fcf = cash_forecast_data.get('projected_fcf', 0)
-        projected_operational_fcf = cash_forecast_data.get('projected_operational_fcf', projected_fcf)  # Use operational if available
-        current_fcf = cash_forecast_data.get('current_fcf', 0)
-        cash_balance = balance_sheet_data.get('cash_balance', 0)
-        accounts_receivable = balance_sheet_data.get('accounts_receivable', 0)
-        prepaid_expenses = balance_sheet_data.get('prepaid_expenses', 0)
-        other_current_assets = balance_sheet_data.get('other_current_assets', 0)
-        current_assets = cash_balance + accounts_receivable + prepaid_expenses + other_current_assets  # Total current assets
+        # Extract every input metric once
+        m = ReportMetrics.from_inputs(cash_forecast_data, income_statement_data, balance_sheet_data)
         
         # Debug: Show current assets breakdown
         print(f"DEBUG: Current Assets Breakdown:")
-        print(f"  Cash: ${cash_balance:,.2f}")
-        print(f"  Accounts Receivable: ${accounts_receivable:,.2f}")
-        print(f"  Prepaid Expenses: ${prepaid_expenses:,.2f}")
-        print(f"  Other Current Assets: ${other_current_assets:,.2f}")
-        print(f"  Total Current Assets: ${current_assets:,.2f}")
-        
-        current_liabilities = balance_sheet_data.get('current_liabilities', 0)
-        monthly_debt_service = balance_sheet_data.get('monthly_debt_service', 0)
-        
-        current_occupancy = cash_forecast_data.get('current_occupancy', 0)
-        projected_occupancy = cash_forecast_data.get('projected_occupancy', 0)
-        
-        # NEW: Extract and analyze multi-month projection
-        projected_months = cash_forecast_data.get('projected_months', [])
+        print(f"  Cash: ${m.cash_balance:,.2f}")
+        print(f"  Accounts Receivable: ${m.accounts_receivable:,.2f}")
+        print(f"  Prepaid Expenses: ${m.prepaid_expenses:,.2f}")
+        print(f"  Other Current Assets: ${m.other_current_assets:,.2f}")
+        print(f"  Total Current Assets: ${m.current_assets:,.2f}")
+        
+        # NEW: Analyze multi-month projection
+        projected_months = m.projected_months
         multi_month_analysis = self._analyze_multi_month_projection(projected_months) if projected_months else None
         
         if multi_month_analysis:
@@ -97,49 +751,37 @@ class RecommendationEngine:
         else:
             print(f"DEBUG: No multi-month analysis available (projected_months count: {len(projected_months)})")
         
-        noi_ytd_variance_pct = income_statement_data.get('noi_ytd_variance_pct', 0)
-        noi_month_variance_pct = income_statement_data.get('noi_month_variance_pct', 0)
-        expenses_ytd_variance_pct = income_statement_data.get('expenses_ytd_variance_pct', 0)
-        
-        seasonal_factor = economic_analysis.get('seasonal_factor', {})
-        enrollment_trend = economic_analysis.get('enrollment_trend', 'stable')
+        econ = EconContext.from_analysis(economic_analysis)
         
         # CRITICAL: Adjust projected OPERATIONAL FCF if occupancy gap exists
         # We use operational FCF (before distributions/contributions) for true operational analysis
         occupancy_adjusted_fcf, occupancy_adjustment_note = self._adjust_fcf_for_occupancy(
-            projected_operational_fcf, current_occupancy, projected_occupancy
+            m.projected_operational_fcf, m.current_occupancy, m.projected_occupancy
         )
         
-        # Get monthly expenses from income statement for reserve calculation
-        monthly_expenses = income_statement_data.get('expenses_month_actual', 0)
-        
         # Calculate key ratios
         months_of_reserves = self._calculate_months_of_reserves(
-            cash_balance, monthly_debt_service, current_liabilities, monthly_expenses
+            m.cash_balance, m.monthly_debt_service, m.current_liabilities, m.monthly_expenses
         )
         
-        working_capital = current_assets - current_liabilities
-        
-        # Get current distributions for context
-        current_distributions = cash_forecast_data.get('current_distributions', 0)
-        
         # Determine decision using ADJUSTED cash flow and multi-month analysis
         decision, amount, contribution_breakdown = self._make_decision(
             projected_fcf=occupancy_adjusted_fcf,  # Use adjusted value
-            projected_operational_fcf=projected_operational_fcf,  # Pass operational FCF for contributions
-            current_fcf=current_fcf,
-            cash_balance=cash_balance,
+            projected_operational_fcf=m.projected_operational_fcf,  # Pass operational FCF for contributions
+            current_fcf=m.current_fcf,
+            cash_balance=m.cash_balance,
             months_of_reserves=months_of_reserves,
-            working_capital=working_capital,
-            noi_ytd_variance_pct=noi_ytd_variance_pct,
-            monthly_debt_service=monthly_debt_service,
-            monthly_expenses=monthly_expenses,  # NEW: Pass monthly expenses
-            current_liabilities=current_liabilities,
-            seasonal_factor=seasonal_factor,
-            enrollment_trend=enrollment_trend,
+            working_capital=m.working_capital,
+            noi_ytd_variance_pct=m.noi_ytd_variance_pct,
+            monthly_debt_service=m.monthly_debt_service,
+            monthly_expenses=m.monthly_expenses,  # NEW: Pass monthly expenses
+            current_liabilities=m.current_liabilities,
+            season=econ.season,
+            enrollment_trend=econ.enrollment_trend,
             multi_month_analysis=multi_month_analysis,  # NEW: Pass multi-month data
-            current_assets=current_assets,  # NEW: Pass current assets for proper WC calculation
-            current_distributions=current_distributions  # NEW: Pass recent distributions for context
+            current_assets=m.current_assets,  # NEW: Pass current assets for proper WC calculation
+            current_ratio=m.current_ratio,
+            current_distributions=m.current_distributions  # NEW: Pass recent distributions for context
         )
         
         # Round amount to nearest $10,000 BEFORE generating summaries
@@ -147,61 +789,105 @@ class RecommendationEngine:
         rounded_amount = self._round_to_nearest_10k(amount) if amount else None
         
         # Generate executive summary bullets (using rounded amount)
-        executive_summary = self._generate_executive_summary(
+        executive_summary = list(islice(self._iter_executive_summary(
             decision=decision,
             amount=rounded_amount,
             projected_fcf=occupancy_adjusted_fcf,  # Use adjusted value
-            cash_balance=cash_balance,
+            cash_balance=m.cash_balance,
             months_of_reserves=months_of_reserves,
-            noi_ytd_variance_pct=noi_ytd_variance_pct,
-            noi_month_variance_pct=noi_month_variance_pct,
-            expenses_ytd_variance_pct=expenses_ytd_variance_pct,
-            seasonal_factor=seasonal_factor,
-            enrollment_trend=enrollment_trend,
-            working_capital=working_capital,
-            current_liabilities=current_liabilities,
-            current_assets=current_assets,
+            noi_ytd_variance_pct=m.noi_ytd_variance_pct,
+            noi_month_variance_pct=m.noi_month_variance_pct,
+            expenses_ytd_variance_pct=m.expenses_ytd_variance_pct,
+            econ=econ,
+            working_capital=m.working_capital,
+            current_liabilities=m.current_liabilities,
+            current_assets=m.current_assets,
             contribution_breakdown=contribution_breakdown,
             multi_month_analysis=multi_month_analysis,
-            current_distributions=current_distributions
-        )
+            current_distributions=m.current_distributions,
+            current_ratio=m.current_ratio
+        ), 7))  # Maximum 7 bullets
         
         # Add occupancy adjustment note to summary if significant
         if occupancy_adjustment_note:
             executive_summary.insert(2, occupancy_adjustment_note)  # Insert after decision and FCF bullets
         
-        # Generate detailed rationale (using rounded amount)
-        detailed_rationale = self._generate_detailed_rationale(
+        # Detailed rationale (using rounded amount) is generated when first read
+        rationale_factory = partial(
+            self._generate_detailed_rationale,
             cash_forecast_data=cash_forecast_data,
             income_statement_data=income_statement_data,
             balance_sheet_data=balance_sheet_data,
-            economic_analysis=economic_analysis,
+            econ=econ,
             decision=decision,
             amount=rounded_amount,
             months_of_reserves=months_of_reserves,
             occupancy_adjustment_note=occupancy_adjustment_note,
             reserve_months=reserve_months,
-            show_parameters=show_parameters
+            show_parameters=show_parameters,
+            wc_target_ratio=wc_target_ratio
         )
         
         # Get risk label for display
         risk_label = self._get_risk_label()
         
-        return {
-            'decision': decision,
-            'amount': rounded_amount,
-            'executive_summary': executive_summary,
-            'detailed_rationale': detailed_rationale,
-            'property_name': cash_forecast_data.get('property_name', 'Unknown'),
-            'analysis_month': cash_forecast_data.get('current_month', 'Unknown'),
-            'projected_month': cash_forecast_data.get('projected_month', 'Unknown'),
-            'occupancy_adjusted': occupancy_adjusted_fcf != projected_fcf,
-            'risk_selection': risk_label,
-            'reserve_months': reserve_months,
-            'wc_target_ratio': wc_target_ratio,
-            'multi_month_analysis': multi_month_analysis,  # NEW: Include 6-month analysis in output
-            'show_parameters': show_parameters  # NEW: Toggle for Analysis Parameters display
-        }
+        return RecommendationResult(
+            decision=decision,
+            amount=rounded_amount,
+            executive_summary=executive_summary,
+            detailed_rationale=None,
+            property_name=m.property_name,
+            analysis_month=m.current_month,
+            projected_month=m.projected_month,
+            occupancy_adjusted=occupancy_adjusted_fcf != m.projected_fcf,
+            risk_selection=risk_label,
+            reserve_months=reserve_months,
+            wc_target_ratio=wc_target_ratio,
+            multi_month_analysis=multi_month_analysis,  # Include 6-month analysis in output
+            show_parameters=show_parameters,  # Toggle for Analysis Parameters display
+            rationale_factory=rationale_factory
+        )
+    
+    def analyze_portfolio(self, scenarios: List[Tuple],
+                          max_workers: Optional[int] = None) -> List[RecommendationResult]:
+        """Generate recommendations for many properties in parallel (see analyze_batch)"""
+        return self.analyze_batch(scenarios, max_workers=max_workers)
+    
+    @classmethod
+    def analyze_batch(cls, scenarios: List[Tuple],
+                      max_workers: Optional[int] = None) -> List[RecommendationResult]:
+        """
+        Generate recommendations for many properties in parallel
+        
+        Each property is analyzed independently, so scenarios are fanned out to a
+        process pool (CPU-bound work, sidesteps the GIL). The calling engine is not
+        pickled; every worker process builds its own engine once and reuses it.
+        Scripts calling this must guard their entry point with if __name__ == "__main__".
+        
+        Args:
+            scenarios: List of (cash_forecast_data, income_statement_data, balance_sheet_data,
+                       economic_analysis) tuples, optionally with a 5th element dict of
+                       keyword arguments for analyze_and_recommend (reserve_months, etc.)
+            max_workers: Number of worker processes (default: os.cpu_count())
+        
+        Returns:
+            List of RecommendationResult objects in the same order as scenarios
+        """
+        if not scenarios:
+            return []
+        
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_in_worker, scenarios, chunksize=chunksize))
+    
+    def _analyze_tuple(self, scenario: Tuple) -> RecommendationResult:
+        """Unpack a portfolio scenario tuple and forward to analyze_and_recommend"""
+        cash_forecast_data, income_statement_data, balance_sheet_data, economic_analysis, *options = scenario
+        kwargs = options[0] if options else {}
+        return self.analyze_and_recommend(cash_forecast_data, income_statement_data,
+                                          balance_sheet_data, economic_analysis, **kwargs)
     
     def _adjust_fcf_for_occupancy(self, projected_fcf: float, current_occupancy: float, 
                                   projected_occupancy: float) -> tuple:
@@ -290,9 +976,21 @@ class RecommendationEngine:
         # ALWAYS calculate month-over-month deltas (incremental changes)
         # The Excel shows ending balances, we need the change from month to month
         # With N months, we get (N-1) deltas (the changes between consecutive months)
+        # The same pass tracks the lowest/highest delta (first occurrence) and the sign counts
         monthly_deltas = []
+        lowest_delta_idx = highest_delta_idx = 0
+        positive_months = negative_months = 0
         for i in range(1, len(fcf_values)):
             delta = fcf_values[i] - fcf_values[i-1]
+            if monthly_deltas:
+                if delta < monthly_deltas[lowest_delta_idx]:
+                    lowest_delta_idx = i - 1
+                if delta > monthly_deltas[highest_delta_idx]:
+                    highest_delta_idx = i - 1
+            if delta > 0:
+                positive_months += 1
+            elif delta < 0:
+                negative_months += 1
             monthly_deltas.append(delta)
         
         print(f"DEBUG: Monthly deltas (month-over-month changes): {[f'${v:,.2f}' for v in monthly_deltas]}")
@@ -332,14 +1030,6 @@ class RecommendationEngine:
                 'total_reserves': total_reserves
             }
         
-        # Find lowest and highest months based on deltas (not ending balances)
-        lowest_delta_idx = monthly_deltas.index(min(monthly_deltas))
-        highest_delta_idx = monthly_deltas.index(max(monthly_deltas))
-        
-        # Count positive/negative deltas
-        positive_months = sum(1 for d in monthly_deltas if d > 0)
-        negative_months = sum(1 for d in monthly_deltas if d < 0)
-        
         # Determine trend (compare first half to second half of deltas)
         if len(monthly_deltas) >= 4:
             half_point = len(monthly_deltas) // 2
@@ -367,10 +1057,10 @@ class RecommendationEngine:
         avg_monthly_reserves = total_reserves / len(projected_months) if projected_months else 0
         adjusted_avg_fcf = average_fcf + avg_monthly_reserves
         
-        # Check if all months would be positive after adding back reserves
-        adjusted_monthly_deltas = [d + avg_monthly_reserves for d in monthly_deltas]
-        adjusted_all_positive = all(d >= 0 for d in adjusted_monthly_deltas)
-        adjusted_lowest_month_fcf = min(adjusted_monthly_deltas) if adjusted_monthly_deltas else 0
+        # Check if all months would be positive after adding back reserves; adding the same
+        # amount to every delta preserves ordering, so only the lowest delta needs adjusting
+        adjusted_lowest_month_fcf = monthly_deltas[lowest_delta_idx] + avg_monthly_reserves
+        adjusted_all_positive = adjusted_lowest_month_fcf >= 0
         
         # For distribution eligibility, allow 1 negative month if:
         # - Total FCF is strong (positive)
@@ -379,7 +1069,7 @@ class RecommendationEngine:
         allow_one_negative = (
             negative_months <= 1 and 
             total_fcf > average_fcf * 3 and  # Total is at least 3x average (strong overall)
-            trend in ['IMPROVING', 'STABLE']
+            trend in _DISTRIBUTABLE_TRENDS
         )
         
         distribution_eligible = adjusted_all_positive or allow_one_negative
@@ -443,6 +1133,7 @@ class RecommendationEngine:
     def _calculate_months_of_reserves(self, cash_balance: float, monthly_debt_service: float, 
                                      current_liabilities: float, monthly_expenses: float = 0) -> float:
         """Calculate how many months of operating expenses + debt service the cash covers"""
+        # perf: a few scalar divides - not a JIT candidate (see module docstring)
         
         # Calculate monthly needs based on what's available
         if monthly_debt_service > 0:
@@ -465,16 +1156,18 @@ class RecommendationEngine:
     
     def _make_decision(self, projected_fcf: float, current_fcf: float, cash_balance: float,
                       months_of_reserves: float, working_capital: float, noi_ytd_variance_pct: float,
-                      seasonal_factor: Dict, enrollment_trend: str, multi_month_analysis: Dict = None,
+                      season: Season, enrollment_trend: EnrollmentTrend, multi_month_analysis: Dict = None,
                       monthly_debt_service: float = 0, monthly_expenses: float = 0,
                       current_liabilities: float = 0, current_assets: float = 0,
-                      projected_operational_fcf: float = None, current_distributions: float = 0) -> Tuple[str, float, Dict]:
+                      projected_operational_fcf: float = None, current_distributions: float = 0,
+                      current_ratio: Optional[float] = None) -> Tuple[str, float, Dict]:
         """
         Make the primary decision: CONTRIBUTE, DISTRIBUTE, or DO_NOTHING
         Uses multi-month projection data when available for more robust analysis
         
         Args:
             projected_operational_fcf: Operational FCF before any distributions (used for contribution calculations)
+            current_ratio: Precomputed current assets / current liabilities (derived here when omitted)
         
         Returns:
             Tuple[decision, amount, contribution_breakdown]
@@ -484,10 +1177,17 @@ class RecommendationEngine:
         if projected_operational_fcf is None:
             projected_operational_fcf = projected_fcf
         
+        # Sign tests on the projected cash flows, computed once and reused by both branches
+        is_deficit = projected_fcf < 0
+        is_operational_deficit = projected_operational_fcf < 0
+        
         # CRITICAL CHECK: Working capital deficit relative to risk tolerance
         # Calculate current ratio and compare to target
-        wc_target_ratio = self.decision_thresholds.get('wc_target_ratio', 1.0)
-        current_ratio = current_assets / max(current_liabilities, 1) if current_liabilities > 0 else 999
+        wc_target_ratio = self.wc_target_ratio
+        if current_liabilities <= 0:
+            current_ratio = 999
+        elif current_ratio is None:
+            current_ratio = current_assets / max(current_liabilities, 1)
         
         # Trigger contribution if current ratio is significantly below target (20% margin)
         # For Low Risk (0.5 target), triggers at 0.40; Medium (0.75) at 0.60; High (1.0) at 0.80
@@ -511,11 +1211,12 @@ class RecommendationEngine:
             # Use multi-month average if available (avoids single-month anomalies like 3x debt service)
             # Otherwise fall back to projected_operational_fcf
             if multi_month_analysis and multi_month_analysis.get('average_fcf') is not None:
-                monthly_deficit = abs(multi_month_analysis['average_fcf']) if multi_month_analysis['average_fcf'] < 0 else 0
-                print(f"DEBUG: Using multi-month average FCF: {multi_month_analysis['average_fcf']:,.2f} (analyzed {multi_month_analysis.get('months_analyzed', 0)} months)")
+                average_fcf = multi_month_analysis['average_fcf']
+                monthly_deficit = -average_fcf if average_fcf < 0 else 0
+                print(f"DEBUG: Using multi-month average FCF: {average_fcf:,.2f} (analyzed {multi_month_analysis.get('months_analyzed', 0)} months)")
                 print(f"DEBUG: monthly_deficit={monthly_deficit:,.2f}")
             else:
-                monthly_deficit = abs(projected_operational_fcf) if projected_operational_fcf < 0 else 0
+                monthly_deficit = -projected_operational_fcf if is_operational_deficit else 0
                 print(f"DEBUG: No multi-month data, using single month projected_operational_fcf: {projected_operational_fcf:,.2f}")
                 print(f"DEBUG: monthly_deficit={monthly_deficit:,.2f}")
             
@@ -530,7 +1231,7 @@ class RecommendationEngine:
             # Use user's risk tolerance (reserve_months) directly for forward deficit projection
             # The accountant selects risk level based on their knowledge of property performance,
             # so we don't apply additional multipliers that would double-penalize
-            months_forward = self.decision_thresholds['cash_reserve_months']
+            months_forward = self.cash_reserve_months
             
             if monthly_deficit > 0:
                 # Property showing deficit - cover for the risk-selected period
@@ -552,7 +1253,7 @@ class RecommendationEngine:
             # Operating reserve buffer: use HALF the user-selected reserve_months requirement
             # This balances capital efficiency with prudent reserves
             # Full months used for deficit coverage, half for buffer cushion
-            reserve_buffer_months = self.decision_thresholds['cash_reserve_months'] / 2
+            reserve_buffer_months = self.cash_reserve_months / 2
             operating_reserve_buffer = monthly_operating_cost * reserve_buffer_months
             
             print(f"DEBUG: Operating Reserve Buffer = ${monthly_operating_cost:,.2f} × {reserve_buffer_months:.1f} months = ${operating_reserve_buffer:,.2f}")
@@ -564,36 +1265,36 @@ class RecommendationEngine:
                 'forward_projected_deficit': projected_multi_month_deficit,
                 'working_capital_restoration': wc_deficit,
                 'operating_reserve_buffer': operating_reserve_buffer,
-                'reserve_months': self.decision_thresholds['cash_reserve_months'],
+                'reserve_months': self.cash_reserve_months,
                 'reserve_buffer_months': reserve_buffer_months,  # Show the half value used for buffer
                 'forward_reason': forward_reason,
                 'total': projected_multi_month_deficit + wc_deficit + operating_reserve_buffer
             }
             
-            return ('CONTRIBUTE', contribution_breakdown['total'], contribution_breakdown)
+            return (DECISION_CONTRIBUTE, contribution_breakdown['total'], contribution_breakdown)
         
         # Decision Logic Tree
         
         # Case 1: Projected deficit
-        if projected_fcf < 0:
-            deficit_amount = abs(projected_fcf)
+        if is_deficit:
+            deficit_amount = -projected_fcf
             
             # Minor deficit with strong reserves
-            if deficit_amount < self.decision_thresholds['minor_deficit'] and \
-               months_of_reserves > self.decision_thresholds['cash_reserve_months']:
-                return ('DO_NOTHING', None, None)
+            if deficit_amount < self.MINOR_DEFICIT and \
+               months_of_reserves > self.cash_reserve_months:
+                return _NO_ACTION
             
             # Moderate deficit with adequate reserves
-            elif deficit_amount < self.decision_thresholds['moderate_deficit'] and \
+            elif deficit_amount < self.MODERATE_DEFICIT and \
                  months_of_reserves > 4:
-                return ('DO_NOTHING', None, None)
+                return _NO_ACTION
             
             # Major deficit or low reserves
-            elif deficit_amount >= self.decision_thresholds['moderate_deficit'] or \
+            elif deficit_amount >= self.MODERATE_DEFICIT or \
                  months_of_reserves < 3:
                 # Check if seasonal - if summer deficit, may not need contribution
-                if seasonal_factor.get('season') == 'Summer Session':
-                    return ('DO_NOTHING', None, None)
+                if season is Season.SUMMER:
+                    return _NO_ACTION
                 else:
                     # Calculate contribution with transparent breakdown
                     contribution_breakdown = {
@@ -602,10 +1303,10 @@ class RecommendationEngine:
                         'working_capital_restoration': 0,  # No WC crisis in this path
                         'total': deficit_amount * 1.1
                     }
-                    return ('CONTRIBUTE', contribution_breakdown['total'], contribution_breakdown)
+                    return (DECISION_CONTRIBUTE, contribution_breakdown['total'], contribution_breakdown)
             
             else:
-                return ('DO_NOTHING', None, None)
+                return _NO_ACTION
         
         # Case 2: Projected surplus
         else:
@@ -623,7 +1324,7 @@ class RecommendationEngine:
                 months_analyzed = multi_month_analysis['months_analyzed']
                 
                 print(f"DEBUG: Distribution check - avg_fcf: ${avg_fcf:,.2f}, all_positive: {all_positive}, lowest: ${lowest_month_fcf:,.2f}, reserves: {months_of_reserves:.1f}mo")
-                print(f"DEBUG: Criteria checks - avg>{self.decision_thresholds['distribution_min']}: {avg_fcf > self.decision_thresholds['distribution_min']}, all_pos: {all_positive}, lowest>=0: {lowest_month_fcf >= 0}, reserves>10: {months_of_reserves > 10}")
+                print(f"DEBUG: Criteria checks - avg>{self.DISTRIBUTION_MIN}: {avg_fcf > self.DISTRIBUTION_MIN}, all_pos: {all_positive}, lowest>=0: {lowest_month_fcf >= 0}, reserves>10: {months_of_reserves > 10}")
                 
                 # Recommend distribution if:
                 # 1. ALL projected months are positive (after excluding voluntary reserves, or allowing 1 negative if strong)
@@ -631,7 +1332,7 @@ class RecommendationEngine:
                 # 3. Lowest month is >= 0 (may be exactly 0 if we allowed 1 negative month)
                 # 4. Reserves are strong (>10 months currently)
                 
-                if all_positive and avg_fcf > self.decision_thresholds['distribution_min'] and \
+                if all_positive and avg_fcf > self.DISTRIBUTION_MIN and \
                    lowest_month_fcf >= 0 and months_of_reserves > 10:
                     
                     print(f"DEBUG: Distribution criteria MET - proceeding to calculate safe amount")
@@ -649,7 +1350,7 @@ class RecommendationEngine:
                         monthly_operating_needs = 50000  # Default estimate
                     
                     # Required reserve: use dynamic threshold from user selection
-                    required_reserve = monthly_operating_needs * self.decision_thresholds['cash_reserve_months']
+                    required_reserve = monthly_operating_needs * self.cash_reserve_months
                     
                     # Maximum safe distribution: use minimum projected balance (not current balance)
                     # This way we distribute based on the worst-case projected position
@@ -667,7 +1368,7 @@ class RecommendationEngine:
                     # - High risk: 40% of projected FCF (conservative)
                     # But never exceed available cash after maintaining required reserves
                     
-                    risk_months = self.decision_thresholds['cash_reserve_months']
+                    risk_months = self.cash_reserve_months
                     if risk_months <= 2:
                         # Low risk
                         fcf_percentage = 0.70
@@ -697,89 +1398,91 @@ class RecommendationEngine:
                     }
                     reserves_after = self._calculate_reserves_after_distribution(balance_data_dict, safe_distribution)
                     
-                    print(f"DEBUG: Distribution calculation - safe_distribution: ${safe_distribution:,.2f}, reserves_after: {reserves_after:.1f}mo, required: {self.decision_thresholds['cash_reserve_months']}mo")
+                    print(f"DEBUG: Distribution calculation - safe_distribution: ${safe_distribution:,.2f}, reserves_after: {reserves_after:.1f}mo, required: {self.cash_reserve_months}mo")
                     print(f"DEBUG: Components - total_fcf: ${total_fcf:,.2f}, max_safe: ${max_safe_distribution:,.2f}, required_reserve: ${required_reserve:,.2f}")
                     print(f"DEBUG: Distribution base used: ${distribution_base:,.2f} (min projected vs ${cash_balance:,.2f} current)")
                     
-                    if safe_distribution > 50000 and reserves_after >= self.decision_thresholds['cash_reserve_months']:
-                        return ('DISTRIBUTE', safe_distribution, None)
+                    if safe_distribution > 50000 and reserves_after >= self.cash_reserve_months:
+                        return (DECISION_DISTRIBUTE, safe_distribution, None)
                     else:
-                        print(f"DEBUG: Distribution blocked - amount check: {safe_distribution > 50000}, reserves check: {reserves_after >= self.decision_thresholds['cash_reserve_months']}")
-                        return ('DO_NOTHING', None, None)
+                        print(f"DEBUG: Distribution blocked - amount check: {safe_distribution > 50000}, reserves check: {reserves_after >= self.cash_reserve_months}")
+                        return _NO_ACTION
                 
                 # If NOT all positive months, or lowest month concerning, hold cash
                 elif not all_positive or lowest_month_fcf < 0:
                     print(f"DEBUG: Distribution blocked - all_positive: {all_positive}, lowest_month_fcf: ${lowest_month_fcf:,.2f}")
-                    return ('DO_NOTHING', None, None)
+                    return _NO_ACTION
                 
                 # If avg FCF positive but low, wait longer
-                elif avg_fcf < self.decision_thresholds['distribution_min']:
-                    print(f"DEBUG: Distribution blocked - avg_fcf ${avg_fcf:,.2f} < threshold ${self.decision_thresholds['distribution_min']:,.2f}")
-                    return ('DO_NOTHING', None, None)
+                elif avg_fcf < self.DISTRIBUTION_MIN:
+                    print(f"DEBUG: Distribution blocked - avg_fcf ${avg_fcf:,.2f} < threshold ${self.DISTRIBUTION_MIN:,.2f}")
+                    return _NO_ACTION
                 
                 else:
                     print(f"DEBUG: Distribution blocked - unknown reason")
-                    return ('DO_NOTHING', None, None)
+                    return _NO_ACTION
             
             else:
                 # FALLBACK: Single-month analysis (backward compatible)
                 # Only recommend distribution if surplus is substantial and reserves are strong
-                if surplus_amount > self.decision_thresholds['distribution_min'] and \
-                   months_of_reserves > self.decision_thresholds['cash_reserve_months'] * 1.5 and \
+                if surplus_amount > self.DISTRIBUTION_MIN and \
+                   months_of_reserves > self.cash_reserve_months * 1.5 and \
                    noi_ytd_variance_pct > 0:  # Performing above budget
                     
                     # Calculate safe distribution amount (leave 6 months reserves)
                     safe_distribution = min(
                         surplus_amount,
-                        working_capital - (self.decision_thresholds['cash_reserve_months'] * 
+                        working_capital - (self.cash_reserve_months * 
                                           (cash_balance / months_of_reserves))
                     )
                     
                     if safe_distribution > 50000:
-                        return ('DISTRIBUTE', safe_distribution, None)
+                        return (DECISION_DISTRIBUTE, safe_distribution, None)
                 
                 # Default: do nothing
-                return ('DO_NOTHING', None, None)
+                return _NO_ACTION
     
-    def _generate_executive_summary(self, decision: str, amount: float, projected_fcf: float,
-                                   cash_balance: float, months_of_reserves: float,
-                                   noi_ytd_variance_pct: float, noi_month_variance_pct: float,
-                                   expenses_ytd_variance_pct: float, seasonal_factor: Dict,
-                                   enrollment_trend: str, working_capital: float = 0,
-                                   current_liabilities: float = 0, current_assets: float = 0,
-                                   contribution_breakdown: Dict = None,
-                                   multi_month_analysis: Dict = None, current_distributions: float = 0) -> List[str]:
-        """Generate 5-7 executive summary bullet points supporting the decision"""
-        
-        bullets = []
+    def _iter_executive_summary(self, decision: str, amount: float, projected_fcf: float,
+                                cash_balance: float, months_of_reserves: float,
+                                noi_ytd_variance_pct: float, noi_month_variance_pct: float,
+                                expenses_ytd_variance_pct: float, econ: EconContext,
+                                working_capital: float = 0,
+                                current_liabilities: float = 0, current_assets: float = 0,
+                                contribution_breakdown: Dict = None,
+                                multi_month_analysis: Dict = None, current_distributions: float = 0,
+                                current_ratio: Optional[float] = None) -> Iterator[str]:
+        """Yield 5-7 executive summary bullet points supporting the decision, in display order"""
         
         # PRIORITY BULLET: Working capital assessment (contextual based on risk tolerance)
         if working_capital < 0:
-            current_ratio = current_assets / max(current_liabilities, 1)
-            wc_target_ratio = self.decision_thresholds.get('wc_target_ratio', 1.0)
+            if current_ratio is None:
+                current_ratio = current_assets / max(current_liabilities, 1)
+            wc_target_ratio = self.wc_target_ratio
             risk_label = self._get_risk_label()
             
             # Recent distribution context
             recent_dist_context = ""
             if current_distributions > 100000:
-                recent_dist_context = f" Note: Property distributed ${abs(current_distributions):,.0f} in the prior month, indicating management confidence in liquidity position."
+                recent_dist_context = _WC_RECENT_DISTRIBUTION.format(distributions=abs(current_distributions))
             
             # Contextual messaging based on how current ratio compares to target
             if current_ratio >= wc_target_ratio:
                 # Meeting or exceeding target - acknowledge but don't alarm
-                bullets.append(f"Working capital ratio of {current_ratio:.2f}:1 (current assets ${current_assets:,.0f}, liabilities ${current_liabilities:,.0f}) is **above the {risk_label} target of {wc_target_ratio:.2f}:1**, though below conventional 1.0:1 standard.{recent_dist_context}")
+                wc_template = _WC_ABOVE_TARGET
             elif current_ratio >= wc_target_ratio * 0.80:
                 # Within 20% of target - caution but not crisis
-                bullets.append(f"⚠️ Working capital ratio of {current_ratio:.2f}:1 is **slightly below the {risk_label} target of {wc_target_ratio:.2f}:1** (current assets ${current_assets:,.0f}, liabilities ${current_liabilities:,.0f}). Monitor closely and consider gradual reserve building.{recent_dist_context}")
+                wc_template = _WC_SLIGHTLY_BELOW_TARGET
             elif current_ratio >= 0.5:
                 # Below target but not critical
-                bullets.append(f"⚠️ **WORKING CAPITAL BELOW TARGET**: Current ratio of {current_ratio:.2f}:1 is below the {risk_label} requirement of {wc_target_ratio:.2f}:1 (current assets ${current_assets:,.0f}, liabilities ${current_liabilities:,.0f}). Recommend liability review and reserve building.{recent_dist_context}")
+                wc_template = _WC_BELOW_TARGET
             else:
                 # Severe - below widely accepted minimums
-                bullets.append(f"🚨 **WORKING CAPITAL CRISIS**: Current ratio of {current_ratio:.2f}:1 is critically low (current assets ${current_assets:,.0f}, liabilities ${current_liabilities:,.0f}). This indicates potential past-due obligations or structural cash flow problems. **FULL LIABILITY BREAKDOWN ANALYSIS REQUIRED BEFORE ANY CAPITAL DECISION**.{recent_dist_context}")
+                wc_template = _WC_CRISIS
+            yield wc_template.format(ratio=current_ratio, assets=current_assets, liabilities=current_liabilities,
+                                     risk_label=risk_label, target=wc_target_ratio, dist_context=recent_dist_context)
         
         # Bullet 1: The decision
-        if decision == 'CONTRIBUTE':
+        if decision == DECISION_CONTRIBUTE:
             if contribution_breakdown:
                 # Show transparent breakdown of contribution calculation
                 deficit = contribution_breakdown.get('projected_deficit', 0)
@@ -807,39 +1510,32 @@ class RecommendationEngine:
                 
                 if working_capital < -50000:
                     if months_forward > 0:
-                        bullets.append(f"**FORWARD-LOOKING CONTRIBUTION REQUIRED: ${amount:,.0f}** ({breakdown_text}). Rationale: {forward_reason}. This covers immediate crisis plus forward exposure until property stabilizes.")
+                        yield _CONTRIBUTE_FORWARD_BULLET.format(amount=amount, breakdown=breakdown_text, reason=forward_reason)
                     else:
-                        bullets.append(f"**PRELIMINARY ESTIMATE: ${amount:,.0f} contribution MAY BE NEEDED** ({breakdown_text}) - However, actual requirement depends on liability breakdown and root cause analysis")
+                        yield _CONTRIBUTE_PRELIMINARY_BULLET.format(amount=amount, breakdown=breakdown_text)
                 else:
-                    bullets.append(f"**RECOMMENDATION: CONTRIBUTE ${amount:,.0f}** to cover shortfall and maintain reserves. Breakdown: {breakdown_text}")
+                    yield _CONTRIBUTE_BULLET.format(amount=amount, breakdown=breakdown_text)
             else:
                 # Fallback if no breakdown available
                 if working_capital < -50000:
-                    bullets.append(f"**PRELIMINARY ESTIMATE: ${amount:,.0f} contribution MAY BE NEEDED** - However, this is based on incomplete analysis. Actual requirement depends on liability breakdown and root cause of working capital deficit")
+                    yield _CONTRIBUTE_PRELIMINARY_UNITEMIZED_BULLET.format(amount=amount)
                 else:
-                    bullets.append(f"**RECOMMENDATION: CONTRIBUTE ${amount:,.0f}** to cover projected cash shortfall and maintain adequate reserves")
-        elif decision == 'DISTRIBUTE':
-            bullets.append(f"**RECOMMENDATION: DISTRIBUTE ${amount:,.0f}** to partners based on strong performance and excess cash position")
+                    yield _CONTRIBUTE_UNITEMIZED_BULLET.format(amount=amount)
+        elif decision == DECISION_DISTRIBUTE:
+            yield _DISTRIBUTE_BULLET.format(amount=amount)
         else:
-            bullets.append(f"**RECOMMENDATION: NO ACTION REQUIRED** - Property cash position is stable and reserves are adequate")
+            yield _NO_ACTION_BULLET
         
         # Bullet 2: Projected cash flow (OPERATIONAL - excludes accountant's planned distributions/contributions)
-        fcf_disclaimer = "(excluding accountant's planned distributions/contributions)"
-        season = seasonal_factor.get('season', 'Unknown')
-        season_text = f" during {season}" if season != 'Unknown' else ""
-        
-        if projected_fcf < 0:
-            bullets.append(f"Projected Free Cash Flow shows deficit of ${abs(projected_fcf):,.0f} {fcf_disclaimer} for upcoming month{season_text}")
-        elif projected_fcf > 50000:  # Meaningful surplus
-            bullets.append(f"Projected Free Cash Flow shows surplus of ${projected_fcf:,.0f} {fcf_disclaimer}{season_text}, reflecting strong operational performance")
-        elif projected_fcf > 0:  # Small positive
-            bullets.append(f"Projected Free Cash Flow of ${projected_fcf:,.0f} {fcf_disclaimer}{season_text} indicates stable operations with minimal surplus")
-        else:  # Exactly 0
-            bullets.append(f"Projected Free Cash Flow breakeven {fcf_disclaimer}{season_text}, indicating operational balance without surplus or deficit")
+        for matches, template in _PROJECTED_FCF_BULLETS:
+            if matches(projected_fcf):
+                yield template.format(fcf=projected_fcf, abs_fcf=abs(projected_fcf),
+                                      disclaimer=_FCF_DISCLAIMER, season_text=econ.season_phrase)
+                break
         
         # Bullet 3: Liquidity position
-        reserve_status = "strong" if months_of_reserves > 10 else "adequate" if months_of_reserves > 6 else "tight"
-        bullets.append(f"Cash reserves of ${cash_balance:,.0f} provide {months_of_reserves:.1f} months of coverage - {reserve_status} liquidity position")
+        reserve_status = _RESERVE_LABELS[bisect.bisect_left(_RESERVE_BANDS, months_of_reserves)]
+        yield _RESERVE_POSITION_BULLET.format(cash_balance=cash_balance, months=months_of_reserves, status=reserve_status)
         
         # Bullet 3a: Voluntary reserve allocations (if significant and part of multi-month analysis)
         # This helps explain negative FCF when property is operationally healthy
@@ -851,163 +1547,122 @@ class RecommendationEngine:
             # Show reserve note if:
             # 1. Significant reserves are being set aside (>$50k total), AND
             # 2. Property is operationally healthy (avg FCF close to zero or positive, OR decision is DO_NOTHING)
-            if total_reserves > 50000 and (avg_fcf >= -20000 or decision == 'DO_NOTHING'):
+            if total_reserves > 50000 and (avg_fcf >= -20000 or decision == DECISION_DO_NOTHING):
                 avg_monthly_reserves = total_reserves / months_analyzed if months_analyzed > 0 else total_reserves
-                bullets.append(f"Accountant's budget includes ${total_reserves:,.0f} in voluntary reserve allocations across projected months (avg ${avg_monthly_reserves:,.0f}/month), impacting reported FCF but strengthening balance sheet sub-accounts")
+                yield _RESERVE_ALLOCATIONS_BULLET.format(total=total_reserves, average=avg_monthly_reserves)
         
         # Bullet 4: Operating performance (NOI)
         # Variance % = (actual - budget) / budget * 100
         # Positive variance = actual > budget = GOOD
         # Negative variance = actual < budget = BAD
-        if abs(noi_ytd_variance_pct) < 5:
-            bullets.append(f"Net Operating Income tracking within 5% of budget YTD ({noi_ytd_variance_pct:+.1f}%), indicating reliable budget assumptions")
-        elif noi_ytd_variance_pct > 5:
-            bullets.append(f"Net Operating Income exceeding budget by {noi_ytd_variance_pct:.1f}% YTD, demonstrating strong property performance")
-        else:  # noi_ytd_variance_pct < -5
-            bullets.append(f"Net Operating Income underperforming budget by {abs(noi_ytd_variance_pct):.1f}% YTD, with recent month at {noi_month_variance_pct:+.1f}% - monitor trend closely")
+        noi_template = _NOI_TEMPLATES[bisect.bisect_left(_NOI_BANDS, noi_ytd_variance_pct)]
+        yield noi_template.format(pct=noi_ytd_variance_pct, abs_pct=abs(noi_ytd_variance_pct),
+                                  month_pct=noi_month_variance_pct)
         
         # Bullet 5: Expense management
         # For expenses: negative variance = under budget = GOOD (spending less)
         # Positive variance = over budget = BAD (spending more)
-        if expenses_ytd_variance_pct < -5:
-            bullets.append(f"Operating expenses running {abs(expenses_ytd_variance_pct):.1f}% under budget YTD, contributing to favorable cash position")
-        elif expenses_ytd_variance_pct > 5:
-            bullets.append(f"Operating expenses {expenses_ytd_variance_pct:.1f}% over budget YTD - expense control measures recommended")
-        else:
-            bullets.append(f"Operating expenses tracking close to budget ({expenses_ytd_variance_pct:+.1f}% YTD)")
+        expense_template = _EXPENSE_TEMPLATES[_variance_sign(expenses_ytd_variance_pct) + 1]
+        yield expense_template.format(pct=expenses_ytd_variance_pct, abs_pct=abs(expenses_ytd_variance_pct))
         
         # Bullet 6: Market/seasonal context
-        season_desc = seasonal_factor.get('season', 'Current period')
-        expected_occ = seasonal_factor.get('expected_occupancy', 'Normal')
-        
-        # Clean up "Unable to determine" and "Unknown" values
-        if expected_occ in ['Unable to determine', 'Unknown']:
-            expected_occ = 'typical'
-        if season_desc == 'Unknown':
-            season_desc = 'Current period'
-            
-        if enrollment_trend == 'growing':
-            bullets.append(f"Market fundamentals are favorable: {season_desc} with {expected_occ} occupancy expected, supported by growing university enrollment")
-        elif enrollment_trend == 'declining':
-            bullets.append(f"Market headwinds present: {season_desc} period with enrollment declining - conservative cash management warranted")
-        else:
-            bullets.append(f"Seasonal context: {season_desc} with {expected_occ} occupancy expected under normal market conditions")
+        market_template = _MARKET_TEMPLATES.get(econ.enrollment_trend, _MARKET_DEFAULT_TEMPLATE)
+        yield market_template.format(season=econ.season_desc, occupancy=econ.expected_occupancy)
         
         # Bullet 7: Risk/opportunity note (conditional)
-        if decision == 'CONTRIBUTE':
-            bullets.append("Risk mitigation: Capital contribution ensures property can meet all obligations without stress on operations")
-        elif decision == 'DISTRIBUTE':
-            bullets.append("Distribution opportunity: Excess cash can be returned to partners while maintaining prudent reserve levels")
+        decision_note = _DECISION_NOTES.get(decision)
+        if decision_note is not None:
+            yield decision_note
         elif months_of_reserves < 6:
-            bullets.append("Monitor closely: While no immediate action needed, reserves are below optimal level - avoid distributions until reserves improve")
-        elif projected_fcf < 0 and seasonal_factor.get('season') != 'Summer Session':
-            bullets.append("Investigation recommended: Deficit during peak season may indicate budget assumption errors or one-time expenses requiring review")
-        
-        return bullets[:7]  # Return maximum 7 bullets
+            yield "Monitor closely: While no immediate action needed, reserves are below optimal level - avoid distributions until reserves improve"
+        elif projected_fcf < 0 and econ.season is not Season.SUMMER:
+            yield "Investigation recommended: Deficit during peak season may indicate budget assumption errors or one-time expenses requiring review"
     
     def _generate_detailed_rationale(self, cash_forecast_data: Dict, income_statement_data: Dict,
-                                    balance_sheet_data: Dict, economic_analysis: Dict,
+                                    balance_sheet_data: Dict, econ: EconContext,
                                     decision: str, amount: float, months_of_reserves: float,
                                     occupancy_adjustment_note: str = None, reserve_months: int = 6,
-                                    show_parameters: bool = True) -> Dict:
+                                    show_parameters: bool = True, wc_target_ratio: float = 1.0) -> Dict:
         """Generate detailed multi-page analysis"""
         
         rationale = {
-            'cash_forecast_analysis': self._format_cash_forecast_details(cash_forecast_data, reserve_months, show_parameters),
+            'cash_forecast_analysis': self._format_cash_forecast_details(cash_forecast_data, reserve_months, show_parameters, wc_target_ratio),
             'income_statement_analysis': self._format_income_statement_details(income_statement_data),
             'balance_sheet_analysis': self._format_balance_sheet_details(balance_sheet_data, months_of_reserves, reserve_months),
             'risk_assessment': self._generate_risk_assessment(
-                cash_forecast_data, income_statement_data, balance_sheet_data, economic_analysis, reserve_months
+                cash_forecast_data, income_statement_data, balance_sheet_data, econ, reserve_months
             ),
             'decision_rationale': self._format_decision_rationale(
                 decision, amount, cash_forecast_data, income_statement_data, 
-                balance_sheet_data, economic_analysis, months_of_reserves, reserve_months
+                balance_sheet_data, econ, months_of_reserves, reserve_months
             )
         }
         
         # Only include economic context if show_parameters is True
         if show_parameters:
-            rationale['economic_context'] = self._format_economic_context(economic_analysis)
+            rationale['economic_context'] = self._format_economic_context(econ)
         
         return rationale
     
-    def _format_cash_forecast_details(self, data: Dict, reserve_months: int = 6, show_parameters: bool = True) -> str:
+    def _format_cash_forecast_details(self, data: Dict, reserve_months: int = 6, show_parameters: bool = True,
+                                      wc_target_ratio: float = 1.0) -> str:
         """Format cash forecast section"""
         
         # Get risk label
-        risk_label = self._get_risk_label()
-        wc_target_ratio = self.decision_thresholds.get('wc_target_ratio', 1.0)
+        risk_label = self._get_risk_label(reserve_months)
+        
+        # Section text is collected in parts and joined once at the end
+        parts = []
         
         # Conditionally include Analysis Parameters section
         if show_parameters:
-            base_analysis = f"""
-ANALYSIS PARAMETERS
-{'='*78}
-
-Risk Selection: {risk_label}
-  - Reserve Months: {reserve_months} months
-  - Working Capital Target: {wc_target_ratio}:1 ratio
-
-{'='*78}
-CASH FORECAST ANALYSIS
-{'='*78}
-"""
+            parts.append(_CASH_PARAMETERS_TEMPLATE.format(
+                risk_label=risk_label, reserve_months=reserve_months, wc_target_ratio=wc_target_ratio
+            ))
         else:
-            base_analysis = f"""
-CASH FORECAST ANALYSIS
-{'='*78}
-"""
+            parts.append(_CASH_HEADER)
         
-        base_analysis += f"""
-Property: {data.get('property_name', 'Unknown')}
-Current Month: {data.get('current_month', 'Unknown')} (Actual)
-Projected Month: {data.get('projected_month', 'Unknown')} (Budget)
-
-Current Month Free Cash Flow: ${data.get('current_fcf', 0):,.2f}
-"""
-        
-        # Show operational vs after-distribution FCF if there's a forecasted distribution
+        current_fcf = data.get('current_fcf', 0)
+        projected_fcf = data.get('projected_fcf', 0)
         projected_distributions = data.get('projected_distributions', 0)
-        projected_operational_fcf = data.get('projected_operational_fcf', data.get('projected_fcf', 0))
+        projected_operational_fcf = data.get('projected_operational_fcf', projected_fcf)
         
+        parts.append(_CASH_OVERVIEW_TEMPLATE.format(
+            property_name=data.get('property_name', 'Unknown'),
+            current_month=data.get('current_month', 'Unknown'),
+            projected_month=data.get('projected_month', 'Unknown'),
+            current_fcf=_money(current_fcf),
+        ))
+        
+        # Show operational vs after-distribution FCF if there's a forecasted distribution
         if projected_distributions != 0:
             # Determine label based on sign: positive = contribution (in), negative = distribution (out)
-            before_label = "before contribution" if projected_distributions > 0 else "before distribution"
-            after_label = "after their contribution" if projected_distributions > 0 else "after their distribution"
-            
-            base_analysis += f"""
-Projected Month Analysis:
-  Operational FCF ({before_label}): ${projected_operational_fcf:,.2f}
-  
-Accountant's Recommendation:
-  Planned Distribution/Contribution:     ${projected_distributions:,.2f}
-  Net FCF ({after_label}):    ${data.get('projected_fcf', 0):,.2f}
-  
-Variance from Current Month: ${projected_operational_fcf - data.get('current_fcf', 0):,.2f}
-"""
+            is_contribution = projected_distributions > 0
+            parts.append(_CASH_PLANNED_DISTRIBUTION_TEMPLATE.format(
+                before_label="before contribution" if is_contribution else "before distribution",
+                after_label="after their contribution" if is_contribution else "after their distribution",
+                projected_operational_fcf=_money(projected_operational_fcf),
+                projected_distributions=projected_distributions,
+                projected_fcf=_money(projected_fcf),
+                variance=projected_operational_fcf - current_fcf,
+            ))
         else:
-            base_analysis += f"Projected Month Free Cash Flow: ${data.get('projected_fcf', 0):,.2f}\nVariance: ${data.get('projected_fcf', 0) - data.get('current_fcf', 0):,.2f}\n"
+            parts.append(_CASH_PROJECTED_TEMPLATE.format(
+                projected_fcf=_money(projected_fcf), variance=projected_fcf - current_fcf
+            ))
         
-        base_analysis += f"""
-Occupancy:
-  Current Actual: {data.get('current_occupancy', 0):.1f}%
-  Projected Budget: {data.get('projected_occupancy', 0):.1f}%
-
-Actual Distributions/Contributions in {data.get('current_month', 'Current Month')}: ${data.get('current_distributions', 0):,.2f}
-"""
+        parts.append(_CASH_OCCUPANCY_TEMPLATE.format(
+            current_occupancy=data.get('current_occupancy', 0),
+            projected_occupancy=data.get('projected_occupancy', 0),
+            distributions_month=data.get('current_month', 'Current Month'),
+            current_distributions=data.get('current_distributions', 0),
+        ))
         
         # Add projection data if available
         projected_months = data.get('projected_months', [])
         if projected_months:
             num_months = len(projected_months)
             
-            # Use operational FCF for statistics
-            total_operational_fcf = sum(m.get('operational_fcf', m['fcf']) for m in projected_months)
-            avg_operational_fcf = total_operational_fcf / num_months
-            lowest_month = min(projected_months, key=lambda x: x.get('operational_fcf', x['fcf']))
-            highest_month = max(projected_months, key=lambda x: x.get('operational_fcf', x['fcf']))
-            negative_operational_months = [m for m in projected_months if m.get('operational_fcf', m['fcf']) < 0]
-            
             # Dynamic section title based on actual months available
             if num_months == 1:
                 section_title = "NEXT MONTH CASH FLOW PROJECTION"
@@ -1016,52 +1671,72 @@ Actual Distributions/Contributions in {data.get('current_month', 'Current Month'
             else:
                 section_title = f"{num_months}-MONTH CASH FLOW PROJECTION"
             
-            projection_section = f"""
-{'='*78}
-{section_title}
-{'='*78}
-
-Analyzing next {num_months} month{'s' if num_months > 1 else ''} of projections:
-"""
+            plural = 's' if num_months > 1 else ''
+            parts.append(_PROJECTION_HEADER_TEMPLATE.format(
+                section_title=section_title, num_months=num_months, plural=plural
+            ))
+            
+            # Single pass over the projection: operational FCF statistics (total, extremes,
+            # sign counts), reserve allocations and the per-month rows
+            total_operational_fcf = 0
+            total_reserves = 0
+            positive_months = 0
+            negative_months = 0
+            lowest_month = highest_month = None
+            lowest_fcf = highest_fcf = 0
             for i, month in enumerate(projected_months, 1):
                 operational_fcf = month.get('operational_fcf', month['fcf'])
-                status_icon = "✓" if operational_fcf > 0 else "✗"
+                total_operational_fcf += operational_fcf
+                total_reserves += month.get('reserve_allocations', 0)
+                
+                if lowest_month is None or operational_fcf < lowest_fcf:
+                    lowest_month, lowest_fcf = month, operational_fcf
+                if highest_month is None or operational_fcf > highest_fcf:
+                    highest_month, highest_fcf = month, operational_fcf
+                
+                if operational_fcf > 0:
+                    positive_months += 1
+                    status_icon = "✓"
+                else:
+                    if operational_fcf < 0:
+                        negative_months += 1
+                    status_icon = "✗"
                 
                 # Show both values if there's a forecasted distribution/contribution
                 forecasted_dist = month.get('forecasted_distribution', 0)
                 if forecasted_dist != 0:
                     # Determine label based on sign: negative = distribution (out), positive = contribution (in)
                     dist_label = "After Contribution:" if forecasted_dist > 0 else "After Distribution:"
-                    projection_section += f"  {i}. {month['month']:<15} Operational FCF: ${operational_fcf:>12,.2f}  ({dist_label} ${month['fcf']:>12,.2f})  Occ: {month['occupancy']:>5.1f}%  {status_icon}\n"
+                    parts.append(_PROJECTION_ROW_PLANNED_TEMPLATE.format(
+                        index=i, month=month['month'], operational_fcf=operational_fcf, label=dist_label,
+                        fcf=month['fcf'], occupancy=month['occupancy'], icon=status_icon
+                    ))
                 else:
-                    projection_section += f"  {i}. {month['month']:<15} FCF: ${month['fcf']:>12,.2f}  Occ: {month['occupancy']:>5.1f}%  {status_icon}\n"
+                    parts.append(_PROJECTION_ROW_TEMPLATE.format(
+                        index=i, month=month['month'], fcf=month['fcf'], occupancy=month['occupancy'], icon=status_icon
+                    ))
             
-            # Calculate total reserve allocations across all projected months
-            total_reserves = sum(m.get('reserve_allocations', 0) for m in projected_months)
+            avg_operational_fcf = total_operational_fcf / num_months
             
-            projection_section += f"""
-Summary Statistics (Operational FCF):
-  Total Projected FCF ({num_months} month{'s' if num_months > 1 else ''}): ${total_operational_fcf:,.2f}
-  Average Monthly FCF:            ${avg_operational_fcf:,.2f}
-  Highest Month:                  {highest_month['month']} (${highest_month.get('operational_fcf', highest_month['fcf']):,.2f})
-  Lowest Month:                   {lowest_month['month']} (${lowest_month.get('operational_fcf', lowest_month['fcf']):,.2f})
-  Positive Months:                {len([m for m in projected_months if m.get('operational_fcf', m['fcf']) > 0])} of {num_months}
-  Negative Months:                {len(negative_operational_months)}
-"""
+            parts.append(_PROJECTION_SUMMARY_TEMPLATE.format(
+                num_months=num_months, plural=plural,
+                total=total_operational_fcf, average=avg_operational_fcf,
+                highest_month=highest_month['month'], highest_fcf=highest_fcf,
+                lowest_month=lowest_month['month'], lowest_fcf=lowest_fcf,
+                positive_months=positive_months, negative_months=negative_months,
+            ))
             if total_reserves > 0:
                 avg_reserves = total_reserves / num_months
-                projection_section += f"  Voluntary Reserve Allocations: ${total_reserves:,.2f} total (avg ${avg_reserves:,.2f}/month)\n"
+                parts.append(f"  Voluntary Reserve Allocations: ${total_reserves:,.2f} total (avg ${avg_reserves:,.2f}/month)\n")
             
-            if negative_operational_months:
-                projection_section += f"  ⚠️  Warning: {len(negative_operational_months)} month(s) show negative cash flow\n"
-            
-            base_analysis += projection_section
+            if negative_months:
+                parts.append(f"  ⚠️  Warning: {negative_months} month(s) show negative cash flow\n")
         
-        base_analysis += f"""
+        parts.append(f"""
 INTERPRETATION:
 {self._interpret_cash_forecast(data)}
-"""
-        return base_analysis
+""")
+        return "".join(parts)
     
     def _format_income_statement_details(self, data: Dict) -> str:
         """Format income statement section"""
@@ -1070,23 +1745,10 @@ INTERPRETATION:
         ytd_period = data.get('ytd_period', 'Jan-Sep')
         year = reporting_month.split()[-1] if reporting_month != 'Unknown' else '2025'
         
-        return f"""
-INCOME STATEMENT ANALYSIS
-{'='*78}
-
-{reporting_month} Performance (Month):
-  Total Operating Income:  ${data.get('income_month_actual', 0):,.2f} vs ${data.get('income_month_budget', 0):,.2f} budget ({data.get('income_month_variance_pct', 0):+.2f}%)
-  Total Operating Expenses: ${data.get('expenses_month_actual', 0):,.2f} vs ${data.get('expenses_month_budget', 0):,.2f} budget ({data.get('expenses_month_variance_pct', 0):+.2f}%)
-  Net Operating Income:     ${data.get('noi_month_actual', 0):,.2f} vs ${data.get('noi_month_budget', 0):,.2f} budget ({data.get('noi_month_variance_pct', 0):+.2f}%)
-
-Year-to-Date {year} Performance ({ytd_period}):
-  Total Operating Income:  ${data.get('income_ytd_actual', 0):,.2f} vs ${data.get('income_ytd_budget', 0):,.2f} budget ({data.get('income_ytd_variance_pct', 0):+.2f}%)
-  Total Operating Expenses: ${data.get('expenses_ytd_actual', 0):,.2f} vs ${data.get('expenses_ytd_budget', 0):,.2f} budget ({data.get('expenses_ytd_variance_pct', 0):+.2f}%)
-  Net Operating Income:     ${data.get('noi_ytd_actual', 0):,.2f} vs ${data.get('noi_ytd_budget', 0):,.2f} budget ({data.get('noi_ytd_variance_pct', 0):+.2f}%)
-
-INTERPRETATION:
-{self._interpret_income_statement(data)}
-"""
+        ctx = {field: data.get(field, 0) for field in _INCOME_STATEMENT_FIELDS}
+        ctx.update(reporting_month=reporting_month, ytd_period=ytd_period, year=year,
+                   interpretation=self._interpret_income_statement(data))
+        return _INCOME_STATEMENT_TEMPLATE.format_map(ctx)
     
     def _format_balance_sheet_details(self, data: Dict, months_of_reserves: float, reserve_months: int = 6) -> str:
         """Format balance sheet section"""
@@ -1100,111 +1762,75 @@ INTERPRETATION:
             year = month_year[1]
             
             # Get prior month name
-            months = ['January', 'February', 'March', 'April', 'May', 'June',
-                     'July', 'August', 'September', 'October', 'November', 'December']
-            try:
-                current_idx = months.index(current_month_name)
-                prior_month_name = months[current_idx - 1] if current_idx > 0 else 'December'
-                prior_year = year if current_idx > 0 else str(int(year) - 1)
-                prior_month = f"{prior_month_name} {prior_year}"
-            except ValueError:
+            prior_month_name = _PRIOR_MONTH_SAME_YEAR.get(current_month_name)
+            if prior_month_name is not None:
+                prior_month = f"{prior_month_name} {year}"
+            elif current_month_name in _MONTH_INDEX:
+                # January rolls back to December of the previous year
+                try:
+                    prior_month = f"December {int(year) - 1}"
+                except ValueError:
+                    prior_month = "Prior Month"
+            else:
                 prior_month = "Prior Month"
         else:
             current_month_name = reporting_month
             prior_month = "Prior Month"
         
-        return f"""
-BALANCE SHEET ANALYSIS
-{'='*78}
-
-Liquidity Position ({reporting_month}):
-  Cash and Cash Equivalents: ${data.get('cash_balance', 0):,.2f}
-  Accounts Receivable:       ${data.get('accounts_receivable', 0):,.2f}
-  Prepaid Expenses:          ${data.get('prepaid_expenses', 0):,.2f}
-  Other Current Assets:      ${data.get('other_current_assets', 0):,.2f}
-  Total Current Assets:      ${data.get('cash_balance', 0) + data.get('accounts_receivable', 0) + data.get('prepaid_expenses', 0) + data.get('other_current_assets', 0):,.2f}
-  
-  Current Liabilities:       ${data.get('current_liabilities', 0):,.2f}
-  Working Capital:           ${(data.get('cash_balance', 0) + data.get('accounts_receivable', 0) + data.get('prepaid_expenses', 0) + data.get('other_current_assets', 0)) - data.get('current_liabilities', 0):,.2f}
-  Current Ratio:             {(data.get('cash_balance', 0) + data.get('accounts_receivable', 0) + data.get('prepaid_expenses', 0) + data.get('other_current_assets', 0)) / max(data.get('current_liabilities', 1), 1):.2f}:1
-
-Debt Position:
-  Total Notes Payable:       ${data.get('total_debt', 0):,.2f}
-  Monthly Principal Payment: ${data.get('monthly_principal', 0):,.2f}
-  Accrued Interest:          ${data.get('accrued_interest', 0):,.2f}
-  Est. Monthly Debt Service: ${data.get('monthly_debt_service', 0):,.2f}
-
-Reserve Analysis:
-  Months of Reserves:        {months_of_reserves:.1f} months
-  Assessment:                {"STRONG (>10 months)" if months_of_reserves > 10 else f"ADEQUATE ({reserve_months}-10 months)" if months_of_reserves > reserve_months else f"TIGHT (<{reserve_months} months)"}
-
-Month-over-Month Cash Change:
-  {prior_month} Cash:          ${data.get('cash_prior_month', 0):,.2f}
-  {reporting_month} Cash:       ${data.get('cash_balance', 0):,.2f}
-  Change:                    ${data.get('cash_balance', 0) - data.get('cash_prior_month', 0):,.2f} ({((data.get('cash_balance', 0) - data.get('cash_prior_month', 0)) / max(data.get('cash_prior_month', 1), 1) * 100):+.1f}%)
-
-INTERPRETATION:
-{self._interpret_balance_sheet(data, months_of_reserves, reserve_months)}
-"""
+        cash = data.get('cash_balance', 0)
+        accounts_receivable = data.get('accounts_receivable', 0)
+        current_liabilities = data.get('current_liabilities', 0)
+        cash_prior_month = data.get('cash_prior_month', 0)
+        
+        prepaid_expenses = data.get('prepaid_expenses', 0)
+        other_current_assets = data.get('other_current_assets', 0)
+        current_assets = cash + accounts_receivable + prepaid_expenses + other_current_assets
+        cash_change = cash - cash_prior_month
+        
+        # Dollar amounts are pre-formatted through the shared _money cache
+        ctx = {
+            'reporting_month': reporting_month,
+            'prior_month': prior_month,
+            'cash': _money(cash),
+            'accounts_receivable': _money(accounts_receivable),
+            'prepaid_expenses': _money(prepaid_expenses),
+            'other_current_assets': _money(other_current_assets),
+            'current_assets': _money(current_assets),
+            'current_liabilities': _money(current_liabilities),
+            'working_capital': _money(current_assets - current_liabilities),
+            'current_ratio': current_assets / max(current_liabilities, 1),
+            'total_debt': _money(data.get('total_debt', 0)),
+            'monthly_principal': _money(data.get('monthly_principal', 0)),
+            'accrued_interest': _money(data.get('accrued_interest', 0)),
+            'monthly_debt_service': _money(data.get('monthly_debt_service', 0)),
+            'months_of_reserves': months_of_reserves,
+            'cash_prior_month': _money(cash_prior_month),
+            'cash_change': _money(cash_change),
+        }
+        ctx['cash_change_pct'] = cash_change / max(cash_prior_month, 1) * 100
+        
+        # One reserve classification feeds both the assessment line and the interpretation
+        reserve_class = _classify_reserves(months_of_reserves, reserve_months)
+        ctx['assessment'] = reserve_class[0].format(reserve_months=reserve_months)
+        
+        # Interpretation quotes the cash + receivables ratio
+        liquid_ratio = (cash + accounts_receivable) / max(current_liabilities, 1)
+        ctx['interpretation'] = self._interpret_balance_sheet(data, months_of_reserves, reserve_months,
+                                                             liquid_ratio, reserve_class)
+        
+        return _BALANCE_SHEET_TEMPLATE.format_map(ctx)
     
-    def _format_economic_context(self, data: Dict) -> str:
+    def _format_economic_context(self, econ: EconContext) -> str:
         """Format economic analysis section"""
-        analysis_text = data.get('full_analysis', 'Economic analysis not available')
-        
-        return f"""
-ECONOMIC & MARKET CONTEXT
-{'='*78}
-
-{analysis_text}
-"""
+        return _ECONOMIC_CONTEXT_HEADER + econ.full_analysis + "\n"
     
     def _generate_risk_assessment(self, cash_data: Dict, income_data: Dict, 
-                                  balance_data: Dict, econ_data: Dict, reserve_months: int = 6) -> str:
+                                  balance_data: Dict, econ: EconContext, reserve_months: int = 6) -> str:
         """Generate risk assessment section"""
-        risks = []
-        
-        # Cash flow risks
-        if cash_data.get('projected_fcf', 0) < 0:
-            risks.append("• Projected cash flow deficit may require liquidity support if trend continues")
-        
-        # Performance risks
-        if income_data.get('noi_month_variance_pct', 0) < -10:
-            risks.append("• Recent monthly NOI significantly below budget - investigate root causes")
-        
-        # Expense variance: positive = over budget (BAD), negative = under budget (GOOD)
-        if income_data.get('expenses_ytd_variance_pct', 0) > 10:
-            risks.append("• Operating expenses significantly over budget - expense control measures needed")
-        
-        # Liquidity risks
-        months_reserves = balance_data.get('months_of_reserves', 999)
-        if months_reserves < reserve_months:
-            risks.append(f"• Reserve levels below recommended {reserve_months}-month minimum - limits financial flexibility")
-        
-        # Market risks
-        if econ_data.get('enrollment_trend') == 'declining':
-            risks.append("• University enrollment declining - may pressure occupancy and rental rates")
-        
-        if econ_data.get('new_supply', False):
-            risks.append("• New competing properties entering market - may require pricing/concession strategies")
-        
-        if not risks:
-            risks.append("• No material risks identified - property showing stable performance")
-        
-        return f"""
-RISK ASSESSMENT
-{'='*78}
-
-Key Risks Identified:
-
-{chr(10).join(risks)}
-
-Risk Mitigation Strategies:
-• Maintain minimum {reserve_months} months operating reserves in cash
-• Monitor monthly performance trends for early warning signs
-• Review budget assumptions quarterly and adjust projections
-• Maintain competitive market position through property improvements and resident services
-• Ensure adequate insurance coverage and contingency planning
-"""
+        risks = [message.format(reserve_months=reserve_months)
+                 for matches, message in _RISK_RULES
+                 if matches(cash_data, income_data, balance_data, econ, reserve_months)]
+        return _RISK_TEMPLATE.format(risks="\n".join(risks or (_RISK_NONE,)), reserve_months=reserve_months)
     
     def _generate_accountant_comparison(self, decision: str, amount: float, cash_data: Dict, 
                                         balance_data: Dict, months_of_reserves: float, 
@@ -1217,7 +1843,8 @@ Risk Mitigation Strategies:
             return ""  # No accountant recommendation to compare
         
         # Determine accountant's recommendation
-        if projected_distributions < 0:
+        accountant_distributes = projected_distributions < 0
+        if accountant_distributes:
             accountant_action = "DISTRIBUTION"
             accountant_amount = abs(projected_distributions)
         else:
@@ -1228,7 +1855,7 @@ Risk Mitigation Strategies:
         comparison = f"""
 
 COMPARISON WITH ACCOUNTANT'S RECOMMENDATION:
-{'-'*78}
+{_SUBRULE}
 
 Accountant's Recommendation: {accountant_action} of ${accountant_amount:,.2f}
 Our Recommendation: {decision.replace('_', ' ')} {f'of ${amount:,.2f}' if amount else ''}
@@ -1236,7 +1863,7 @@ Our Recommendation: {decision.replace('_', ' ')} {f'of ${amount:,.2f}' if amount
 """
         
         # Analysis of difference
-        if decision == 'CONTRIBUTE' and accountant_action == "DISTRIBUTION":
+        if decision == DECISION_CONTRIBUTE and accountant_distributes:
             comparison += f"""RATIONALE FOR DISAGREEMENT:
 While the accountant has planned a distribution, we recommend a contribution because:
 
@@ -1246,7 +1873,7 @@ While the accountant has planned a distribution, we recommend a contribution bec
 • Working capital position requires restoration before any distributions can be considered
 • The planned distribution appears to ignore the underlying cash flow deficit
 """
-        elif decision == 'CONTRIBUTE' and accountant_action == "CONTRIBUTION":
+        elif decision == DECISION_CONTRIBUTE and not accountant_distributes:
             diff = amount - accountant_amount
             if diff > 0:
                 comparison += f"""RATIONALE FOR HIGHER CONTRIBUTION:
@@ -1265,7 +1892,7 @@ We recommend a LOWER contribution (${abs(diff):,.2f} less) because:
 • Property's operational metrics support a measured approach
 • Recommend monitoring before committing additional capital beyond our assessed need
 """
-        elif decision == 'DISTRIBUTE' and accountant_action == "DISTRIBUTION":
+        elif decision == DECISION_DISTRIBUTE and accountant_distributes:
             diff = amount - accountant_amount
             if abs(diff) < 10000:
                 comparison += """ALIGNMENT WITH ACCOUNTANT:
@@ -1288,7 +1915,7 @@ We recommend a LOWER distribution (${abs(diff):,.2f} less) because:
 • Market conditions or upcoming expenses warrant retaining additional cash
 • Ensures reserves remain well above minimum {reserve_months}-month requirement
 """
-        elif decision == 'DO_NOTHING' and accountant_action == "DISTRIBUTION":
+        elif decision == DECISION_DO_NOTHING and accountant_distributes:
             current_cash = balance_data.get('cash_balance', 0)
             cash_after_fcf = current_cash + projected_operational_fcf
             cash_after_distribution = cash_after_fcf - accountant_amount
@@ -1305,7 +1932,7 @@ We recommend NO distribution despite the accountant's plan because:
 • Operational cash flow should be RETAINED to strengthen financial position
 • Distributions should be deferred until reserve targets are achieved
 """
-        elif decision == 'DO_NOTHING' and accountant_action == "CONTRIBUTION":
+        elif decision == DECISION_DO_NOTHING and not accountant_distributes:
             comparison += f"""RATIONALE FOR NO ACTION:
 We recommend NO action while the accountant suggests a contribution because:
 
@@ -1319,119 +1946,58 @@ We recommend NO action while the accountant suggests a contribution because:
     
     def _format_decision_rationale(self, decision: str, amount: float, 
                                   cash_data: Dict, income_data: Dict,
-                                  balance_data: Dict, econ_data: Dict,
+                                  balance_data: Dict, econ: EconContext,
                                   months_of_reserves: float, reserve_months: int = 6) -> str:
         """Format the final decision rationale"""
+        # Fields shared by every decision template, computed once ahead of the dispatch
+        ctx = {
+            'reserve_months': reserve_months,
+            'market': econ.market_condition,
+            'comparison': self._generate_accountant_comparison(decision, amount, cash_data, balance_data, months_of_reserves, reserve_months),
+        }
         
-        if decision == 'CONTRIBUTE':
-            return f"""
-DECISION RATIONALE: CAPITAL CONTRIBUTION REQUIRED
-{'='*78}
-
-Recommended Contribution Amount: ${amount:,.2f}
-
-This recommendation is based on the following factors:
-
-1. PROJECTED CASH SHORTFALL
-   - The property is projected to have negative free cash flow in the upcoming month
-   - Without additional capital, the property may need to draw on reserves
-   - The contribution amount includes a buffer to ensure smooth operations
-
-2. RESERVE LEVELS
-   - Current reserves may be insufficient to comfortably absorb the projected deficit
-   - Maintaining adequate liquidity is essential for operational stability
-   - Capital contribution prevents depletion of cash reserves below prudent levels
-
-3. MARKET CONDITIONS
-   - {self._get_market_condition_text(econ_data)}
-
-4. ALTERNATIVE CONSIDERATIONS
-   - Could defer non-essential expenditures to preserve cash
-   - Could draw on existing reserves if shortfall is truly temporary
-   - Could arrange short-term credit facility instead of equity contribution
-{self._generate_accountant_comparison(decision, amount, cash_data, balance_data, months_of_reserves, reserve_months)}
-RECOMMENDED ACTION:
-Wire ${amount:,.2f} to property operating account within 10 business days to ensure
-adequate cash is available for upcoming month obligations.
-"""
-        
-        elif decision == 'DISTRIBUTE':
-            return f"""
-DECISION RATIONALE: CASH DISTRIBUTION RECOMMENDED
-{'='*78}
-
-Recommended Distribution Amount: ${amount:,.2f}
-
-This recommendation is based on the following factors:
-
-1. STRONG CASH POSITION
-   - Property has generated surplus cash flow beyond operational needs
-   - Current reserves exceed recommended minimum by comfortable margin
-   - Distribution will not impair financial flexibility or operational capability
-
-2. OPERATING PERFORMANCE
-   - Net Operating Income {income_data.get('noi_ytd_variance_pct', 0):+.1f}% vs budget demonstrates strong performance
-   - Expense management effective with costs tracking to budget
-   - Revenue performance supports sustainable cash generation
-
-3. RESERVE ADEQUACY POST-DISTRIBUTION
-   - After distribution, reserves will remain at {self._calculate_reserves_after_distribution(balance_data, amount):.1f} months
-   - This {'exceeds' if self._calculate_reserves_after_distribution(balance_data, amount) >= reserve_months else 'maintains'} the {reserve_months}-month minimum reserve requirement
-   - Property retains adequate cushion for unexpected expenses or market changes
-
-4. MARKET CONDITIONS
-   - {self._get_market_condition_text(econ_data)}
-{self._generate_accountant_comparison(decision, amount, cash_data, balance_data, months_of_reserves, reserve_months)}
-RECOMMENDED ACTION:
-Process distribution of ${amount:,.2f} to partners according to ownership percentages.
-Maintain minimum ${balance_data.get('cash_balance', 0) - amount:,.2f} in operating account post-distribution.
-"""
+        if decision == DECISION_CONTRIBUTE:
+            ctx['amount'] = amount
+            return _CONTRIBUTE_TEMPLATE.format_map(ctx)
+        
+        elif decision == DECISION_DISTRIBUTE:
+            reserves_after = self._calculate_reserves_after_distribution(balance_data, amount)
+            ctx.update({
+                'amount': amount,
+                'noi_ytd_var': income_data.get('noi_ytd_variance_pct', 0),
+                'reserves_after': reserves_after,
+                'reserves_cmp': 'exceeds' if reserves_after >= reserve_months else 'maintains',
+                'cash_after_distribution': balance_data.get('cash_balance', 0) - amount,
+            })
+            return _DISTRIBUTE_TEMPLATE.format_map(ctx)
         
         else:  # DO_NOTHING
-            return f"""
-DECISION RATIONALE: NO ACTION REQUIRED
-{'='*78}
-
-No capital contribution or distribution is recommended at this time.
-
-This recommendation is based on the following factors:
-
-1. RESERVE POSITION
-   - Current reserves of ${balance_data.get('cash_balance', 0):,.2f} provide {months_of_reserves:.1f} months of coverage
-   - This is {'WELL BELOW' if months_of_reserves < reserve_months else ('BELOW' if months_of_reserves < reserve_months * 1.5 else 'ABOVE')} the {reserve_months}-month minimum reserve requirement
-   - {'Projected deficit is minor and well within reserve capacity' if cash_data.get('projected_fcf', 0) < 0 else 'Projected operational cash flow should be retained to build reserves'}
-
-2. OPERATIONAL PERFORMANCE
-   - Property operating within expected parameters
-   - {'Any variances from budget are not material to cash position' if abs(income_data.get('noi_ytd_variance_pct', 0)) < 10 else 'Performance variances warrant monitoring but not immediate action'}
-
-3. PRUDENT CASH MANAGEMENT
-   - Priority is building reserves to minimum {reserve_months}-month level
-   - Distributions should be deferred until reserve target is achieved
-   - Strengthening liquidity position provides financial flexibility for unexpected expenses
-
-4. MARKET CONDITIONS
-   - {self._get_market_condition_text(econ_data)}
-{self._generate_accountant_comparison(decision, amount, cash_data, balance_data, months_of_reserves, reserve_months)}
-RECOMMENDED ACTION:
-Continue normal operations and RETAIN operational cash flow to build reserves.
-Monitor monthly performance and reassess distribution potential once reserves reach {reserve_months}+ months.
-{'Consider distribution if surplus pattern continues AND reserves exceed ' + str(reserve_months) + ' months.' if cash_data.get('projected_fcf', 0) > 50000 else ''}
-{'Review budget assumptions if deficit pattern emerges.' if cash_data.get('projected_fcf', 0) < 0 else ''}
-"""
-    
-    def _get_market_condition_text(self, econ_data: Dict) -> str:
-        """Get market condition summary text"""
-        if econ_data.get('enrollment_trend') == 'growing':
-            return "University enrollment growing and market fundamentals are favorable"
-        elif econ_data.get('enrollment_trend') == 'declining':
-            return "University enrollment declining - conservative cash management prudent"
-        else:
-            return "Market conditions stable with normal seasonal patterns expected"
+            projected_fcf = cash_data.get('projected_fcf', 0)
+            if months_of_reserves < reserve_months:
+                reserves_cmp = 'WELL BELOW'
+            elif months_of_reserves < reserve_months * 1.5:
+                reserves_cmp = 'BELOW'
+            else:
+                reserves_cmp = 'ABOVE'
+            ctx.update({
+                'cash_balance': balance_data.get('cash_balance', 0),
+                'months_of_reserves': months_of_reserves,
+                'reserves_cmp': reserves_cmp,
+                'cash_flow_note': ('Projected deficit is minor and well within reserve capacity' if projected_fcf < 0
+                                   else 'Projected operational cash flow should be retained to build reserves'),
+                'variance_note': ('Any variances from budget are not material to cash position'
+                                  if abs(income_data.get('noi_ytd_variance_pct', 0)) < 10
+                                  else 'Performance variances warrant monitoring but not immediate action'),
+                'surplus_note': ('Consider distribution if surplus pattern continues AND reserves exceed ' + str(reserve_months) + ' months.'
+                                 if projected_fcf > 50000 else ''),
+                'deficit_note': 'Review budget assumptions if deficit pattern emerges.' if projected_fcf < 0 else '',
+            })
+            return _DO_NOTHING_TEMPLATE.format_map(ctx)
     
-    def _get_risk_label(self) -> str:
-        """Get user-friendly risk level label based on reserve months"""
-        reserve_months = self.decision_thresholds.get('cash_reserve_months', 6)
+    def _get_risk_label(self, reserve_months: Optional[int] = None) -> str:
+        """Get user-friendly risk level label based on reserve months (default: current selection)"""
+        if reserve_months is None:
+            reserve_months = self.cash_reserve_months
         if reserve_months <= 2:
             return "Low Risk"
         elif reserve_months <= 4:
@@ -1464,15 +2030,15 @@ Monitor monthly performance and reassess distribution potential once reserves re
                 base_text += f" However, this month includes ${first_month_reserves:,.2f} in voluntary reserve allocations (such as insurance, tax reserves, prepaid expenses, etc.) which are balance sheet transfers that reduce FCF but strengthen reserves. The underlying operational performance remains stable."
             else:
                 # Standard deficit interpretation
-                base_text += f" This represents a significant variance from the current month's positive cash flow of ${current_fcf:,.2f}. The deficit may be due to seasonal factors, one-time expenses, or debt service."
+                base_text += f" This represents a significant variance from the current month's positive cash flow of ${_money(current_fcf)}. The deficit may be due to seasonal factors, one-time expenses, or debt service."
             
             return base_text
         else:
-            base_text = f"The projected month shows positive operational free cash flow of ${projected_operational_fcf:,.2f}, consistent with the current month's performance of ${current_fcf:,.2f}. This indicates stable cash generation capability."
+            base_text = f"The projected month shows positive operational free cash flow of ${_money(projected_operational_fcf)}, consistent with the current month's performance of ${_money(current_fcf)}. This indicates stable cash generation capability."
             
             # Add note about accountant's planned distribution if present
             if projected_distributions < 0:  # Negative = distribution
-                base_text += f" Note: The accountant has planned a ${abs(projected_distributions):,.2f} distribution for this month, which would result in net FCF of ${projected_fcf:,.2f}."
+                base_text += f" Note: The accountant has planned a ${abs(projected_distributions):,.2f} distribution for this month, which would result in net FCF of ${_money(projected_fcf)}."
             
             return base_text
     
@@ -1487,23 +2053,44 @@ Monitor monthly performance and reassess distribution potential once reserves re
         noi_month_var = data.get('noi_month_variance_pct', 0)
         
         if abs(noi_ytd_var) < 5 and abs(noi_month_var) < 5:
-            return "Operating performance is tracking close to budget both YTD and for the recent month, indicating reliable budget assumptions and stable operations."
-        elif noi_ytd_var > 5:
-            return f"Property is outperforming budget with NOI {noi_ytd_var:+.1f}% above plan YTD. Recent month showed {noi_month_var:+.1f}% variance, {'continuing strong performance' if noi_month_var > 0 else 'with some recent softness to monitor'}."
-        elif noi_ytd_var < -5:
-            return f"Property is underperforming budget with NOI at {noi_ytd_var:.1f}% of plan YTD. Recent month at {noi_month_var:+.1f}% indicates {'improvement trend' if noi_month_var > noi_ytd_var else 'continued weakness'}. Review revenue and expense drivers."
+            return _NOI_ON_PLAN
+        
+        ytd_sign = _variance_sign(noi_ytd_var)
+        if ytd_sign > 0:
+            trend = 'continuing strong performance' if noi_month_var > 0 else 'with some recent softness to monitor'
+        elif ytd_sign < 0:
+            trend = 'improvement trend' if noi_month_var > noi_ytd_var else 'continued weakness'
         else:
             # Between -5 and +5 but monthly variance is significant
-            return f"Operating performance tracking close to budget YTD ({noi_ytd_var:+.1f}%), though recent month shows {noi_month_var:+.1f}% variance requiring attention."
+            trend = ''
+        return _NOI_INTERPRETATIONS[ytd_sign].format(ytd=noi_ytd_var, month=noi_month_var, trend=trend)
     
-    def _interpret_balance_sheet(self, data: Dict, months_of_reserves: float, reserve_months: int = 6) -> str:
-        """Interpret balance sheet data"""
-        if months_of_reserves > 10:
-            return f"Liquidity position is very strong with {months_of_reserves:.1f} months of reserves. The property has ample cushion to absorb unexpected expenses or temporary cash flow disruptions. Current ratio of {(data.get('cash_balance', 0) + data.get('accounts_receivable', 0)) / max(data.get('current_liabilities', 1), 1):.2f}:1 exceeds recommended minimum of 1.5:1."
-        elif months_of_reserves > reserve_months:
-            return f"Liquidity position is adequate with {months_of_reserves:.1f} months of reserves. The property can handle normal business fluctuations and minor unexpected expenses. Maintain current reserve levels."
-        else:
-            return f"Liquidity position is tight with only {months_of_reserves:.1f} months of reserves. Property has limited cushion for unexpected expenses. Avoid distributions and build reserves through retained cash flow."
+    def _interpret_balance_sheet(self, data: Dict, months_of_reserves: float, reserve_months: int = 6,
+                                 current_ratio: Optional[float] = None,
+                                 reserve_class: Optional[Tuple[str, str]] = None) -> str:
+        """Interpret balance sheet data
+        
+        current_ratio is the (cash + receivables) / current liabilities ratio and
+        reserve_class the _classify_reserves() tier; each is derived here when the
+        caller has not already computed it.
+        """
+        if reserve_class is None:
+            reserve_class = _classify_reserves(months_of_reserves, reserve_months)
+        if reserve_class is _RESERVE_STRONG and current_ratio is None:
+            current_ratio = (data.get('cash_balance', 0) + data.get('accounts_receivable', 0)) / max(data.get('current_liabilities', 0), 1)
+        return reserve_class[1].format(months=months_of_reserves, ratio=current_ratio)
+
+
+# Engine reused for every scenario a process-pool worker handles (see analyze_batch)
+_worker_engine: Optional[RecommendationEngine] = None
+
+
+def _analyze_in_worker(scenario: Tuple) -> RecommendationResult:
+    """Process-pool entry point: analyze one portfolio scenario with this process's engine"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = RecommendationEngine()
+    return _worker_engine._analyze_tuple(scenario)
 
 
 if __name__ == "__main__":
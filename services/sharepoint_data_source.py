@@ -4,16 +4,187 @@ Connects to SharePoint Online list for property data lookup
 """
 
 import os
+import atexit
+import base64
+import functools
+import hashlib
+import json
 import logging
+import queue
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 from office365.sharepoint.client_context import ClientContext
 from office365.sharepoint.lists.list import CamlQuery
 from office365.runtime.auth.token_response import TokenResponse
 
 logger = logging.getLogger(__name__)
 
+# Columns read from the property list; queries project to these instead of fetching whole rows
+_PROPERTY_FIELDS = ['ENTITY_NUMBER', 'PROPERTY_NAME', 'ADDRESS_1', 'ADDRESS_2',
+                   'ADDRESS_CITY', 'ADDRESS_STATE', 'ADDRESS_ZIP', 'SCHOOL_NAME']
+
+# Address columns, in display order: ADDRESS_1[, ADDRESS_2], ADDRESS_CITY, ADDRESS_STATE
+_ADDRESS_FIELDS = ('ADDRESS_1', 'ADDRESS_2', 'ADDRESS_CITY', 'ADDRESS_STATE')
+
+# Keep-alive connection pool for Microsoft Graph and SharePoint REST calls, shared by all data
+# source instances (requests already negotiates gzip/deflate). The office365 client issues its own requests.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Seconds test_connection (the /test-db check) waits for SharePoint
+_CONNECTION_TEST_TIMEOUT = 5
+
+# Graph site/list IDs never change for a given site URL / list name, so they are resolved once
+# per process rather than once per data source (request): ('site', site_url) or ('list', site_id, name)
+_graph_id_cache: Dict[tuple, str] = {}
+
+# Reportable properties for the dropdown (FLAG_REPORTABLE = 1), built once at import.
+# list_all_properties only serializes it into the request payload, so it is safe to share.
+_REPORTABLE_CAML = CamlQuery.parse("""
+    <View>
+        <ViewFields>
+            <FieldRef Name='ENTITY_NUMBER'/>
+            <FieldRef Name='PROPERTY_NAME'/>
+        </ViewFields>
+        <Query>
+            <Where>
+                <Eq>
+                    <FieldRef Name='FLAG_REPORTABLE'/>
+                    <Value Type='Boolean'>1</Value>
+                </Eq>
+            </Where>
+            <OrderBy>
+                <FieldRef Name='PROPERTY_NAME' Ascending='TRUE'/>
+            </OrderBy>
+        </Query>
+    </View>
+""")
+
+# Property metadata cache shared by all data source instances (one is created per request).
+# Keys are (site_url, list_name, user, identifier); values are (expires_at, result). The user
+# part keeps each signed-in user on results fetched with their own token and list permissions.
+_PROPERTY_CACHE_TTL = float(os.environ.get('SHAREPOINT_PROPERTY_CACHE_TTL', '300'))
+_PROPERTY_CACHE_MAXSIZE = 512
+_ALL_PROPERTIES_KEY = '*all*'
+_property_cache: Dict[tuple, tuple] = {}
+_property_cache_lock = threading.Lock()
+
+# get_properties_bulk: identifiers per OR-ed $filter and concurrent batch queries
+_BULK_BATCH_SIZE = 20
+_BULK_MAX_WORKERS = 8
+
+# Activity log writes are queued by log_activity and posted by a background thread, so
+# login/logout never wait on SharePoint. Up to _ACTIVITY_BATCH_SIZE entries (the Graph
+# $batch limit) arriving within _ACTIVITY_BATCH_WAIT seconds share one request.
+_ACTIVITY_BATCH_SIZE = 20
+_ACTIVITY_BATCH_WAIT = 1.0
+_ACTIVITY_SHUTDOWN_TIMEOUT = 10.0
+_activity_queue: 'queue.Queue' = queue.Queue()
+_activity_worker: Optional[threading.Thread] = None
+_activity_worker_lock = threading.Lock()
+_LOG_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'  # UTC, second precision
+
+
+@functools.lru_cache(maxsize=256)
+def _token_cache_user(access_token: Optional[str]) -> str:
+    """
+    Identify the user behind a delegated token for the property cache key
+    
+    Uses the token's oid (or upn) claim; the signature is not checked, since SharePoint
+    validates the token on the request that fills the cache. Tokens that cannot be
+    decoded get their own scope (a digest of the token).
+    """
+    if not access_token:
+        return ''
+    try:
+        payload = access_token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        user = claims.get('oid') or claims.get('upn') or claims.get('preferred_username')
+        if user:
+            return str(user)
+    except (IndexError, ValueError):
+        pass
+    return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+
+def _entity_key(identifier: str) -> str:
+    """Canonical form of a lookup identifier: ENTITY_NUMBERs without leading zeros, names as given"""
+    return str(int(identifier)) if identifier.isdecimal() else identifier
+
+
+def _property_cache_get(key: tuple):
+    """Return the cached result for key, or None when missing or expired"""
+    with _property_cache_lock:
+        entry = _property_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _property_cache[key]
+            return None
+        return entry[1]
+
+
+def _property_cache_put(key: tuple, value) -> None:
+    """Store a result, evicting the oldest entry once the cache is full"""
+    if _PROPERTY_CACHE_TTL <= 0:
+        return
+    with _property_cache_lock:
+        if key not in _property_cache and len(_property_cache) >= _PROPERTY_CACHE_MAXSIZE:
+            del _property_cache[next(iter(_property_cache))]
+        _property_cache[key] = (time.monotonic() + _PROPERTY_CACHE_TTL, value)
+
+
+def _enqueue_activity(data_source: 'SharePointDataSource', log_entry: Dict[str, Any]) -> None:
+    """Queue an activity log entry, starting the background writer on first use"""
+    global _activity_worker
+    with _activity_worker_lock:
+        if _activity_worker is None or not _activity_worker.is_alive():
+            _activity_worker = threading.Thread(target=_activity_worker_loop,
+                                                name='sharepoint-activity-log', daemon=True)
+            _activity_worker.start()
+    _activity_queue.put((data_source, log_entry))
+
+
+def _activity_worker_loop() -> None:
+    """Drain the activity queue, posting entries in batches until the shutdown sentinel"""
+    while True:
+        batch = [_activity_queue.get()]
+        try:
+            while len(batch) < _ACTIVITY_BATCH_SIZE and batch[-1] is not None:
+                batch.append(_activity_queue.get(timeout=_ACTIVITY_BATCH_WAIT))
+        except queue.Empty:
+            pass
+        
+        stopping = batch[-1] is None
+        entries = batch[:-1] if stopping else batch
+        
+        # Entries from the same token and log list are posted together
+        groups: Dict[tuple, list] = {}
+        for data_source, log_entry in entries:
+            key = (data_source.app_only_token, data_source.site_url, data_source.log_list_name)
+            groups.setdefault(key, [data_source]).append(log_entry)
+        for data_source, *log_entries in groups.values():
+            try:
+                data_source._post_log_entries(log_entries)
+            except Exception as e:
+                logger.error(f"Activity log writer failed: {str(e)}", exc_info=True)
+        
+        if stopping:
+            return
+
+
+@atexit.register
+def _flush_activity_queue() -> None:
+    """Let the background writer post queued activity entries before the process exits"""
+    if _activity_worker is not None and _activity_worker.is_alive():
+        _activity_queue.put(None)
+        _activity_worker.join(_ACTIVITY_SHUTDOWN_TIMEOUT)
+
 
 class SharePointDataSource:
     """Handle SharePoint Online connections and property data queries"""
@@ -99,6 +270,8 @@ class SharePointDataSource:
     def get_property_info(self, property_identifier: str) -> Optional[Dict[str, Any]]:
         """
         Lookup property details by ENTITY_NUMBER or PROPERTY_NAME
+        Numeric identifiers are looked up with get_property_by_entity_number, anything else
+        with get_property_by_name; callers that know which one they hold can call those directly
         
         Args:
             property_identifier: ENTITY_NUMBER (preferred) or PROPERTY_NAME
@@ -106,77 +279,73 @@ class SharePointDataSource:
         Returns:
             Dictionary with property details or None if not found
         """
-        try:
-            print(f"=== SHAREPOINT QUERY START ===")
-            print(f"Looking for property_identifier: {property_identifier}")
-            print(f"Type: {type(property_identifier)}")
-            
-            ctx = self._get_context()
-            
-            # Get the list
-            sp_list = ctx.web.lists.get_by_title(self.list_name)
+        if property_identifier.isdecimal():
+            return self.get_property_by_entity_number(int(property_identifier))
+        return self.get_property_by_name(property_identifier)
+    
+    def get_property_by_entity_number(self, entity_number: int) -> Optional[Dict[str, Any]]:
+        """
+        Lookup property details by ENTITY_NUMBER
+        Preferred path: a single equality filter on ENTITY_NUMBER, which SharePoint can
+        answer from the column index without scanning the list
+        
+        Args:
+            entity_number: Property ENTITY_NUMBER
             
-            # Determine if property_identifier is numeric (entity number) or text (property name)
-            is_numeric = property_identifier.isdigit()
+        Returns:
+            Dictionary with property details or None if not found
+        """
+        return self._lookup_property(str(entity_number), f"ENTITY_NUMBER eq {entity_number:d}")
+    
+    def get_property_by_name(self, property_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Lookup property details by PROPERTY_NAME
+        
+        Args:
+            property_name: Property name exactly as stored in the list
             
-            # Use filter instead of CAML query for more reliable results
-            if is_numeric:
-                # Filter by ENTITY_NUMBER
-                filter_expr = f"ENTITY_NUMBER eq {property_identifier}"
-                print(f"=== USING FILTER: {filter_expr} ===")
-                items = sp_list.items.filter(filter_expr).top(1).get().execute_query()
-            else:
-                # Filter by PROPERTY_NAME
-                filter_expr = f"PROPERTY_NAME eq '{property_identifier}'"
-                print(f"=== USING FILTER: {filter_expr} ===")
-                items = sp_list.items.filter(filter_expr).top(1).get().execute_query()
+        Returns:
+            Dictionary with property details or None if not found
+        """
+        return self._lookup_property(property_name,
+                                     "PROPERTY_NAME eq '{}'".format(property_name.replace("'", "''")))
+    
+    def _property_cache_key(self, property_identifier: str) -> tuple:
+        """Property cache key for this list and the user behind access_token"""
+        return (self.site_url, self.list_name, _token_cache_user(self.access_token), property_identifier)
+    
+    def _lookup_property(self, property_identifier: str, filter_expr: str) -> Optional[Dict[str, Any]]:
+        """Run a single-property filter (cached per identifier) and verify the returned row"""
+        cache_key = self._property_cache_key(property_identifier)
+        cached = _property_cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        try:
+            logger.debug(f"SharePoint property query: {property_identifier!r}, filter: {filter_expr}")
+            items = self._get_property_items(filter_expr, top=1)
             
-            print(f"=== FILTER RETURNED {len(items)} ITEMS ===")
+            logger.debug(f"Filter returned {len(items)} items")
             
             if len(items) == 0:
-                print(f"=== NO ITEMS FOUND FOR: {property_identifier} ===")
                 logger.warning(f"Property not found in SharePoint: {property_identifier}")
                 return None
             
             if len(items) > 0:
-                print(f"First item ENTITY_NUMBER: {items[0].properties.get('ENTITY_NUMBER')}")
-                print(f"First item PROPERTY_NAME: {items[0].properties.get('PROPERTY_NAME')}")
+                logger.debug(f"First item: ENTITY_NUMBER={items[0].get('ENTITY_NUMBER')}, "
+                             f"PROPERTY_NAME={items[0].get('PROPERTY_NAME')}")
                 
                 # CRITICAL: Verify we got the right record
-                entity_match = str(items[0].properties.get('ENTITY_NUMBER')) == str(property_identifier)
-                name_match = items[0].properties.get('PROPERTY_NAME') == property_identifier
+                entity_match = str(items[0].get('ENTITY_NUMBER')) == str(property_identifier)
+                name_match = items[0].get('PROPERTY_NAME') == property_identifier
                 
                 if not (entity_match or name_match):
-                    print(f"=== WARNING: Query returned wrong property! ===")
-                    print(f"Requested: {property_identifier}")
-                    print(f"Got ENTITY_NUMBER: {items[0].properties.get('ENTITY_NUMBER')}")
-                    print(f"Got PROPERTY_NAME: {items[0].properties.get('PROPERTY_NAME')}")
-                    logger.error(f"SharePoint query returned wrong property. Requested: {property_identifier}, Got: {items[0].properties.get('ENTITY_NUMBER')}")
+                    logger.error(f"SharePoint query returned wrong property. Requested: {property_identifier}, "
+                                 f"Got: {items[0].get('ENTITY_NUMBER')} / {items[0].get('PROPERTY_NAME')}")
                     return None
-                item = items[0].properties
-                
-                # Format the address: ADDRESS_1[, ADDRESS_2], ADDRESS_CITY, ADDRESS_STATE
-                address_parts = []
-                if item.get('ADDRESS_1'):
-                    address_parts.append(item.get('ADDRESS_1').strip())
-                if item.get('ADDRESS_2') and item.get('ADDRESS_2').strip():
-                    address_parts.append(item.get('ADDRESS_2').strip())
-                if item.get('ADDRESS_CITY'):
-                    address_parts.append(item.get('ADDRESS_CITY').strip())
-                if item.get('ADDRESS_STATE'):
-                    address_parts.append(item.get('ADDRESS_STATE').strip())
-                
-                formatted_address = ', '.join(address_parts)
-                
-                return {
-                    'entity_number': item.get('ENTITY_NUMBER', ''),
-                    'property_name': item.get('PROPERTY_NAME', ''),
-                    'address': formatted_address,
-                    'city': item.get('ADDRESS_CITY', '').strip() if item.get('ADDRESS_CITY') else '',
-                    'state': item.get('ADDRESS_STATE', '').strip() if item.get('ADDRESS_STATE') else '',
-                    'zip_code': item.get('ADDRESS_ZIP', ''),
-                    'university': item.get('SCHOOL_NAME', '')
-                }
+                property_info = self._property_from_item(items[0])
+                _property_cache_put(cache_key, property_info)
+                return dict(property_info)
             else:
                 logger.warning(f"Property not found in SharePoint: {property_identifier}")
                 return None
@@ -185,6 +354,117 @@ class SharePointDataSource:
             logger.error(f"Error querying SharePoint property: {str(e)}")
             raise
     
+    def _get_property_items(self, filter_expr: str, top: int) -> List[Dict[str, Any]]:
+        """
+        Read property list rows through the SharePoint REST API with the user token
+        One GET on the shared keep-alive session ($select/$filter/$top), parsed straight
+        into dicts instead of going through the office365 query and entity layer
+        
+        Args:
+            filter_expr: OData $filter expression over the list columns
+            top: Maximum number of rows to return
+            
+        Returns:
+            List of row dicts keyed by _PROPERTY_FIELDS column names
+        """
+        if not self.access_token:
+            raise ValueError("Access token required for SharePoint authentication")
+        
+        list_title = self.list_name.replace("'", "''")
+        url = f"{self.site_url.rstrip('/')}/_api/web/lists/GetByTitle('{list_title}')/items"
+        params = {
+            '$select': ','.join(_PROPERTY_FIELDS),
+            '$filter': filter_expr,
+            '$top': str(top)
+        }
+        headers = {
+            'Authorization': f'Bearer {self.access_token}',
+            'Accept': 'application/json;odata=nometadata'
+        }
+        
+        response = _http_session.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json().get('value', [])
+    
+    @staticmethod
+    def _property_from_item(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a property list item's fields to the property info dict"""
+        # Strip each address column once; blank columns are left out of the formatted address
+        address = {field: (item.get(field) or '').strip() for field in _ADDRESS_FIELDS}
+        formatted_address = ', '.join(part for part in address.values() if part)
+        
+        return {
+            'entity_number': item.get('ENTITY_NUMBER', ''),
+            'property_name': item.get('PROPERTY_NAME', ''),
+            'address': formatted_address,
+            'city': address['ADDRESS_CITY'],
+            'state': address['ADDRESS_STATE'],
+            'zip_code': item.get('ADDRESS_ZIP', ''),
+            'university': item.get('SCHOOL_NAME', '')
+        }
+    
+    def get_properties_bulk(self, property_identifiers: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Lookup many properties by ENTITY_NUMBER or PROPERTY_NAME
+        
+        Cached properties are served locally; the rest are queried in batches of
+        _BULK_BATCH_SIZE identifiers (one OR-ed $filter each), with batches running
+        concurrently on a thread pool.
+        
+        Args:
+            property_identifiers: ENTITY_NUMBERs and/or PROPERTY_NAMEs
+            
+        Returns:
+            Dictionary mapping each identifier to its property details (None if not found)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = []
+        for identifier in dict.fromkeys(property_identifiers):
+            cached = _property_cache_get(self._property_cache_key(_entity_key(identifier)))
+            if cached is not None:
+                results[identifier] = dict(cached)
+            else:
+                pending.append(identifier)
+        
+        batches = [pending[i:i + _BULK_BATCH_SIZE] for i in range(0, len(pending), _BULK_BATCH_SIZE)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(len(batches), _BULK_MAX_WORKERS)) as executor:
+                for found in executor.map(self._query_property_batch, batches):
+                    results.update(found)
+        
+        logger.info(f"Bulk property lookup: {len(results) - len(pending)} cached, {len(pending)} queried in {len(batches)} batches")
+        return results
+    
+    def _query_property_batch(self, property_identifiers: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Query one batch of identifiers with a single OR-ed filter (runs on a worker thread)"""
+        clauses = [
+            f"ENTITY_NUMBER eq {int(identifier):d}" if identifier.isdecimal()
+            else "PROPERTY_NAME eq '{}'".format(identifier.replace("'", "''"))
+            for identifier in property_identifiers
+        ]
+        try:
+            items = self._get_property_items(' or '.join(clauses), top=len(clauses))
+        except Exception as e:
+            logger.error(f"Error querying SharePoint property batch: {str(e)}")
+            raise
+        
+        by_entity = {}
+        by_name = {}
+        for item in items:
+            property_info = self._property_from_item(item)
+            by_entity[str(property_info['entity_number'])] = property_info
+            by_name[property_info['property_name']] = property_info
+        
+        found = {}
+        for identifier in property_identifiers:
+            key = _entity_key(identifier)
+            property_info = by_entity.get(key) or by_name.get(key)
+            if property_info is not None:
+                _property_cache_put(self._property_cache_key(key), property_info)
+                property_info = dict(property_info)
+            found[identifier] = property_info
+        return found
+    
     def list_all_properties(self) -> List[Dict[str, str]]:
         """
         Get list of all reportable properties for dropdown
@@ -193,54 +473,60 @@ class SharePointDataSource:
         Returns:
             List of dictionaries with entity_number and property_name
         """
+        cache_key = self._property_cache_key(_ALL_PROPERTIES_KEY)
+        cached = _property_cache_get(cache_key)
+        if cached is not None:
+            return [dict(prop) for prop in cached]
+        
         try:
             ctx = self._get_context()
             
             # Get the list
             sp_list = ctx.web.lists.get_by_title(self.list_name)
             
-            # Query for reportable properties
-            caml_query_xml = """
-                <View>
-                    <Query>
-                        <Where>
-                            <Eq>
-                                <FieldRef Name='FLAG_REPORTABLE'/>
-                                <Value Type='Boolean'>1</Value>
-                            </Eq>
-                        </Where>
-                        <OrderBy>
-                            <FieldRef Name='PROPERTY_NAME' Ascending='TRUE'/>
-                        </OrderBy>
-                    </Query>
-                </View>
-            """
-            
-            caml_query = CamlQuery.parse(caml_query_xml)
-            items = sp_list.get_items(caml_query).execute_query()
-            
-            properties = [
-                {
+            # Query for reportable properties (only the dropdown columns are returned)
+            items = sp_list.get_items(_REPORTABLE_CAML).execute_query()
+            
+            # Sort by property name (in case CAML OrderBy doesn't work); the
+            # case-folded key is computed once per row while building the list
+            decorated = [
+                ((name or '').casefold(), {
                     'entity_number': item.properties.get('ENTITY_NUMBER', ''),
-                    'property_name': item.properties.get('PROPERTY_NAME', '')
-                }
+                    'property_name': name
+                })
                 for item in items
+                for name in (item.properties.get('PROPERTY_NAME', ''),)
             ]
-            
-            # Sort by property name (in case CAML OrderBy doesn't work)
-            properties.sort(key=lambda x: x['property_name'].upper() if x['property_name'] else '')
+            decorated.sort(key=itemgetter(0))
+            properties = [prop for _, prop in decorated]
             
             logger.info(f"Retrieved {len(properties)} reportable properties from SharePoint")
-            return properties
+            _property_cache_put(cache_key, properties)
+            return [dict(prop) for prop in properties]
             
         except Exception as e:
             logger.error(f"Error listing SharePoint properties: {str(e)}")
             raise
     
+    def invalidate_property(self, property_identifier: Optional[str] = None) -> None:
+        """
+        Drop cached property metadata for this list (for every user)
+        
+        Args:
+            property_identifier: ENTITY_NUMBER or PROPERTY_NAME to drop; None clears every
+                                 cached lookup for the list, including the property dropdown
+        """
+        identifiers = None if property_identifier is None else (property_identifier, _ALL_PROPERTIES_KEY)
+        with _property_cache_lock:
+            for key in [key for key in _property_cache
+                        if key[:2] == (self.site_url, self.list_name)
+                        and (identifiers is None or key[3] in identifiers)]:
+                del _property_cache[key]
+    
     def _get_graph_site_id(self, graph_token: str) -> Optional[str]:
         """
         Resolve SharePoint site ID via Microsoft Graph API
-        Caches the result for subsequent calls
+        Caches the result for subsequent calls (per process, shared across instances)
         
         Args:
             graph_token: Microsoft Graph access token
@@ -251,6 +537,11 @@ class SharePointDataSource:
         if self._graph_site_id:
             return self._graph_site_id
         
+        cached = _graph_id_cache.get(('site', self.site_url))
+        if cached:
+            self._graph_site_id = cached
+            return cached
+        
         try:
             # Parse site URL to get host and path
             # e.g., https://peakcampus.sharepoint.com/sites/BaseCampApps
@@ -266,11 +557,13 @@ class SharePointDataSource:
                 'Accept': 'application/json'
             }
             
-            response = requests.get(graph_url, headers=headers)
+            response = _http_session.get(graph_url, headers=headers)
             response.raise_for_status()
             
             site_data = response.json()
             self._graph_site_id = site_data.get('id')
+            if self._graph_site_id:
+                _graph_id_cache[('site', self.site_url)] = self._graph_site_id
             
             logger.info(f"Resolved SharePoint site ID via Graph: {self._graph_site_id}")
             return self._graph_site_id
@@ -282,7 +575,7 @@ class SharePointDataSource:
     def _get_graph_list_id(self, graph_token: str, site_id: str) -> Optional[str]:
         """
         Resolve SharePoint list ID via Microsoft Graph API
-        Caches the result for subsequent calls
+        Caches the result for subsequent calls (per process, shared across instances)
         
         Args:
             graph_token: Microsoft Graph access token
@@ -294,6 +587,11 @@ class SharePointDataSource:
         if self._graph_list_id:
             return self._graph_list_id
         
+        cached = _graph_id_cache.get(('list', site_id, self.log_list_name))
+        if cached:
+            self._graph_list_id = cached
+            return cached
+        
         try:
             # Query Graph API for list by display name
             graph_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists"
@@ -305,7 +603,7 @@ class SharePointDataSource:
                 '$filter': f"displayName eq '{self.log_list_name}'"
             }
             
-            response = requests.get(graph_url, headers=headers, params=params)
+            response = _http_session.get(graph_url, headers=headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -316,6 +614,8 @@ class SharePointDataSource:
                 return None
             
             self._graph_list_id = lists[0].get('id')
+            if self._graph_list_id:
+                _graph_id_cache[('list', site_id, self.log_list_name)] = self._graph_list_id
             logger.info(f"Resolved SharePoint list ID via Graph: {self._graph_list_id}")
             return self._graph_list_id
             
@@ -323,28 +623,50 @@ class SharePointDataSource:
             logger.error(f"Failed to resolve SharePoint list ID: {str(e)}")
             return None
     
-    def _log_via_graph(self, user_email: str, user_name: str, activity_type: str,
-                      property_name: Optional[str], file_names: Optional[str],
-                      application: str, environment: str, session_id: Optional[str],
-                      status: Optional[str] = None, status_reason: Optional[str] = None) -> bool:
+    @staticmethod
+    def _build_log_entry(user_email: str, user_name: str, activity_type: str,
+                         property_name: Optional[str], file_names: Optional[str],
+                         application: str, environment: str, session_id: Optional[str],
+                         status: Optional[str] = None, status_reason: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Graph list item for an activity (timestamped when the activity happens)"""
+        log_entry = {
+            'fields': {
+                'Title': user_email,  # SharePoint requires Title field
+                'UserEmail': user_email,
+                'UserName': user_name,
+                'LoginTimestamp': time.strftime(_LOG_TIMESTAMP_FORMAT, time.gmtime()),
+                'UserRole': 'user',
+                'ActivityType': activity_type,
+                'Application': application,
+                'Env': environment
+            }
+        }
+        
+        # Add optional fields
+        if session_id:
+            log_entry['fields']['SessionID'] = session_id
+        if property_name:
+            log_entry['fields']['PropertyName'] = property_name
+        if file_names:
+            log_entry['fields']['FileNames'] = file_names
+        if status:
+            log_entry['fields']['Status'] = status
+        if status_reason:
+            log_entry['fields']['StatusReason'] = status_reason
+        
+        return log_entry
+    
+    def _post_log_entries(self, log_entries: List[Dict[str, Any]]) -> bool:
         """
-        Log activity to SharePoint via Microsoft Graph API (app-only)
-        This is more reliable than SharePoint REST API
+        Write activity entries to the log list via Microsoft Graph API (app-only)
+        This is more reliable than SharePoint REST API. Runs on the background writer;
+        several entries are sent as one Graph $batch request.
         
         Args:
-            user_email: User's email address
-            user_name: User's display name
-            activity_type: Type of activity
-            property_name: Optional property name
-            file_names: Optional file names
-            application: Application name
-            environment: Environment name
-            session_id: Session ID
-            status: Optional recommendation status
-            status_reason: Optional recommendation amount
+            log_entries: List items built by _build_log_entry
             
         Returns:
-            True if logging successful, False otherwise
+            True if every entry was written, False otherwise
         """
         if not self.app_only_token:
             logger.warning("No app-only token available for Graph API logging")
@@ -362,70 +684,67 @@ class SharePointDataSource:
                 self._logging_available = False
                 return False
             
-            # Create log entry
-            log_entry = {
-                'fields': {
-                    'Title': user_email,  # SharePoint requires Title field
-                    'UserEmail': user_email,
-                    'UserName': user_name,
-                    'LoginTimestamp': datetime.utcnow().isoformat() + 'Z',
-                    'UserRole': 'user',
-                    'ActivityType': activity_type,
-                    'Application': application,
-                    'Env': environment
-                }
-            }
-            
-            # Add optional fields
-            if session_id:
-                log_entry['fields']['SessionID'] = session_id
-            if property_name:
-                log_entry['fields']['PropertyName'] = property_name
-            if file_names:
-                log_entry['fields']['FileNames'] = file_names
-            if status:
-                log_entry['fields']['Status'] = status
-            if status_reason:
-                log_entry['fields']['StatusReason'] = status_reason
-            
-            # Post to Graph API
-            graph_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items"
+            items_path = f"/sites/{site_id}/lists/{list_id}/items"
             headers = {
                 'Authorization': f'Bearer {self.app_only_token}',
                 'Content-Type': 'application/json',
                 'Accept': 'application/json'
             }
             
-            response = requests.post(graph_url, json=log_entry, headers=headers)
-            response.raise_for_status()
-            
-            logger.info(f"Successfully logged activity via Graph: {activity_type} for {user_email}")
+            if len(log_entries) == 1:
+                response = _http_session.post(f"https://graph.microsoft.com/v1.0{items_path}",
+                                               json=log_entries[0], headers=headers)
+                response.raise_for_status()
+                failures = []
+            else:
+                batch_request = {
+                    'requests': [
+                        {
+                            'id': str(index),
+                            'method': 'POST',
+                            'url': items_path,
+                            'headers': {'Content-Type': 'application/json'},
+                            'body': log_entry
+                        }
+                        for index, log_entry in enumerate(log_entries)
+                    ]
+                }
+                response = _http_session.post("https://graph.microsoft.com/v1.0/$batch",
+                                               json=batch_request, headers=headers)
+                response.raise_for_status()
+                failures = [item for item in response.json().get('responses', [])
+                            if item.get('status', 0) >= 400]
+            
+            for failure in failures:
+                logger.error(f"Graph API logging failed for batched entry: "
+                             f"HTTP {failure.get('status')}: {failure.get('body')}")
+            
+            activities = ', '.join(f"{entry['fields']['ActivityType']} for {entry['fields']['UserEmail']}"
+                                   for entry in log_entries)
+            logger.info(f"Logged {len(log_entries) - len(failures)} of {len(log_entries)} "
+                        f"activities via Graph: {activities}")
             self._logging_available = True
-            return True
+            return not failures
             
         except requests.HTTPError as e:
             status_code = e.response.status_code if e.response else 0
             error_msg = e.response.text if e.response else str(e)
             
-            print(f"=== GRAPH API LOGGING ERROR: HTTP {status_code} ===")
-            print(f"=== Error: {error_msg} ===")
+            logger.debug(f"Graph API logging error: HTTP {status_code}: {error_msg}")
             
             if status_code == 404:
                 logger.error(f"SharePoint list '{self.log_list_name}' not found via Graph API")
                 self._logging_available = False
             elif status_code in [401, 403]:
-                logger.error(f"Graph API returned {status_code} - check Azure AD app permissions")
-                print(f"=== Ensure 'Sites.ReadWrite.All' application permission is granted in Azure AD ===")
+                logger.error(f"Graph API returned {status_code} - check Azure AD app permissions "
+                             f"(ensure 'Sites.ReadWrite.All' application permission is granted)")
             else:
                 logger.error(f"Graph API logging failed: {error_msg}")
             
             return False
             
         except Exception as e:
-            logger.error(f"Exception during Graph API logging: {str(e)}")
-            print(f"=== GRAPH API EXCEPTION: {str(e)} ===")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"Exception during Graph API logging: {str(e)}", exc_info=True)
             return False
     
     def log_activity(self, user_email: str, user_name: str, activity_type: str, 
@@ -434,7 +753,9 @@ class SharePointDataSource:
                     session_id: str = None, status: str = None, status_reason: str = None) -> bool:
         """
         Log user activity to Innovation Use Log SharePoint list
-        Uses Microsoft Graph API with app-only token (more reliable than SharePoint REST)
+        Uses Microsoft Graph API with app-only token (more reliable than SharePoint REST).
+        The entry is queued and written by a background thread, so the caller does not
+        wait on SharePoint; write failures are reported in the log.
         
         Args:
             user_email: User's email address
@@ -449,7 +770,7 @@ class SharePointDataSource:
             status_reason: Optional recommendation amount (e.g., '$500,000.00' or '$0.00')
             
         Returns:
-            True if logging successful, False otherwise
+            True if the activity was queued for logging, False if logging is unavailable
         """
         # Skip if we've already determined logging is unavailable for this instance
         if self._logging_available is False:
@@ -458,12 +779,11 @@ class SharePointDataSource:
         # Use app-only token for logging (app writes as itself, not as user)
         if not self.app_only_token:
             logger.warning("No app-only token available for logging. Skipping activity log.")
-            print("=== WARNING: No app-only token for logging ===")
             return False
         
         # Use Graph API for logging (more reliable than SharePoint REST)
-        print(f"=== LOGGING ACTIVITY VIA GRAPH API: {activity_type} for {user_email} ===")
-        return self._log_via_graph(
+        logger.debug(f"Queueing activity for Graph API logging: {activity_type} for {user_email}")
+        _enqueue_activity(self, self._build_log_entry(
             user_email=user_email,
             user_name=user_name,
             activity_type=activity_type,
@@ -474,19 +794,34 @@ class SharePointDataSource:
             session_id=session_id,
             status=status,
             status_reason=status_reason
-        )
+        ))
+        return True
     
     def test_connection(self) -> bool:
         """
         Test SharePoint connection
+        Probes the property list with a direct REST GET that returns only its Id, rather than
+        building a client context and loading the full list definition
         
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            ctx = self._get_context()
+            if not self.access_token:
+                raise ValueError("Access token required for SharePoint authentication")
+            
             # Try to get the list to verify connection
-            ctx.web.lists.get_by_title(self.list_name).get().execute_query()
+            list_title = self.list_name.replace("'", "''")
+            response = _http_session.get(
+                f"{self.site_url.rstrip('/')}/_api/web/lists/GetByTitle('{list_title}')",
+                params={'$select': 'Id'},
+                headers={
+                    'Authorization': f'Bearer {self.access_token}',
+                    'Accept': 'application/json;odata=nometadata'
+                },
+                timeout=_CONNECTION_TEST_TIMEOUT
+            )
+            response.raise_for_status()
             logger.info("SharePoint connection test successful")
             return True
         except Exception as e:
@@ -5,11 +5,32 @@ Uses OpenAI GPT-4o-mini to generate executive summary with bullet points
 
 import os
 import logging
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, Iterator, List, Optional
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Static instructions sent as the system message; the user turn carries only per-property facts
+_SYSTEM_INSTRUCTIONS = """You are a financial analyst specializing in student housing and real estate cash flow analysis. Provide clear, concise, actionable insights.
+
+You are analyzing a cash forecast for a student housing property. Provide an executive summary
+that validates whether the accountant's recommendation is appropriate based on economic conditions.
+
+Generate an executive summary with 3-5 bullet points that:
+1. Validates or questions the accountant's recommendation
+2. Cites specific economic/demographic factors
+3. Provides clear, actionable insights
+4. Uses professional, concise language
+
+Each bullet should be a complete thought that a CFO or property owner can act on."""
+
+# 3-5 bullets rarely exceed ~250 tokens
+_MAX_SUMMARY_TOKENS = 320
+
+# A bullet line: •, -, * (possibly repeated) or "1." / "1)" marker, then the bullet text
+_BULLET_RE = re.compile(r'^[ \t]*(?:[•*\-]+|\d+[.)])[ \t]*(\S.*?)[ \t]*$', re.M)
+
 class SummaryGenerator:
     """Generates executive summaries using OpenAI API"""
     
@@ -51,7 +72,7 @@ class SummaryGenerator:
     
     def _prepare_context(self, analysis_results: Dict[str, Any], property_info: Dict[str, Any]) -> str:
         """
-        Prepare context for OpenAI prompt
+        Prepare the per-property facts for the OpenAI prompt (instructions live in _SYSTEM_INSTRUCTIONS)
         """
         recommendation = analysis_results.get('recommendation', {})
         occupancy = analysis_results.get('occupancy_analysis', {})
@@ -59,9 +80,6 @@ class SummaryGenerator:
         validation = analysis_results.get('validation', {})
         
         context = f"""
-You are analyzing a cash forecast for a student housing property. Provide an executive summary
-that validates whether the accountant's recommendation is appropriate based on economic conditions.
-
 PROPERTY INFORMATION:
 - Name: {property_info['name']}
 - Location: {property_info['address']}, {property_info['zip_code']}
@@ -86,30 +104,47 @@ VALIDATION RESULTS:
 - Result: {validation.get('validation_result', 'Pending')}
 - Supporting Factors: {', '.join(validation.get('supporting_factors', ['Analysis in progress']))}
 - Risk Factors: {', '.join(validation.get('risk_factors', ['None identified']))}
-
-Generate an executive summary with 3-5 bullet points that:
-1. Validates or questions the accountant's recommendation
-2. Cites specific economic/demographic factors
-3. Provides clear, actionable insights
-4. Uses professional, concise language
-
-Each bullet should be a complete thought that a CFO or property owner can act on.
 """
         return context
     
+    def stream_bullets(self,
+                       analysis_results: Dict[str, Any],
+                       property_info: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield summary bullets as soon as the model finishes each line
+        
+        Lets callers render the first bullet while the rest are still being generated.
+        Bullets use the same shape and 5-bullet cap as generate_summary().
+        """
+        context = self._prepare_context(analysis_results, property_info)
+        bullet_count = 0
+        for line in self._stream_openai(context):
+            text = self._parse_bullet_line(line)
+            if text:
+                bullet_count += 1
+                yield {'id': bullet_count, 'text': text, 'has_details': True}
+                if bullet_count == 5:
+                    return
+    
     def _call_openai(self, context: str) -> str:
         """
-        Call OpenAI API to generate summary
+        Call OpenAI API to generate summary (streamed, returned as the full text)
+        """
+        return ''.join(self._stream_openai(context))
+    
+    def _stream_openai(self, context: str) -> Iterator[str]:
+        """
+        Stream the OpenAI response, yielding each completed line (newline included)
         """
         logger.info(f"Calling OpenAI API with model: {self.model}")
         
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a financial analyst specializing in student housing and real estate cash flow analysis. Provide clear, concise, actionable insights."
+                        "content": _SYSTEM_INSTRUCTIONS
                     },
                     {
                         "role": "user",
@@ -117,10 +152,24 @@ Each bullet should be a complete thought that a CFO or property owner can act on
                     }
                 ],
                 temperature=0.7,
-                max_tokens=800
+                max_tokens=_MAX_SUMMARY_TOKENS,
+                stream=True
             )
             
-            return response.choices[0].message.content
+            buffer = ''
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+                if '\n' in buffer:
+                    *lines, buffer = buffer.split('\n')
+                    for line in lines:
+                        yield line + '\n'
+            if buffer:
+                yield buffer
             
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
@@ -130,21 +179,11 @@ Each bullet should be a complete thought that a CFO or property owner can act on
         """
         Structure the OpenAI response into bullets with drill-down capability
         """
-        # Parse bullet points from summary
-        lines = summary_text.strip().split('\n')
-        bullets = []
-        
-        for line in lines:
-            line = line.strip()
-            if line and (line.startswith('•') or line.startswith('-') or line.startswith('*') or line[0].isdigit()):
-                # Clean up bullet markers
-                cleaned = line.lstrip('•-*0123456789. ')
-                if cleaned:
-                    bullets.append({
-                        'id': len(bullets) + 1,
-                        'text': cleaned,
-                        'has_details': True
-                    })
+        # Parse bullet points from summary in one pass
+        bullets = [
+            {'id': i + 1, 'text': text, 'has_details': True}
+            for i, text in enumerate(_BULLET_RE.findall(summary_text)[:5])
+        ]
         
         # Ensure we have at least 3 bullets, max 5
         if len(bullets) < 3:
@@ -166,6 +205,12 @@ Each bullet should be a complete thought that a CFO or property owner can act on
             'full_analysis': analysis_results
         }
     
+    @staticmethod
+    def _parse_bullet_line(line: str) -> Optional[str]:
+        """Return a line's bullet text with its marker removed, or None if it is not a bullet"""
+        match = _BULLET_RE.match(line.rstrip('\n'))
+        return match.group(1) if match else None
+    
     def _generate_fallback_summary(self, analysis_results: Dict[str, Any], property_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate a fallback summary if OpenAI fails
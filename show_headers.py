@@ -1,11 +1,17 @@
-import pandas as pd
+from openpyxl import load_workbook
 
-df = pd.read_excel('sample_files/River Oaks/155 River Oaks Cash Forecast 10.2025.xlsx', sheet_name=0, header=None)
+# Read-only mode streams rows instead of loading the whole sheet
+wb = load_workbook('sample_files/River Oaks/155 River Oaks Cash Forecast 10.2025.xlsx', read_only=True, data_only=True)
+ws = wb.worksheets[0]
+rows = list(ws.iter_rows(min_row=1, max_row=10, values_only=True))
+n_cols = ws.max_column or max((len(row) for row in rows), default=0)
 
-print(f'Shape: {df.shape}')
+print(f'Shape: ({ws.max_row}, {n_cols})')
 print('\n=== First 10 rows, last 15 columns ===')
-for row_idx in range(10):
+for row_idx, row in enumerate(rows):
     print(f'\nRow {row_idx}:')
-    for col_idx in range(max(0, df.shape[1] - 15), df.shape[1]):
-        val = df.iloc[row_idx, col_idx]
+    for col_idx in range(max(0, n_cols - 15), n_cols):
+        val = row[col_idx] if col_idx < len(row) else None
         print(f'  Col {col_idx}: {val} (type: {type(val).__name__})')
+
+wb.close()
@@ -1,22 +1,22 @@
 """
 Test smart column detection for Cash Forecast parsing
 """
-import pandas as pd
+import os
 import logging
-from services.file_processor import FileProcessor
+import pytest
 
-# Set up logging to see debug messages
-logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
+# Set VERBOSE=1 to see the parser's debug messages
+logging.basicConfig(level=logging.DEBUG if os.getenv('VERBOSE') else logging.WARNING,
+                    format='%(levelname)s: %(message)s')
 
-# Initialize processor (with dummy API key for testing)
-processor = FileProcessor(openai_api_key='test-key')
 
 # Test with Campus Creek Cottages file - this one uses a different format
-test_files = [
-    r'sample_files\Campus Creek Cottages\194 Campus Creek Cottages - Cash Forecast - 12.2025.xlsx',
-]
+@pytest.mark.parametrize('test_file', [
+    ('Campus Creek Cottages', '194 Campus Creek Cottages - Cash Forecast - 12.2025.xlsx'),
+])
+def test_column_detection(processor, sample_file, test_file):
+    test_file = sample_file(*test_file)
 
-for test_file in test_files:
     print("="*80)
     print("TESTING SMART COLUMN DETECTION")
     print("="*80)
@@ -43,5 +43,10 @@ for test_file in test_files:
         print("✗ PARSING FAILED")
         print("="*80)
         print(f"Error: {result.get('error', 'Unknown error')}")
-    
+
     print("\n")
+    assert result['status'] == 'success', result.get('error', 'Unknown error')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -12,8 +12,13 @@ database = os.environ.get('DATABASE_NAME')
 username = os.environ.get('DATABASE_USER')
 password = os.environ.get('DATABASE_PASSWORD')
 
+# Use the newest installed SQL Server driver (same preference as services/database.py)
+PREFERRED_DRIVERS = ['ODBC Driver 18 for SQL Server', 'ODBC Driver 17 for SQL Server', 'SQL Server']
+driver = next((d for d in PREFERRED_DRIVERS if d in pyodbc.drivers()), 'SQL Server')
+
 print(f"Testing connection to: {server}/{database}")
 print(f"Username: {username}")
+print(f"Driver: {driver}")
 print("-" * 60)
 
 # Try different connection approaches
@@ -38,11 +43,13 @@ for attempt in attempts:
     
     try:
         conn_str = (
-            f"DRIVER={{SQL Server}};"
+            f"DRIVER={{{driver}}};"
             f"SERVER={server};"
             f"DATABASE={database};"
             f"UID={attempt['user']};"
             f"PWD={password};"
+            # Driver 18 encrypts by default; trust the server certificate as the older drivers do
+            f"{'Encrypt=yes;TrustServerCertificate=yes;' if driver == 'ODBC Driver 18 for SQL Server' else ''}"
         )
         
         conn = pyodbc.connect(conn_str, timeout=5)
@@ -3,6 +3,7 @@ Test SQL Server connection with different parameters
 """
 import pyodbc
 import os
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,35 +13,53 @@ database = os.environ.get('DATABASE_NAME')
 username = os.environ.get('DATABASE_USER')
 password = os.environ.get('DATABASE_PASSWORD')
 
+# Use the newest installed SQL Server driver (same preference as services/database.py)
+PREFERRED_DRIVERS = ['ODBC Driver 18 for SQL Server', 'ODBC Driver 17 for SQL Server', 'SQL Server']
+available_drivers = pyodbc.drivers()
+driver = next((d for d in PREFERRED_DRIVERS if d in available_drivers), 'SQL Server')
+
+# The variant that connected last time is tried first (name only - the file never holds credentials)
+WORKING_VARIANT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'sql_conn.json')
+
 print(f"Testing connection to: {server}/{database}")
 print(f"Username: {username}")
-print(f"Available drivers: {pyodbc.drivers()}")
+print(f"Driver: {driver}")
+print(f"Available drivers: {available_drivers}")
 print("-" * 60)
 
 # Try different connection string variations
 connection_strings = [
     {
         'name': 'Basic SQL Server driver',
-        'conn_str': f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};"
+        'conn_str': f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};UID={username};PWD={password};"
     },
     {
         'name': 'SQL Server with Network Library',
-        'conn_str': f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};Network Library=DBMSSOCN;"
+        'conn_str': f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};UID={username};PWD={password};Network Library=DBMSSOCN;"
     },
     {
         'name': 'SQL Server with Port 1433',
-        'conn_str': f"DRIVER={{SQL Server}};SERVER={server},1433;DATABASE={database};UID={username};PWD={password};"
+        'conn_str': f"DRIVER={{{driver}}};SERVER={server},1433;DATABASE={database};UID={username};PWD={password};"
     },
     {
         'name': 'SQL Server with Encrypt=no',
-        'conn_str': f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};Encrypt=no;"
+        'conn_str': f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};UID={username};PWD={password};Encrypt=no;"
     },
     {
         'name': 'SQL Server with TrustServerCertificate',
-        'conn_str': f"DRIVER={{SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};TrustServerCertificate=yes;"
+        'conn_str': f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};UID={username};PWD={password};TrustServerCertificate=yes;"
     },
 ]
 
+try:
+    with open(WORKING_VARIANT_FILE) as f:
+        working_variant = json.load(f).get('working')
+except (OSError, ValueError):
+    working_variant = None
+if working_variant:
+    print(f"Trying last working variant first: {working_variant}")
+    connection_strings.sort(key=lambda test: test['name'] != working_variant)
+
 for test in connection_strings:
     print(f"\nTrying: {test['name']}")
     
@@ -61,6 +80,10 @@ for test in connection_strings:
         print("WORKING CONNECTION FOUND!")
         print(f"Connection string: {test['conn_str']}")
         print("=" * 60)
+        
+        os.makedirs(os.path.dirname(WORKING_VARIANT_FILE), exist_ok=True)
+        with open(WORKING_VARIANT_FILE, 'w') as f:
+            json.dump({'working': test['name']}, f)
         break
         
     except Exception as e:
@@ -1,21 +1,7 @@
 """
 Test The Lyndon full validation flow
 """
-import os
-import sys
-from dotenv import load_dotenv
-load_dotenv()
-
-# Set up path
-sys.path.insert(0, os.path.dirname(__file__))
-
-from services.file_processor import FileProcessor
-
-# File paths
-base_path = r'sample_files\The Lyndon'
-cash_forecast_path = os.path.join(base_path, '139 Lyndon Cash Forecast_12.2025.xlsx')
-income_statement_path = os.path.join(base_path, '03_The Lyndon_Comparative Income Statement_December-25.pdf')
-balance_sheet_path = os.path.join(base_path, '02_The Lyndon_Balance_Sheet_December-25.pdf')
+import pytest
 
 property_info = {
     'entity_number': '139',
@@ -27,52 +13,59 @@ property_info = {
     'university': 'Texas State University'
 }
 
-print("="*80)
-print("TESTING THE LYNDON VALIDATION FLOW")
-print("="*80)
 
-api_key = os.getenv('OPENAI_API_KEY', 'dummy-key-for-testing')
-processor = FileProcessor(api_key)
+def test_lyndon_validation(processor, sample_file):
+    # File paths
+    cash_forecast_path = sample_file('The Lyndon', '139 Lyndon Cash Forecast_12.2025.xlsx')
+    income_statement_path = sample_file('The Lyndon', '03_The Lyndon_Comparative Income Statement_December-25.pdf')
+    balance_sheet_path = sample_file('The Lyndon', '02_The Lyndon_Balance Sheet_December-25.pdf')
+
+    print("="*80)
+    print("TESTING THE LYNDON VALIDATION FLOW")
+    print("="*80)
+
+    print("\n1. Processing files...")
+    result = processor.process_and_analyze(
+        cash_forecast_path=cash_forecast_path,
+        income_statement_path=income_statement_path,
+        balance_sheet_path=balance_sheet_path,
+        property_info=property_info
+    )
 
-print("\n1. Processing files...")
-result = processor.process_and_analyze(
-    cash_forecast_path=cash_forecast_path,
-    income_statement_path=income_statement_path,
-    balance_sheet_path=balance_sheet_path,
-    property_info=property_info
-)
+    print("\n2. Results:")
+    print(f"   Success: {result.get('success')}")
 
-print("\n2. Results:")
-print(f"   Success: {result.get('success')}")
+    # Analysis must fail: validation should block it before OpenAI is called
+    assert not result.get('success'), "Analysis succeeded (should have failed) - validation isn't working correctly"
 
-if not result.get('success'):
     print(f"\n3. Validation Failed (AS EXPECTED)")
     print(f"   Error: {result.get('error')}")
     print(f"\n   Validation Issues:")
     for issue in result.get('validation_issues', []):
         print(f"     • {issue}")
-    
+
     print(f"\n4. OpenAI API Called: NO (validation blocked it)")
     print(f"   ✓ No wasted API costs")
-    
+
     print(f"\n5. Raw Data Available: {'Yes' if 'raw_data' in result else 'No'}")
     if 'raw_data' in result:
         cash_data = result['raw_data'].get('cash_forecast', {})
         print(f"   Cash Forecast Status: {cash_data.get('status')}")
         print(f"   Current FCF: ${cash_data.get('current_fcf', 0):,.2f}")
         print(f"   Current Occupancy: {cash_data.get('current_occupancy', 0):.1f}%")
-else:
-    print(f"\n3. ✗ UNEXPECTED: Analysis succeeded (should have failed)")
-    print("   This means validation isn't working correctly")
 
-print("\n" + "="*80)
-print("TEST COMPLETE")
-print("="*80)
+    print("\n" + "="*80)
+    print("TEST COMPLETE")
+    print("="*80)
+
+    print("\n📋 Summary:")
+    print("   ✓ Excel parsed successfully (FCF and occupancy extracted)")
+    print("   ✓ PDFs returned $0.00 (image-based, no text)")
+    print("   ✓ Validation detected the issue")
+    print("   ✓ OpenAI API call blocked")
+    print("   ✓ Error message provides clear feedback")
+    print("\nReady for local testing in the web application!")
+
 
-print("\n📋 Summary:")
-print("   ✓ Excel parsed successfully (FCF and occupancy extracted)")
-print("   ✓ PDFs returned $0.00 (image-based, no text)")
-print("   ✓ Validation detected the issue")
-print("   ✓ OpenAI API call blocked")
-print("   ✓ Error message provides clear feedback")
-print("\nReady for local testing in the web application!")
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -1,19 +1,22 @@
 """
 Test script to check multi-month budget extraction and averaging
 """
-from services.file_processor import FileProcessor
+import pytest
 
-# Parse the Campus Creek file
-processor = FileProcessor(openai_api_key='dummy')
-data = processor.parse_cash_forecast('sample_files/Campus Creek Cottages/194 Campus Creek Cottages - Cash Forecast - 12.2025.xlsx')
 
-projected_months = data.get('projected_months', [])
-print(f"\n{'='*80}")
-print(f"MULTI-MONTH BUDGET ANALYSIS")
-print(f"{'='*80}\n")
-print(f"Total budget months extracted: {len(projected_months)}\n")
+def test_multi_month(processor, sample_file):
+    # Parse the Campus Creek file
+    data = processor.parse_cash_forecast(sample_file('Campus Creek Cottages', '194 Campus Creek Cottages - Cash Forecast - 12.2025.xlsx'))
+    assert data['status'] == 'success', data.get('error', 'Unknown error')
+
+    projected_months = data.get('projected_months', [])
+    print(f"\n{'='*80}")
+    print(f"MULTI-MONTH BUDGET ANALYSIS")
+    print(f"{'='*80}\n")
+    print(f"Total budget months extracted: {len(projected_months)}\n")
+
+    assert projected_months, "No projected months extracted!"
 
-if projected_months:
     print(f"{'Month':<20} {'Operational FCF':>20} {'After Dist/Contrib':>20}")
     print(f"{'-'*20} {'-'*20} {'-'*20}")
     
@@ -37,5 +40,7 @@ if projected_months:
     if single_month_fcf != 0:
         pct_diff = ((average_operational - single_month_fcf) / abs(single_month_fcf)) * 100
         print(f"Percentage difference: {pct_diff:,.1f}%")
-else:
-    print("⚠️ No projected months extracted!")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
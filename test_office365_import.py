@@ -1,16 +1,27 @@
 """Test script to find correct office365 imports"""
+import importlib
+import importlib.util
 
-try:
-    from office365.sharepoint.caml.caml_query import CamlQuery
-    print("SUCCESS: from office365.sharepoint.caml.caml_query import CamlQuery")
-except ImportError as e:
-    print(f"FAILED caml.caml_query: {e}")
+# Known CamlQuery locations across office365 releases; stop at the first one that exists
+CAML_QUERY_MODULES = [
+    "office365.sharepoint.caml.caml_query",
+    "office365.sharepoint.caml_query",
+    "office365.sharepoint.listitems.caml.query",
+]
 
-try:
-    from office365.sharepoint.caml_query import CamlQuery
-    print("SUCCESS: from office365.sharepoint.caml_query import CamlQuery")
-except ImportError as e:
-    print(f"FAILED caml_query: {e}")
+
+def _module_exists(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+caml_module = next((name for name in CAML_QUERY_MODULES if _module_exists(name)), None)
+if caml_module and hasattr(importlib.import_module(caml_module), 'CamlQuery'):
+    print(f"SUCCESS: from {caml_module} import CamlQuery")
+else:
+    print(f"FAILED: CamlQuery not found in {CAML_QUERY_MODULES}")
 
 try:
     # Try getting items without CamlQuery
@@ -1,12 +1,15 @@
-import pandas as pd
-import sys
-sys.path.append('.')
-from services.file_processor import FileProcessor
-
-# Test with actual file
-processor = FileProcessor(openai_api_key='dummy')
-result = processor.parse_cash_forecast('sample_files/Rittenhouse Station/550 Rittenhouse Cash Forecast - 09.2025.xlsx')
-
-print('=== PARSE RESULT ===')
-for key, value in result.items():
-    print(f'{key}: {value}')
+import pytest
+
+
+def test_parser(processor, sample_file):
+    # Test with actual file
+    result = processor.parse_cash_forecast(sample_file('Rittenhouse Station', '550 Rittenhouse Cash Forecast - 09.2025.xlsx'))
+
+    print('=== PARSE RESULT ===')
+    for key, value in result.items():
+        print(f'{key}: {value}')
+    assert result['status'] == 'success', result.get('error')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -2,24 +2,17 @@
 Test script to process recent files locally with detailed logging
 """
 import os
+import json
 import logging
-from pathlib import Path
-from services.file_processor import FileProcessor
+import pytest
 
-# Set up detailed logging
+# Set up detailed logging (VERBOSE=1 includes the parser's debug messages)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if os.getenv('VERBOSE') else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-
-# River Oaks files from sample_files folder
-UPLOAD_FOLDER = "sample_files"
-
-# File paths
-cash_forecast_path = os.path.join(UPLOAD_FOLDER, "155 River Oaks Cash Forecast - 10.2025.xlsx")
-income_statement_path = os.path.join(UPLOAD_FOLDER, "04_River Oaks_Comparative_Income Statement_October 2025.pdf")
-balance_sheet_path = os.path.join(UPLOAD_FOLDER, "03_River Oaks_Balance Sheet_October 2025.pdf")
+logger.setLevel(logging.INFO)
 
 # Property info
 property_info = {
@@ -32,68 +25,60 @@ property_info = {
     'university': 'Unknown'
 }
 
-def main():
+
+def _format_data(data, skip=()):
+    """Serialize a parsed result section in one pass for logging"""
+    return json.dumps({key: value for key, value in data.items() if key not in skip}, indent=2, default=str)
+
+
+def test_recent_files(processor, sample_file):
     logger.info("="*80)
     logger.info("STARTING LOCAL TEST RUN")
     logger.info("="*80)
-    
-    # Verify files exist
+
+    # River Oaks files from sample_files folder (missing files skip the test)
+    cash_forecast_path = sample_file('River Oaks', '155 River Oaks Cash Forecast - 10.2025.xlsx')
+    income_statement_path = sample_file('River Oaks', '04_River Oaks_Comparative_Income Statement_October 2025.pdf')
+    balance_sheet_path = sample_file('River Oaks', '03_River Oaks_Balance Sheet_October 2025.pdf')
     for filepath in [cash_forecast_path, income_statement_path, balance_sheet_path]:
-        if not os.path.exists(filepath):
-            logger.error(f"FILE NOT FOUND: {filepath}")
-            return
         logger.info(f"✓ File found: {filepath}")
-    
-    # Get OpenAI API key
-    from dotenv import load_dotenv
-    load_dotenv()
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    
-    if not openai_api_key:
+
+    if not os.getenv('OPENAI_API_KEY'):
         logger.warning("No OpenAI API key found - economic analysis will be skipped")
-    
-    # Initialize processor
-    logger.info("\nInitializing FileProcessor...")
-    processor = FileProcessor(openai_api_key=openai_api_key)
-    
+
     # Process and analyze
     logger.info("\n" + "="*80)
     logger.info("PROCESSING FILES")
     logger.info("="*80)
-    
+
     result = processor.process_and_analyze(
         cash_forecast_path=cash_forecast_path,
         income_statement_path=income_statement_path,
         balance_sheet_path=balance_sheet_path,
         property_info=property_info
     )
-    
+
     logger.info("\n" + "="*80)
     logger.info("RESULTS")
     logger.info("="*80)
-    
+
     if result.get('success'):
         logger.info("✓ Processing SUCCEEDED")
-        
+
         # Display raw data
         if 'raw_data' in result:
             logger.info("\n--- CASH FORECAST DATA ---")
             cash_data = result['raw_data'].get('cash_forecast', {})
-            for key, value in cash_data.items():
-                logger.info(f"  {key}: {value}")
-            
+            logger.info("%s", _format_data(cash_data))
+
             logger.info("\n--- INCOME STATEMENT DATA ---")
             income_data = result['raw_data'].get('income_statement', {})
-            for key, value in income_data.items():
-                if key != 'status' and key != 'file_path':
-                    logger.info(f"  {key}: {value}")
-            
+            logger.info("%s", _format_data(income_data, skip=('status', 'file_path')))
+
             logger.info("\n--- BALANCE SHEET DATA ---")
             balance_data = result['raw_data'].get('balance_sheet', {})
-            for key, value in balance_data.items():
-                if key != 'status' and key != 'file_path':
-                    logger.info(f"  {key}: {value}")
-        
+            logger.info("%s", _format_data(balance_data, skip=('status', 'file_path')))
+
         # Display recommendation
         if 'recommendation' in result:
             rec = result['recommendation']
@@ -103,10 +88,12 @@ def main():
     else:
         logger.error("✗ Processing FAILED")
         logger.error(f"Error: {result.get('error', 'Unknown error')}")
-    
+
     logger.info("\n" + "="*80)
     logger.info("TEST COMPLETE")
     logger.info("="*80)
+    assert result.get('success'), result.get('error', 'Unknown error')
+
 
 if __name__ == '__main__':
-    main()
+    pytest.main([__file__, '-v', '-s'])
@@ -1,11 +1,15 @@
-import sys
-sys.path.append('.')
-from services.file_processor import FileProcessor
+import pytest
 
-# Test River Oaks
-processor = FileProcessor(openai_api_key='dummy')
-result = processor.parse_cash_forecast('sample_files/River Oaks/155 River Oaks Cash Forecast - 10.2025.xlsx')
 
-print('=== RIVER OAKS PARSE RESULT ===')
-for key, value in result.items():
-    print(f'{key}: {value}')
+def test_river_oaks(processor, sample_file):
+    # Test River Oaks
+    result = processor.parse_cash_forecast(sample_file('River Oaks', '155 River Oaks Cash Forecast - 10.2025.xlsx'))
+
+    print('=== RIVER OAKS PARSE RESULT ===')
+    for key, value in result.items():
+        print(f'{key}: {value}')
+    assert result['status'] == 'success', result.get('error')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
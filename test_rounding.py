@@ -1,26 +1,35 @@
 """
 Test rounding to nearest $10,000
 """
+import pytest
 from services.recommendation_engine import RecommendationEngine
 
-engine = RecommendationEngine()
-
-# Test cases
+# Test cases: (amount, expected)
 test_amounts = [
-    180234,   # Should round to 190000
-    150000,   # Should stay 150000
-    145678,   # Should round to 150000
-    101,      # Should round to 10000
-    195999,   # Should round to 200000
-    0,        # Should stay 0
+    (180234, 190000),   # Should round to 190000
+    (150000, 150000),   # Should stay 150000
+    (145678, 150000),   # Should round to 150000
+    (101, 10000),       # Should round to 10000
+    (195999, 200000),   # Should round to 200000
+    (0, 0),             # Should stay 0
 ]
 
-print("Testing rounding to nearest $10,000:")
-print("="*50)
 
-for amount in test_amounts:
-    rounded = engine._round_to_nearest_10k(amount)
-    print(f"${amount:>10,} → ${rounded:>10,}")
+def test_rounding():
+    engine = RecommendationEngine()
+
+    print("Testing rounding to nearest $10,000:")
+    print("="*50)
+
+    rounded_amounts = [engine._round_to_nearest_10k(amount) for amount, _ in test_amounts]
+    for (amount, _), rounded in zip(test_amounts, rounded_amounts):
+        print(f"${amount:>10,} → ${rounded:>10,}")
+
+    assert rounded_amounts == [expected for _, expected in test_amounts]
+
+    print("\n" + "="*50)
+    print("✓ All amounts rounded UP to nearest $10,000")
+
 
-print("\n" + "="*50)
-print("✓ All amounts rounded UP to nearest $10,000")
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
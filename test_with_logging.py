@@ -1,16 +1,23 @@
-import pandas as pd
-import sys
-sys.path.append('.')
-
-# Enable detailed logging
+"""
+Parse the Rittenhouse cash forecast with DEBUG logging and print the full result
+"""
+import os
 import logging
-logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
+import pytest
+
+# Set VERBOSE=1 to see the parser's debug messages
+logging.basicConfig(level=logging.DEBUG if os.getenv('VERBOSE') else logging.INFO,
+                    format='%(levelname)s: %(message)s')
+
+
+def test_with_logging(processor, sample_file):
+    result = processor.parse_cash_forecast(sample_file('Rittenhouse Station', '550 Rittenhouse Cash Forecast - 09.2025.xlsx'))
 
-from services.file_processor import FileProcessor
+    print('\n=== FINAL RESULT ===')
+    for key, value in result.items():
+        print(f'{key}: {value}')
+    assert result['status'] == 'success', result.get('error', 'Unknown error')
 
-processor = FileProcessor(openai_api_key='dummy')
-result = processor.parse_cash_forecast('sample_files/Rittenhouse Station/550 Rittenhouse Cash Forecast - 09.2025.xlsx')
 
-print('\n=== FINAL RESULT ===')
-for key, value in result.items():
-    print(f'{key}: {value}')
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -1,10 +1,15 @@
 """
 Test using the EXACT working connection code format
 """
-import pyodbc
 import os
+import pytest
 from dotenv import load_dotenv
 
+pyodbc = pytest.importorskip('pyodbc', exc_type=ImportError)
+
+# Real database connection: skip with pytest -m "not slow"
+pytestmark = [pytest.mark.slow, pytest.mark.integration]
+
 load_dotenv()
 
 # Use the SAME environment variable names as our app
@@ -13,31 +18,39 @@ database = os.getenv('DATABASE_NAME')
 username = os.getenv('DATABASE_USER')
 password = os.getenv('DATABASE_PASSWORD')
 
-print(f"Server: {server}")
-print(f"Database: {database}")
-print(f"Username: {username}")
-print(f"Password: {'*' * len(password)}")
-print("-" * 60)
-
-# Use the EXACT connection string format from the working code
-driver = 'SQL Server'
-conn_str = f"DRIVER={{{driver}}};SERVER={server},1433;DATABASE={database};UID={username};PWD={password};Encrypt=no;TrustServerCertificate=yes;"
-
-print(f"Connection string: {conn_str.replace(password, '***')}")
-print("Connecting...")
-
-try:
-    conn = pyodbc.connect(conn_str, timeout=10)
-    print("✓ Connected successfully!")
-    
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM PROPERTY_0")
-    count = cursor.fetchone()[0]
-    print(f"✓ Found {count} properties")
-    
-    cursor.close()
-    conn.close()
-    print("✓✓✓ SUCCESS! ✓✓✓")
-    
-except Exception as e:
-    print(f"✗ Error: {e}")
+
+def test_working_format_connects():
+    print(f"Server: {server}")
+    print(f"Database: {database}")
+    print(f"Username: {username}")
+    print(f"Password: {'*' * len(password)}")
+    print("-" * 60)
+
+    # Use the EXACT connection string format from the working code
+    driver = 'SQL Server'
+    conn_str = f"DRIVER={{{driver}}};SERVER={server},1433;DATABASE={database};UID={username};PWD={password};Encrypt=no;TrustServerCertificate=yes;"
+
+    print(f"Connection string: {conn_str.replace(password, '***')}")
+    print("Connecting...")
+
+    try:
+        conn = pyodbc.connect(conn_str, timeout=5)
+        conn.timeout = 30
+        print("✓ Connected successfully!")
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM PROPERTY_0")
+        count = cursor.fetchone()[0]
+        print(f"✓ Found {count} properties")
+        
+        cursor.close()
+        conn.close()
+        print("✓✓✓ SUCCESS! ✓✓✓")
+        
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        pytest.fail(f"Connection failed: {e}")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the test suite
+"""
+import sys
+import os
+import pytest
+
+# Add parent directory to path for imports (once, for every test module)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    """The app module, imported and configured for testing once per run"""
+    import app
+    app.app.config['TESTING'] = True
+    app.app.config['WTF_CSRF_ENABLED'] = False  # Disable CSRF for testing
+    return app
+
+
+@pytest.fixture
+def client(app_module):
+    """Create a test client for the Flask app (per test, so no cookies or session state carry over)"""
+    with app_module.app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def authed_client(client):
+    """A test client whose session already holds a signed-in user"""
+    with client.session_transaction() as sess:
+        sess['authenticated'] = True
+        sess['user'] = {'name': 'Test User', 'email': 'test@test.com'}
+    return client
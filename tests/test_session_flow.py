@@ -2,24 +2,9 @@
 Session flow tests - Test session management lifecycle.
 These tests verify session start, end, restart, and state management.
 """
-import sys
-import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the Flask app"""
-    import app
-    app.app.config['TESTING'] = True
-    app.app.config['WTF_CSRF_ENABLED'] = False
-    with app.app.test_client() as client:
-        yield client
-
 
 class TestSessionState:
     """Test session state management"""
@@ -76,34 +61,35 @@ class TestSessionLoggingFlags:
         # (Can't fully test without mocking Azure auth, but structure is tested)
 
 
+@pytest.fixture(scope='module')
+def session_check_response(app_module):
+    """One /session/check response from a fresh client, shared by the read-only checks below"""
+    with app_module.app.test_client() as client:
+        return client.get('/session/check')
+
+
 class TestSessionCheck:
     """Test session validity checking"""
     
-    def test_session_check_no_tokens(self, client):
+    def test_session_check_no_tokens(self, session_check_response):
         """Test session check returns invalid when no tokens"""
-        response = client.get('/session/check')
-        assert response.status_code == 200
-        data = response.get_json()
+        assert session_check_response.status_code == 200
+        data = session_check_response.get_json()
         assert 'valid' in data
         # Should be invalid without tokens
         assert data['valid'] == False
     
-    def test_session_check_returns_json(self, client):
+    def test_session_check_returns_json(self, session_check_response):
         """Test that session check returns proper JSON"""
-        response = client.get('/session/check')
-        assert response.content_type == 'application/json'
+        assert session_check_response.content_type == 'application/json'
 
 
 class TestUserInfoPreservation:
     """Test user info preservation during session transitions"""
     
-    def test_user_info_preserved_on_session_end(self, client):
+    def test_user_info_preserved_on_session_end(self, authed_client):
         """Test that user info is preserved when session ends"""
-        # Set up authenticated session
-        with client.session_transaction() as sess:
-            sess['authenticated'] = True
-            sess['user'] = {'name': 'Test User', 'email': 'test@test.com'}
-        
+        # authed_client starts with an authenticated session
         # The session/end endpoint should preserve user_info
         # (This would require mocking SharePoint logging, but structure exists)
     
@@ -121,17 +107,15 @@ class TestUserInfoPreservation:
 class TestEnvironmentFunctions:
     """Test environment detection functions"""
     
-    def test_is_local_environment(self):
+    def test_is_local_environment(self, app_module):
         """Test local environment detection"""
-        import app
-        result = app.is_local_environment()
+        result = app_module.is_local_environment()
         # Should return a boolean
         assert isinstance(result, bool)
     
-    def test_get_application_name_returns_correct_format(self):
+    def test_get_application_name_returns_correct_format(self, app_module):
         """Test application name format"""
-        import app
-        name = app.get_application_name()
+        name = app_module.get_application_name()
         
         # Should contain "CashForecastAnalyzer"
         assert 'CashForecastAnalyzer' in name
@@ -139,11 +123,10 @@ class TestEnvironmentFunctions:
         # Should be either local or production variant
         assert name in ['CashForecastAnalyzer', 'CashForecastAnalyzerLocal']
     
-    def test_application_name_matches_environment(self):
+    def test_application_name_matches_environment(self, app_module):
         """Test that application name matches detected environment"""
-        import app
-        is_local = app.is_local_environment()
-        app_name = app.get_application_name()
+        is_local = app_module.is_local_environment()
+        app_name = app_module.get_application_name()
         
         # Application name is always 'CashForecastAnalyzer' regardless of environment
         assert app_name == 'CashForecastAnalyzer'
@@ -0,0 +1,61 @@
+"""
+SharePoint data source tests - Property lookups against a stubbed list query.
+These tests verify single and bulk lookups agree without calling SharePoint.
+"""
+import pytest
+
+from services import sharepoint_data_source
+
+
+RIVER_OAKS_ROW = {
+    'ENTITY_NUMBER': 155,
+    'PROPERTY_NAME': 'River Oaks',
+    'ADDRESS_1': '1 River Oaks Dr',
+    'ADDRESS_CITY': 'Houston',
+    'ADDRESS_STATE': 'TX',
+    'ADDRESS_ZIP': '77001',
+    'SCHOOL_NAME': 'University of Houston'
+}
+
+
+@pytest.fixture
+def data_source(monkeypatch):
+    """A data source whose list query always returns the River Oaks row, with an empty property cache"""
+    monkeypatch.setenv('SHAREPOINT_SITE_URL', 'https://example.sharepoint.com/sites/test')
+    monkeypatch.setattr(sharepoint_data_source, '_property_cache', {})
+    source = sharepoint_data_source.SharePointDataSource(access_token='test-token')
+    source.filters = []
+    
+    def get_property_items(filter_expr, top):
+        source.filters.append(filter_expr)
+        return [RIVER_OAKS_ROW]
+    
+    monkeypatch.setattr(source, '_get_property_items', get_property_items)
+    return source
+
+
+class TestZeroPaddedEntityNumber:
+    """Test that zero-padded ENTITY_NUMBERs resolve the same way in single and bulk lookups"""
+    
+    def test_single_and_bulk_lookups_agree(self, data_source):
+        """Test single and bulk lookups return the same property for '0155'"""
+        single = data_source.get_property_info('0155')
+        sharepoint_data_source._property_cache.clear()
+        bulk = data_source.get_properties_bulk(['0155'])
+        
+        assert single is not None
+        assert single['property_name'] == 'River Oaks'
+        assert bulk == {'0155': single}
+        assert data_source.filters == ['ENTITY_NUMBER eq 155', 'ENTITY_NUMBER eq 155']
+    
+    def test_lookups_share_cache_entry(self, data_source):
+        """Test a bulk lookup of '0155' is served from the entry a single lookup of '155' cached"""
+        data_source.get_property_info('155')
+        bulk = data_source.get_properties_bulk(['0155'])
+        
+        assert bulk['0155']['entity_number'] == 155
+        assert len(data_source.filters) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -3,13 +3,10 @@ Smoke tests - Basic sanity checks that the application can start and core functi
 These tests should run quickly and catch fundamental issues like import errors, 
 missing dependencies, or configuration problems.
 """
-import sys
 import os
+import importlib.util
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 
 class TestApplicationStartup:
     """Test that the application can start without errors"""
@@ -22,21 +19,19 @@ class TestApplicationStartup:
         except Exception as e:
             pytest.fail(f"Failed to import app: {str(e)}")
     
-    def test_flask_app_exists(self):
+    def test_flask_app_exists(self, app_module):
         """Test that Flask app object is created"""
-        import app
-        assert hasattr(app, 'app')
-        assert app.app is not None
+        assert hasattr(app_module, 'app')
+        assert app_module.app is not None
         from flask import Flask
-        assert isinstance(app.app, Flask)
+        assert isinstance(app_module.app, Flask)
     
-    def test_required_config_exists(self):
+    def test_required_config_exists(self, app_module):
         """Test that required configuration values are present"""
-        import app
         required_configs = ['SECRET_KEY', 'UPLOAD_FOLDER']
         for config in required_configs:
-            assert config in app.app.config, f"Missing required config: {config}"
-            assert app.app.config[config] is not None, f"Config {config} is None"
+            assert config in app_module.app.config, f"Missing required config: {config}"
+            assert app_module.app.config[config] is not None, f"Config {config} is None"
 
 
 class TestCoreModules:
@@ -78,19 +73,14 @@ class TestEnvironmentConfiguration:
             'msal'
         ]
         
-        missing_packages = []
-        for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
-                missing_packages.append(package)
+        # Look the packages up without importing them (app import tests cover the import itself)
+        missing_packages = [package for package in required_packages if importlib.util.find_spec(package) is None]
         
         assert len(missing_packages) == 0, f"Missing required packages: {', '.join(missing_packages)}"
     
-    def test_upload_folder_exists(self):
+    def test_upload_folder_exists(self, app_module):
         """Test that upload folder exists or can be created"""
-        import app
-        upload_folder = app.app.config.get('UPLOAD_FOLDER')
+        upload_folder = app_module.app.config.get('UPLOAD_FOLDER')
         assert upload_folder is not None
         
         # Check if it exists or create it
@@ -107,12 +97,10 @@ class TestEnvironmentConfiguration:
 class TestRouteRegistration:
     """Test that routes are properly registered"""
     
-    def test_main_routes_exist(self):
+    def test_main_routes_exist(self, app_module):
         """Test that expected routes are registered"""
-        import app
-        
         # Get all registered routes
-        routes = [str(rule) for rule in app.app.url_map.iter_rules()]
+        routes = {str(rule) for rule in app_module.app.url_map.iter_rules()}
         
         expected_routes = [
             '/',
@@ -124,53 +112,45 @@ class TestRouteRegistration:
             '/api/analyze'
         ]
         
-        missing_routes = []
-        for route in expected_routes:
-            if route not in routes:
-                missing_routes.append(route)
+        missing_routes = [route for route in expected_routes if route not in routes]
         
         assert len(missing_routes) == 0, f"Missing expected routes: {', '.join(missing_routes)}"
     
-    def test_static_files_configured(self):
+    def test_static_files_configured(self, app_module):
         """Test that static files are configured"""
-        import app
-        assert app.app.static_folder is not None
-        assert os.path.exists(app.app.static_folder)
+        assert app_module.app.static_folder is not None
+        assert os.path.exists(app_module.app.static_folder)
 
 
 class TestUtilityFunctions:
     """Test utility functions work correctly"""
     
-    def test_environment_detection(self):
+    def test_environment_detection(self, app_module):
         """Test that environment detection works"""
-        import app
-        result = app.is_local_environment()
+        result = app_module.is_local_environment()
         assert isinstance(result, bool)
     
-    def test_application_name_generation(self):
+    def test_application_name_generation(self, app_module):
         """Test that application name is generated correctly"""
-        import app
-        name = app.get_application_name()
+        name = app_module.get_application_name()
         assert isinstance(name, str)
         assert len(name) > 0
         assert name == 'CashForecastAnalyzer'
     
-    def test_allowed_file_validation(self):
+    def test_allowed_file_validation(self, app_module):
         """Test file extension validation"""
-        import app
-        
         # Test valid extensions (xlsx, xls, csv, txt, pdf)
-        assert app.allowed_file('test.xlsx') == True
-        assert app.allowed_file('test.xls') == True
-        assert app.allowed_file('test.pdf') == True
-        assert app.allowed_file('test.csv') == True
-        assert app.allowed_file('test.txt') == True
+        assert app_module.allowed_file('test.xlsx') == True
+        assert app_module.allowed_file('test.xls') == True
+        assert app_module.allowed_file('test.pdf') == True
+        assert app_module.allowed_file('test.csv') == True
+        assert app_module.allowed_file('test.txt') == True
         
         # Test invalid extensions
-        assert app.allowed_file('test.docx') == False
-        assert app.allowed_file('test.pptx') == False
-        assert app.allowed_file('test.exe') == False
-        assert app.allowed_file('test') == False
+        assert app_module.allowed_file('test.docx') == False
+        assert app_module.allowed_file('test.pptx') == False
+        assert app_module.allowed_file('test.exe') == False
+        assert app_module.allowed_file('test') == False
 
 
 if __name__ == '__main__':
@@ -1,40 +1,44 @@
 """
 Verify the correct row indices based on Excel row numbers
 """
-import pandas as pd
+from openpyxl import load_workbook
 
 file_path = r'sample_files\550 Rittenhouse Cash Forecast - 09.2025.xlsx'
 
-# Load the file
-df = pd.read_excel(file_path, sheet_name='Cash Forecast', header=None)
+# Stream only the rows we print (read-only mode, cached values instead of formulas)
+wb = load_workbook(file_path, read_only=True, data_only=True)
+try:
+    ws = wb['Cash Forecast']
+    occupancy_row, status_row, month_row = ws.iter_rows(min_row=6, max_row=8, min_col=1, max_col=15, values_only=True)
+    distributions_row, fcf_row = ws.iter_rows(min_row=48, max_row=49, min_col=1, max_col=12, values_only=True)
+finally:
+    wb.close()
 
 print("Checking key rows (Excel row number → Python index):")
 print()
 
 # Excel Row 6 → Index 5 (Occupancy percentages)
 print("Excel Row 6 (Index 5) - Actual Occupancy:")
-print(df.iloc[5, 0:15].tolist())
+print(', '.join(map(str, occupancy_row)))
 print()
 
 # Excel Row 7 → Index 6 (Actual vs Budget status)
 print("Excel Row 7 (Index 6) - Status (Actual/Budget):")
-print(df.iloc[6, 0:15].tolist())
+print(', '.join(map(str, status_row)))
 print()
 
 # Excel Row 8 → Index 7 (Month names)
 print("Excel Row 8 (Index 7) - Month names:")
-print(df.iloc[7, 0:15].tolist())
+print(', '.join(map(str, month_row)))
 print()
 
 # Excel Row 48 → Index 47 (Distributions/Collections)
 print("Excel Row 48 (Index 47) - Distributions/Collections:")
-row_47_label = df.iloc[47, 0]
-print(f"Label: {row_47_label}")
-print(f"First 10 values: {df.iloc[47, 2:12].tolist()}")
+print(f"Label: {distributions_row[0]}")
+print(f"First 10 values: {', '.join(map(str, distributions_row[2:12]))}")
 print()
 
 # Excel Row 49 → Index 48 (Free Cash Flow)
 print("Excel Row 49 (Index 48) - Free Cash Flow:")
-row_48_label = df.iloc[48, 0]
-print(f"Label: {row_48_label}")
-print(f"First 10 values: {df.iloc[48, 2:12].tolist()}")
+print(f"Label: {fcf_row[0]}")
+print(f"First 10 values: {', '.join(map(str, fcf_row[2:12]))}")